@@ -1,6 +1,13 @@
-"""Sigfox API client library."""
+"""Sigfox API client library.
+
+The clients (and httpx behind them) are imported on first attribute access
+(PEP 562), so that importing ``sigfox.exceptions`` or ``sigfox.models`` does
+not pay for the HTTP stack.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .client import SigfoxClient
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -10,11 +17,25 @@ from .exceptions import (
     SigfoxError,
     ValidationError,
 )
-from .sigfox import Sigfox
+
+if TYPE_CHECKING:
+    from .async_client import AsyncSigfoxClient
+    from .client import SigfoxClient
+    from .sigfox import AsyncSigfox, Sigfox
+
+# Exported name -> submodule defining it
+_EXPORTS: dict[str, str] = {
+    "Sigfox": "sigfox",
+    "SigfoxClient": "client",
+    "AsyncSigfox": "sigfox",
+    "AsyncSigfoxClient": "async_client",
+}
 
 __all__ = [
     "Sigfox",
     "SigfoxClient",
+    "AsyncSigfox",
+    "AsyncSigfoxClient",
     "SigfoxError",
     "AuthenticationError",
     "AuthorizationError",
@@ -23,3 +44,17 @@ __all__ = [
     "NetworkError",
     "ValidationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
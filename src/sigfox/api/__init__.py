@@ -1,14 +1,14 @@
 """Sigfox API high-level interfaces."""
 
-from .api_users import ApiUsersAPI
-from .base_stations import BaseStationsAPI
-from .contract_infos import ContractInfosAPI
-from .coverages import CoveragesAPI
-from .device_types import DeviceTypesAPI
-from .devices import DevicesAPI
-from .groups import GroupsAPI
-from .operators import OperatorsAPI
-from .profiles import ProfilesAPI
-from .users import UsersAPI
+from .api_users import ApiUsersAPI, AsyncApiUsersAPI
+from .base_stations import AsyncBaseStationsAPI, BaseStationsAPI
+from .contract_infos import AsyncContractInfosAPI, ContractInfosAPI
+from .coverages import AsyncCoveragesAPI, CoveragesAPI
+from .device_types import AsyncDeviceTypesAPI, DeviceTypesAPI
+from .devices import AsyncDevicesAPI, DevicesAPI
+from .groups import AsyncGroupsAPI, GroupsAPI
+from .operators import AsyncOperatorsAPI, OperatorsAPI
+from .profiles import AsyncProfilesAPI, ProfilesAPI
+from .users import AsyncUsersAPI, UsersAPI
 
-__all__ = ["ApiUsersAPI", "BaseStationsAPI", "ContractInfosAPI", "CoveragesAPI", "DevicesAPI", "DeviceTypesAPI", "GroupsAPI", "OperatorsAPI", "ProfilesAPI", "UsersAPI"]
+__all__ = ["ApiUsersAPI", "BaseStationsAPI", "ContractInfosAPI", "CoveragesAPI", "DevicesAPI", "DeviceTypesAPI", "GroupsAPI", "OperatorsAPI", "ProfilesAPI", "UsersAPI", "AsyncApiUsersAPI", "AsyncBaseStationsAPI", "AsyncContractInfosAPI", "AsyncCoveragesAPI", "AsyncDevicesAPI", "AsyncDeviceTypesAPI", "AsyncGroupsAPI", "AsyncOperatorsAPI", "AsyncProfilesAPI", "AsyncUsersAPI"]
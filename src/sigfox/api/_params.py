@@ -0,0 +1,67 @@
+"""Query parameter and request body building shared by the API classes."""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+# Serialization options for create/update request bodies
+DUMP_KWARGS: dict[str, Any] = {"by_alias": True, "exclude_none": True}
+
+# (argument name, query parameter name, optional transform)
+ParamSpec = tuple[tuple[str, str, Callable[[Any], Any] | None], ...]
+
+
+def join_csv(values: list[Any]) -> str:
+    """Join a list of filter values into a comma-separated string.
+
+    Duplicate values are dropped (first occurrence wins). Joins are memoized
+    since paginated calls usually repeat the same filters.
+    """
+    return _join_csv(tuple(values))
+
+
+@lru_cache(maxsize=64)
+def _join_csv(values: tuple[Any, ...]) -> str:
+    unique = dict.fromkeys(values)
+    try:
+        # IDs are already strings; only non-str values (e.g. group types) need map(str)
+        return ",".join(unique)
+    except TypeError:
+        return ",".join(map(str, unique))
+
+
+def flag(_: Any) -> str:
+    """Encode an enabled boolean flag the way the API expects it."""
+    return "true"
+
+
+def dump_body(data: BaseModel) -> bytes:
+    """Serialize a request model to a JSON request body.
+
+    Calls the model's compiled pydantic-core serializer directly, writing
+    JSON bytes without the model_dump_json wrapper or an intermediate str.
+    """
+    return data.__pydantic_serializer__.to_json(data, **DUMP_KWARGS)
+
+
+def build_params(values: dict[str, Any], spec: ParamSpec) -> dict[str, Any]:
+    """Build a query parameter dict from method arguments.
+
+    Arguments that are None, False, or empty strings/sequences are omitted.
+
+    Args:
+        values: Method arguments (typically ``locals()``)
+        spec: Tuple of (argument name, query parameter name, transform) entries
+
+    Returns:
+        Query parameters keyed by API parameter name
+    """
+    return {
+        api_name: xform(v) if xform else v
+        for name, api_name, xform in spec
+        if (v := values.get(name)) is not None
+        and v is not False
+        and not (isinstance(v, (str, list, tuple)) and not v)
+    }
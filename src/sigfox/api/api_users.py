@@ -2,10 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import ApiUser, ApiUserCreate, ApiUserUpdate
+from ._params import ParamSpec, build_params, dump_body, flag, join_csv
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("profile_id", "profileId", None),
+    ("group_ids", "groupIds", join_csv),
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
+_GET_PARAMS: ParamSpec = (
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
 
 
 class ApiUsersAPI:
@@ -41,23 +60,39 @@ class ApiUsersAPI:
         Returns:
             List of ApiUser objects
         """
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if profile_id:
-            params["profileId"] = profile_id
-        if group_ids:
-            params["groupIds"] = ",".join(group_ids)
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
-
-        response = self._client.get("/api-users/", params=params)
-        users_data = response.get("data", [])
-        return [ApiUser.model_validate(u) for u in users_data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/api-users/", ApiUser, params=params)
+
+    def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        profile_id: str | None = None,
+        group_ids: list[str] | None = None,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> Iterator[ApiUser]:
+        """Iterate over all API users, following pagination.
+
+        Pages are fetched lazily, so stopping early skips the remaining pages.
+
+        Args:
+            limit: Page size
+            offset: Number of API users to skip before the first page
+            profile_id: Filter by profile ID
+            group_ids: Filter by group IDs
+            fields: Additional fields to return
+            authorizations: If true, return user actions/resources
+
+        Yields:
+            ApiUser objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = ApiUser.__pydantic_validator__.validate_python
+        for item in self._client.iter_paginated("/api-users/", params=params):
+            yield validate(item)
 
     def get(
         self,
@@ -75,16 +110,11 @@ class ApiUsersAPI:
         Returns:
             ApiUser object
         """
-        params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
+        params = build_params(locals(), _GET_PARAMS)
 
-        response = self._client.get(
-            f"/api-users/{api_user_id}", params=params or None
+        return self._client.get_model(
+            f"/api-users/{api_user_id}", ApiUser, params=params or None, cache=True
         )
-        return ApiUser.model_validate(response)
 
     def create(self, data: ApiUserCreate) -> dict[str, Any]:
         """Create a new API user.
@@ -95,7 +125,7 @@ class ApiUsersAPI:
         Returns:
             Dict with 'id' of the created API user
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         response = self._client.post("/api-users/", data=body)
         return response
 
@@ -106,7 +136,7 @@ class ApiUsersAPI:
             api_user_id: API user ID
             data: API user update data
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         self._client.put(f"/api-users/{api_user_id}", data=body)
 
     def delete(self, api_user_id: str) -> None:
@@ -136,6 +166,39 @@ class ApiUsersAPI:
         """
         self._client.delete(f"/api-users/{api_user_id}/profiles/{profile_id}")
 
+    def add_profiles_bulk(
+        self, profiles_by_user: Mapping[str, list[str]], max_workers: int = 16
+    ) -> None:
+        """Associate profiles to several API users concurrently.
+
+        Args:
+            profiles_by_user: Mapping of API user ID to profile IDs to associate
+            max_workers: Maximum number of requests in flight
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(self.add_profiles, profiles_by_user, profiles_by_user.values()))
+
+    def remove_profiles_bulk(
+        self, pairs: Iterable[tuple[str, str]], max_workers: int = 16
+    ) -> dict[tuple[str, str], Exception]:
+        """Remove several profile associations concurrently.
+
+        Every pair is attempted; a failed removal does not stop the others.
+
+        Args:
+            pairs: (API user ID, profile ID) associations to remove
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Exception raised for each pair that could not be removed (empty
+            if all succeeded)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pair: pool.submit(self.remove_profile, *pair) for pair in pairs}
+        return {
+            pair: exc for pair, future in futures.items() if (exc := future.exception())
+        }
+
     def renew_credential(self, api_user_id: str) -> dict[str, Any]:
         """Generate a new password for an API user.
 
@@ -149,3 +212,160 @@ class ApiUsersAPI:
             f"/api-users/{api_user_id}/renew-credential"
         )
         return response
+
+
+class AsyncApiUsersAPI:
+    """Asynchronous high-level API for Sigfox API users."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        """Initialize asynchronous API Users API.
+
+        Args:
+            client: Low-level asynchronous Sigfox API client
+        """
+        self._client = client
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        profile_id: str | None = None,
+        group_ids: list[str] | None = None,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> list[ApiUser]:
+        """List API users.
+
+        Args:
+            limit: Maximum number of API users to return
+            offset: Number of API users to skip
+            profile_id: Filter by profile ID
+            group_ids: Filter by group IDs
+            fields: Additional fields to return
+            authorizations: If true, return user actions/resources
+
+        Returns:
+            List of ApiUser objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list("/api-users/", ApiUser, params=params)
+
+    async def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        profile_id: str | None = None,
+        group_ids: list[str] | None = None,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> AsyncIterator[ApiUser]:
+        """Iterate over all API users, following pagination.
+
+        The next page is requested while the current one is being consumed.
+
+        Args:
+            limit: Page size
+            offset: Number of API users to skip before the first page
+            profile_id: Filter by profile ID
+            group_ids: Filter by group IDs
+            fields: Additional fields to return
+            authorizations: If true, return user actions/resources
+
+        Yields:
+            ApiUser objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = ApiUser.__pydantic_validator__.validate_python
+        async for item in self._client.iter_paginated("/api-users/", params=params):
+            yield validate(item)
+
+    async def get(
+        self,
+        api_user_id: str,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> ApiUser:
+        """Get API user details.
+
+        Args:
+            api_user_id: API user ID
+            fields: Additional fields to return
+            authorizations: If true, return user actions/resources
+
+        Returns:
+            ApiUser object
+        """
+        params = build_params(locals(), _GET_PARAMS)
+
+        return await self._client.get_model(
+            f"/api-users/{api_user_id}", ApiUser, params=params or None
+        )
+
+    async def add_profiles(self, api_user_id: str, profile_ids: list[str]) -> None:
+        """Associate profiles to an API user.
+
+        Args:
+            api_user_id: API user ID
+            profile_ids: List of profile IDs to associate
+        """
+        body = {"profileIds": profile_ids}
+        await self._client.put(f"/api-users/{api_user_id}/profiles", data=body)
+
+    async def remove_profile(self, api_user_id: str, profile_id: str) -> None:
+        """Remove a profile association from an API user.
+
+        Args:
+            api_user_id: API user ID
+            profile_id: Profile ID to remove
+        """
+        await self._client.delete(f"/api-users/{api_user_id}/profiles/{profile_id}")
+
+    async def add_profiles_bulk(
+        self, profiles_by_user: Mapping[str, list[str]], concurrency: int = 16
+    ) -> None:
+        """Associate profiles to several API users concurrently.
+
+        Args:
+            profiles_by_user: Mapping of API user ID to profile IDs to associate
+            concurrency: Maximum number of requests in flight
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(api_user_id: str, profile_ids: list[str]) -> None:
+            async with semaphore:
+                await self.add_profiles(api_user_id, profile_ids)
+
+        await asyncio.gather(*(add(u, p) for u, p in profiles_by_user.items()))
+
+    async def remove_profiles_bulk(
+        self, pairs: Iterable[tuple[str, str]], concurrency: int = 16
+    ) -> dict[tuple[str, str], Exception]:
+        """Remove several profile associations concurrently.
+
+        Every pair is attempted; a failed removal does not stop the others.
+
+        Args:
+            pairs: (API user ID, profile ID) associations to remove
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Exception raised for each pair that could not be removed (empty
+            if all succeeded)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def remove(api_user_id: str, profile_id: str) -> None:
+            async with semaphore:
+                await self.remove_profile(api_user_id, profile_id)
+
+        pairs = list(pairs)
+        results = await asyncio.gather(
+            *(remove(u, p) for u, p in pairs), return_exceptions=True
+        )
+        return {
+            pair: result
+            for pair, result in zip(pairs, results)
+            if isinstance(result, Exception)
+        }
@@ -2,10 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterator
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
-from ..models import Message
+from ..models import BaseStation, BaseStationSummary, Message
+from ._params import ParamSpec, build_params
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("name", "name", None),
+    ("fields", "fields", None),
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+)
+_LIST_MESSAGES_PARAMS: ParamSpec = (
+    ("fields", "fields", None),
+    ("since", "since", None),
+    ("before", "before", None),
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+)
 
 
 class BaseStationsAPI:
@@ -19,6 +36,45 @@ class BaseStationsAPI:
         """
         self._client = client
 
+    def list(
+        self,
+        name: str | None = None,
+        fields: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        full: bool = False,
+    ) -> list[BaseStationSummary] | list[BaseStation]:
+        """List base stations.
+
+        Only the summary fields (id, name, state, lat, lng) are validated
+        unless full is set, which keeps large listings cheap to parse.
+
+        Args:
+            name: Filter by name
+            fields: Additional fields to return
+            limit: Maximum number of base stations to return
+            offset: Number of base stations to skip
+            full: Return complete BaseStation objects instead of summaries
+
+        Returns:
+            List of BaseStationSummary objects, or BaseStation objects if full
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        model = BaseStation if full else BaseStationSummary
+        return self._client.get_list("/base-stations/", model, params=params)
+
+    def get(self, station_id: str) -> BaseStation:
+        """Get base station details.
+
+        Args:
+            station_id: Base station identifier (hexadecimal format)
+
+        Returns:
+            BaseStation object
+        """
+        return self._client.get_model(f"/base-stations/{station_id}", BaseStation)
+
     def list_messages(
         self,
         station_id: str,
@@ -46,20 +102,126 @@ class BaseStationsAPI:
         Returns:
             List of Message objects received by the base station
         """
-        params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = fields
-        if since is not None:
-            params["since"] = since
-        if before is not None:
-            params["before"] = before
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
+        params = build_params(locals(), _LIST_MESSAGES_PARAMS)
+
+        return self._client.get_list(
+            f"/base-stations/{station_id}/messages", Message, params=params or None
+        )
+
+    def iter_messages(
+        self,
+        station_id: str,
+        fields: str | None = None,
+        since: int | None = None,
+        before: int | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> Iterator[Message]:
+        """Iterate over messages received by a base station.
+
+        Messages are validated one at a time as they are consumed, so callers
+        that stop early do not pay for validating the rest of the response.
+
+        Args:
+            station_id: Base station identifier (hexadecimal format)
+            fields: Additional fields to return (see list_messages)
+            since: Starting timestamp (milliseconds since Unix epoch)
+            before: Ending timestamp (milliseconds since Unix epoch)
+            limit: Maximum number of messages to return (default: 100)
+            offset: Number of messages to skip
+
+        Yields:
+            Message objects received by the base station
+        """
+        params = build_params(locals(), _LIST_MESSAGES_PARAMS)
 
         response = self._client.get(
             f"/base-stations/{station_id}/messages", params=params or None
         )
-        messages_data = response.get("data", [])
-        return [Message.model_validate(m) for m in messages_data]
+        validate = Message.__pydantic_validator__.validate_python
+        for m in response.get("data", []):
+            yield validate(m)
+
+
+class AsyncBaseStationsAPI:
+    """Asynchronous high-level API for Sigfox base stations."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        """Initialize asynchronous Base Stations API.
+
+        Args:
+            client: Low-level asynchronous Sigfox API client
+        """
+        self._client = client
+
+    async def list(
+        self,
+        name: str | None = None,
+        fields: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        full: bool = False,
+    ) -> list[BaseStationSummary] | list[BaseStation]:
+        """List base stations.
+
+        Only the summary fields (id, name, state, lat, lng) are validated
+        unless full is set, which keeps large listings cheap to parse.
+
+        Args:
+            name: Filter by name
+            fields: Additional fields to return
+            limit: Maximum number of base stations to return
+            offset: Number of base stations to skip
+            full: Return complete BaseStation objects instead of summaries
+
+        Returns:
+            List of BaseStationSummary objects, or BaseStation objects if full
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        model = BaseStation if full else BaseStationSummary
+        return await self._client.get_list("/base-stations/", model, params=params)
+
+    async def get(self, station_id: str) -> BaseStation:
+        """Get base station details.
+
+        Args:
+            station_id: Base station identifier (hexadecimal format)
+
+        Returns:
+            BaseStation object
+        """
+        return await self._client.get_model(f"/base-stations/{station_id}", BaseStation)
+
+    async def list_messages(
+        self,
+        station_id: str,
+        fields: str | None = None,
+        since: int | None = None,
+        before: int | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[Message]:
+        """Retrieve messages received by a base station.
+
+        Args:
+            station_id: Base station identifier (hexadecimal format)
+            fields: Additional fields to return. Options:
+                - oob
+                - ackRequired
+                - device(name)
+                - rinfos(cbStatus,rep,repetitions,baseStation(name))
+                - downlinkAnswerStatus(baseStation(name))
+            since: Starting timestamp (milliseconds since Unix epoch)
+            before: Ending timestamp (milliseconds since Unix epoch)
+            limit: Maximum number of messages to return (default: 100)
+            offset: Number of messages to skip
+
+        Returns:
+            List of Message objects received by the base station
+        """
+        params = build_params(locals(), _LIST_MESSAGES_PARAMS)
+
+        return await self._client.get_list(
+            f"/base-stations/{station_id}/messages", Message, params=params or None
+        )
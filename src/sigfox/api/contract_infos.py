@@ -2,10 +2,44 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import ContractInfo
+from ._params import ParamSpec, build_params, flag
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("name", "name", None),
+    ("group_id", "groupId", None),
+    ("group_type", "groupType", None),
+    ("deep", "deep", flag),
+    ("up", "up", flag),
+    ("order_ids", "orderIds", None),
+    ("contract_ids", "contractIds", None),
+    ("from_time", "fromTime", None),
+    ("to_time", "toTime", None),
+    ("token_duration", "tokenDuration", None),
+    ("pricing_model", "pricingModel", None),
+    ("subscription_plan", "subscriptionPlan", None),
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+    ("page_id", "pageId", None),
+)
+_GET_PARAMS: ParamSpec = (
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
+_LIST_DEVICES_PARAMS: ParamSpec = (
+    ("device_type_id", "deviceTypeId", None),
+    ("fields", "fields", None),
+    ("limit", "limit", None),
+    ("page_id", "pageId", None),
+)
 
 
 class ContractInfosAPI:
@@ -34,45 +68,35 @@ class ContractInfosAPI:
         authorizations: bool = False,
         page_id: str | None = None,
     ) -> list[ContractInfo]:
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if name:
-            params["name"] = name
-        if group_id:
-            params["groupId"] = group_id
-        if group_type is not None:
-            params["groupType"] = group_type
-        if deep:
-            params["deep"] = "true"
-        if up:
-            params["up"] = "true"
-        if order_ids:
-            params["orderIds"] = order_ids
-        if contract_ids:
-            params["contractIds"] = contract_ids
-        if from_time is not None:
-            params["fromTime"] = from_time
-        if to_time is not None:
-            params["toTime"] = to_time
-        if token_duration is not None:
-            params["tokenDuration"] = token_duration
-        if pricing_model is not None:
-            params["pricingModel"] = pricing_model
-        if subscription_plan is not None:
-            params["subscriptionPlan"] = subscription_plan
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
-        if page_id:
-            params["pageId"] = page_id
-
-        response = self._client.get("/contract-infos/", params=params)
-        data = response.get("data", [])
-        return [ContractInfo.model_validate(c) for c in data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/contract-infos/", ContractInfo, params=params)
+
+    def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        name: str | None = None,
+        group_id: str | None = None,
+        group_type: int | None = None,
+        deep: bool = False,
+        up: bool = False,
+        order_ids: str | None = None,
+        contract_ids: str | None = None,
+        from_time: int | None = None,
+        to_time: int | None = None,
+        token_duration: int | None = None,
+        pricing_model: int | None = None,
+        subscription_plan: int | None = None,
+        fields: str | None = None,
+        authorizations: bool = False,
+        page_id: str | None = None,
+    ) -> Iterator[ContractInfo]:
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = ContractInfo.__pydantic_validator__.validate_python
+        for item in self._client.iter_paginated("/contract-infos/", params=params):
+            yield validate(item)
 
     def get(
         self,
@@ -80,16 +104,11 @@ class ContractInfosAPI:
         fields: str | None = None,
         authorizations: bool = False,
     ) -> ContractInfo:
-        params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
+        params = build_params(locals(), _GET_PARAMS)
 
-        response = self._client.get(
-            f"/contract-infos/{contract_id}", params=params or None
+        return self._client.get_model(
+            f"/contract-infos/{contract_id}", ContractInfo, params=params or None, cache=True
         )
-        return ContractInfo.model_validate(response)
 
     def list_devices(
         self,
@@ -99,17 +118,124 @@ class ContractInfosAPI:
         limit: int | None = None,
         page_id: str | None = None,
     ) -> list[dict[str, Any]]:
-        params: dict[str, Any] = {}
-        if device_type_id:
-            params["deviceTypeId"] = device_type_id
-        if fields:
-            params["fields"] = fields
-        if limit is not None:
-            params["limit"] = limit
-        if page_id:
-            params["pageId"] = page_id
+        params = build_params(locals(), _LIST_DEVICES_PARAMS)
 
         response = self._client.get(
             f"/contract-infos/{contract_id}/devices", params=params or None
         )
         return response.get("data", [])
+
+
+class AsyncContractInfosAPI:
+    """Asynchronous high-level API for Sigfox contract infos."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        """Initialize asynchronous Contract Infos API.
+
+        Args:
+            client: Low-level asynchronous Sigfox API client
+        """
+        self._client = client
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        name: str | None = None,
+        group_id: str | None = None,
+        group_type: int | None = None,
+        deep: bool = False,
+        up: bool = False,
+        order_ids: str | None = None,
+        contract_ids: str | None = None,
+        from_time: int | None = None,
+        to_time: int | None = None,
+        token_duration: int | None = None,
+        pricing_model: int | None = None,
+        subscription_plan: int | None = None,
+        fields: str | None = None,
+        authorizations: bool = False,
+        page_id: str | None = None,
+    ) -> list[ContractInfo]:
+        """List contract infos.
+
+        Args:
+            limit: Maximum number of contracts to return
+            offset: Number of contracts to skip
+            name: Filter by contract name (contains match)
+            group_id: Filter by group ID
+            group_type: Filter by group type (2=BASIC, 9=CHANNEL)
+            deep: Include contracts from child groups
+            up: Include contracts from ancestor groups
+            order_ids: Filter by order IDs (comma-separated)
+            contract_ids: Filter by external contract IDs (comma-separated)
+            from_time: Only contracts starting after this timestamp (ms)
+            to_time: Only contracts ending before this timestamp (ms)
+            token_duration: Filter by token duration in months
+            pricing_model: Filter by pricing model (1-3)
+            subscription_plan: Filter by subscription plan (0-6)
+            fields: Additional fields to return
+            authorizations: If true, return the list of actions/resources the user can access
+            page_id: Token representing the page to retrieve
+
+        Returns:
+            List of ContractInfo objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list(
+            "/contract-infos/", ContractInfo, params=params
+        )
+
+    async def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        name: str | None = None,
+        group_id: str | None = None,
+        group_type: int | None = None,
+        deep: bool = False,
+        up: bool = False,
+        order_ids: str | None = None,
+        contract_ids: str | None = None,
+        from_time: int | None = None,
+        to_time: int | None = None,
+        token_duration: int | None = None,
+        pricing_model: int | None = None,
+        subscription_plan: int | None = None,
+        fields: str | None = None,
+        authorizations: bool = False,
+        page_id: str | None = None,
+    ) -> AsyncIterator[ContractInfo]:
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = ContractInfo.__pydantic_validator__.validate_python
+        async for item in self._client.iter_paginated("/contract-infos/", params=params):
+            yield validate(item)
+
+    async def get(
+        self,
+        contract_id: str,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> ContractInfo:
+        params = build_params(locals(), _GET_PARAMS)
+
+        return await self._client.get_model(
+            f"/contract-infos/{contract_id}", ContractInfo, params=params or None
+        )
+
+    async def list_devices(
+        self,
+        contract_id: str,
+        device_type_id: str | None = None,
+        fields: str | None = None,
+        limit: int | None = None,
+        page_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        params = build_params(locals(), _LIST_DEVICES_PARAMS)
+
+        response = await self._client.get(
+            f"/contract-infos/{contract_id}/devices", params=params or None
+        )
+        return response.get("data", [])
@@ -2,15 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
+from ..exceptions import SigfoxError
 from ..models import (
     CoverageBulkRequest,
     CoverageBulkResponse,
+    CoverageBulkResult,
+    CoverageLocation,
     CoveragePrediction,
     CoverageRedundancy,
 )
+from ._params import ParamSpec, build_params, dump_body
+
+
+_GET_GLOBAL_PREDICTION_PARAMS: ParamSpec = (
+    ("lat", "lat", None),
+    ("lng", "lng", None),
+    ("radius", "radius", None),
+    ("group_id", "groupId", None),
+)
+_GET_OPERATOR_REDUNDANCY_PARAMS: ParamSpec = (
+    ("lat", "lat", None),
+    ("lng", "lng", None),
+    ("operator_id", "operatorId", None),
+    ("device_situation", "deviceSituation", None),
+    ("device_class_id", "deviceClassId", None),
+)
+
+
+def _bulk_request(
+    points: list[tuple[float, float]], radius: int | None, group_id: str | None
+) -> CoverageBulkRequest:
+    """Build a bulk prediction request from (lat, lng) pairs."""
+    return CoverageBulkRequest(
+        locations=[CoverageLocation(lat=lat, lng=lng) for lat, lng in points],
+        radius=radius,
+        group_id=group_id,
+    )
+
+
+def _timeout_message(job_id: str, timeout: float) -> str:
+    """Build the error message raised when a bulk job outlives its timeout."""
+    return f"Bulk prediction job {job_id} did not finish within {timeout}s"
 
 
 class CoveragesAPI:
@@ -42,14 +80,11 @@ class CoveragesAPI:
         Returns:
             CoveragePrediction object
         """
-        params: dict[str, Any] = {"lat": lat, "lng": lng}
-        if radius is not None:
-            params["radius"] = radius
-        if group_id is not None:
-            params["groupId"] = group_id
+        params = build_params(locals(), _GET_GLOBAL_PREDICTION_PARAMS)
 
-        response = self._client.get("/coverages/global/predictions", params=params)
-        return CoveragePrediction.model_validate(response)
+        return self._client.get_model(
+            "/coverages/global/predictions", CoveragePrediction, params=params, cache=True
+        )
 
     def start_bulk_prediction(self, data: CoverageBulkRequest) -> dict[str, Any]:
         """Start an async bulk coverage prediction job.
@@ -60,7 +95,7 @@ class CoveragesAPI:
         Returns:
             Dict with 'jobId' of the created job
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         response = self._client.post("/coverages/global/predictions/bulk", data=body)
         return response
 
@@ -73,10 +108,46 @@ class CoveragesAPI:
         Returns:
             CoverageBulkResponse object (check jobDone before using results)
         """
-        response = self._client.get(
-            f"/coverages/global/predictions/bulk/{job_id}"
+        return self._client.get_model(
+            f"/coverages/global/predictions/bulk/{job_id}", CoverageBulkResponse
         )
-        return CoverageBulkResponse.model_validate(response)
+
+    def predict_many(
+        self,
+        points: list[tuple[float, float]],
+        radius: int | None = None,
+        group_id: str | None = None,
+        poll: float = 2.0,
+        timeout: float = 300.0,
+    ) -> list[CoverageBulkResult]:
+        """Get coverage predictions for many locations with a single bulk job.
+
+        Submits one bulk prediction job instead of one request per point and
+        polls it until the job is done.
+
+        Args:
+            points: (lat, lng) pairs in degrees (WGS 84)
+            radius: Estimated radius of the device location (meters)
+            group_id: Filter by group ID
+            poll: Delay between job status checks in seconds
+            timeout: Maximum time to wait for the job in seconds
+
+        Returns:
+            List of CoverageBulkResult objects in the same order as points
+
+        Raises:
+            SigfoxError: If the job does not finish within timeout
+        """
+        job = self.start_bulk_prediction(_bulk_request(points, radius, group_id))
+        job_id = job["jobId"]
+        deadline = time.monotonic() + timeout
+        while True:
+            time.sleep(poll)
+            result = self.get_bulk_prediction(job_id)
+            if result.job_done:
+                return result.results or []
+            if time.monotonic() >= deadline:
+                raise SigfoxError(_timeout_message(job_id, timeout))
 
     def get_operator_redundancy(
         self,
@@ -99,13 +170,133 @@ class CoveragesAPI:
         Returns:
             CoverageRedundancy object with redundancy count
         """
-        params: dict[str, Any] = {"lat": lat, "lng": lng}
-        if operator_id is not None:
-            params["operatorId"] = operator_id
-        if device_situation is not None:
-            params["deviceSituation"] = device_situation
-        if device_class_id is not None:
-            params["deviceClassId"] = device_class_id
-
-        response = self._client.get("/coverages/operators/redundancy", params=params)
-        return CoverageRedundancy.model_validate(response)
+        params = build_params(locals(), _GET_OPERATOR_REDUNDANCY_PARAMS)
+
+        return self._client.get_model(
+            "/coverages/operators/redundancy", CoverageRedundancy, params=params
+        )
+
+
+class AsyncCoveragesAPI:
+    """Asynchronous high-level API for Sigfox coverage predictions."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        """Initialize asynchronous Coverages API.
+
+        Args:
+            client: Low-level asynchronous Sigfox API client
+        """
+        self._client = client
+
+    async def get_global_prediction(
+        self,
+        lat: float,
+        lng: float,
+        radius: int | None = None,
+        group_id: str | None = None,
+    ) -> CoveragePrediction:
+        """Get coverage prediction for a single location.
+
+        Args:
+            lat: Latitude in degrees (WGS 84)
+            lng: Longitude in degrees (WGS 84)
+            radius: Estimated radius of the device location (meters)
+            group_id: Filter by group ID
+
+        Returns:
+            CoveragePrediction object
+        """
+        params = build_params(locals(), _GET_GLOBAL_PREDICTION_PARAMS)
+
+        return await self._client.get_model(
+            "/coverages/global/predictions", CoveragePrediction, params=params
+        )
+
+    async def start_bulk_prediction(self, data: CoverageBulkRequest) -> dict[str, Any]:
+        """Start an async bulk coverage prediction job.
+
+        Args:
+            data: Bulk request with list of locations
+
+        Returns:
+            Dict with 'jobId' of the created job
+        """
+        body = dump_body(data)
+        return await self._client.post("/coverages/global/predictions/bulk", data=body)
+
+    async def get_bulk_prediction(self, job_id: str) -> CoverageBulkResponse:
+        """Get results of a bulk coverage prediction job.
+
+        Args:
+            job_id: Job ID returned by start_bulk_prediction
+
+        Returns:
+            CoverageBulkResponse object (check jobDone before using results)
+        """
+        return await self._client.get_model(
+            f"/coverages/global/predictions/bulk/{job_id}", CoverageBulkResponse
+        )
+
+    async def predict_many(
+        self,
+        points: list[tuple[float, float]],
+        radius: int | None = None,
+        group_id: str | None = None,
+        poll: float = 2.0,
+        timeout: float = 300.0,
+    ) -> list[CoverageBulkResult]:
+        """Get coverage predictions for many locations with a single bulk job.
+
+        Polling awaits asyncio.sleep, so other tasks keep running while the
+        job is processed.
+
+        Args:
+            points: (lat, lng) pairs in degrees (WGS 84)
+            radius: Estimated radius of the device location (meters)
+            group_id: Filter by group ID
+            poll: Delay between job status checks in seconds
+            timeout: Maximum time to wait for the job in seconds
+
+        Returns:
+            List of CoverageBulkResult objects in the same order as points
+
+        Raises:
+            SigfoxError: If the job does not finish within timeout
+        """
+        job = await self.start_bulk_prediction(_bulk_request(points, radius, group_id))
+        job_id = job["jobId"]
+        deadline = time.monotonic() + timeout
+        while True:
+            await asyncio.sleep(poll)
+            result = await self.get_bulk_prediction(job_id)
+            if result.job_done:
+                return result.results or []
+            if time.monotonic() >= deadline:
+                raise SigfoxError(_timeout_message(job_id, timeout))
+
+    async def get_operator_redundancy(
+        self,
+        lat: float,
+        lng: float,
+        operator_id: str | None = None,
+        device_situation: str | None = None,
+        device_class_id: int | None = None,
+    ) -> CoverageRedundancy:
+        """Get operator redundancy coverage for a location.
+
+        Args:
+            lat: Latitude in degrees (WGS 84)
+            lng: Longitude in degrees (WGS 84)
+            operator_id: Operator group ID (required for root Sigfox users)
+            device_situation: Device installation context
+                ("OUTDOOR", "INDOOR", or "UNDERGROUND")
+            device_class_id: Sigfox device class (0u, 1u, 2u, 3u)
+
+        Returns:
+            CoverageRedundancy object with redundancy count
+        """
+        params = build_params(locals(), _GET_OPERATOR_REDUNDANCY_PARAMS)
+
+        return await self._client.get_model(
+            "/coverages/operators/redundancy", CoverageRedundancy, params=params
+        )
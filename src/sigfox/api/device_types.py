@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import AsyncIterator, Iterator
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import DeviceTypeCreate, DeviceTypeModel, DeviceTypeUpdate
+from ._params import ParamSpec, build_params, dump_body, flag, join_csv
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("name", "name", None),
+    ("group_ids", "groupIds", join_csv),
+    ("deep", "deep", flag),
+    ("sort", "sort", None),
+    ("contract_id", "contractId", None),
+)
 
 
 class DeviceTypesAPI:
@@ -27,6 +40,7 @@ class DeviceTypesAPI:
         group_ids: list[str] | None = None,
         deep: bool = False,
         sort: str | None = None,
+        contract_id: str | None = None,
     ) -> list[DeviceTypeModel]:
         """List device types.
 
@@ -37,27 +51,46 @@ class DeviceTypesAPI:
             group_ids: Filter by group IDs
             deep: Include device types from child groups
             sort: Sort field (e.g., "name", "-creationTime")
+            contract_id: Filter by contract ID
 
         Returns:
             List of DeviceType objects
         """
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if name:
-            params["name"] = name
-        if group_ids:
-            params["groupIds"] = ",".join(group_ids)
-        if deep:
-            params["deep"] = "true"
-        if sort:
-            params["sort"] = sort
-
-        response = self._client.get("/device-types/", params=params)
-        device_types_data = response.get("data", [])
-        return [DeviceTypeModel.model_validate(dt) for dt in device_types_data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/device-types/", DeviceTypeModel, params=params)
+
+    def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        name: str | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        sort: str | None = None,
+        contract_id: str | None = None,
+    ) -> Iterator[DeviceTypeModel]:
+        """Iterate over all device types, following pagination.
+
+        Pages are fetched lazily, so stopping early skips the remaining pages.
+
+        Args:
+            limit: Page size
+            offset: Number of device types to skip before the first page
+            name: Filter by name (partial match)
+            group_ids: Filter by group IDs
+            deep: Include device types from child groups
+            sort: Sort field (e.g., "name", "-creationTime")
+            contract_id: Filter by contract ID
+
+        Yields:
+            DeviceType objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = DeviceTypeModel.__pydantic_validator__.validate_python
+        for item in self._client.iter_paginated("/device-types/", params=params):
+            yield validate(item)
 
     def get(self, device_type_id: str) -> DeviceTypeModel:
         """Get device type details.
@@ -68,8 +101,9 @@ class DeviceTypesAPI:
         Returns:
             DeviceType object
         """
-        response = self._client.get(f"/device-types/{device_type_id}")
-        return DeviceTypeModel.model_validate(response)
+        return self._client.get_model(
+            f"/device-types/{device_type_id}", DeviceTypeModel, cache=True
+        )
 
     def create(self, data: DeviceTypeCreate) -> DeviceTypeModel:
         """Create a new device type.
@@ -80,7 +114,7 @@ class DeviceTypesAPI:
         Returns:
             Created DeviceType object
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         response = self._client.post("/device-types/", data=body)
         return DeviceTypeModel.model_validate(response)
 
@@ -91,7 +125,7 @@ class DeviceTypesAPI:
             device_type_id: Device type ID
             data: Device type update data
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         self._client.put(f"/device-types/{device_type_id}", data=body)
 
     def delete(self, device_type_id: str) -> None:
@@ -101,3 +135,90 @@ class DeviceTypesAPI:
             device_type_id: Device type ID
         """
         self._client.delete(f"/device-types/{device_type_id}")
+
+
+class AsyncDeviceTypesAPI:
+    """Asynchronous high-level API for Sigfox device types."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        """Initialize asynchronous Device Types API.
+
+        Args:
+            client: Low-level asynchronous Sigfox API client
+        """
+        self._client = client
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        name: str | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        sort: str | None = None,
+        contract_id: str | None = None,
+    ) -> list[DeviceTypeModel]:
+        """List device types.
+
+        Args:
+            limit: Maximum number of device types to return
+            offset: Number of device types to skip
+            name: Filter by name (partial match)
+            group_ids: Filter by group IDs
+            deep: Include device types from child groups
+            sort: Sort field (e.g., "name", "-creationTime")
+            contract_id: Filter by contract ID
+
+        Returns:
+            List of DeviceType objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list(
+            "/device-types/", DeviceTypeModel, params=params
+        )
+
+    async def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        name: str | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        sort: str | None = None,
+        contract_id: str | None = None,
+    ) -> AsyncIterator[DeviceTypeModel]:
+        """Iterate over all device types, following pagination.
+
+        The next page is requested while the current one is being consumed.
+
+        Args:
+            limit: Page size
+            offset: Number of device types to skip before the first page
+            name: Filter by name (partial match)
+            group_ids: Filter by group IDs
+            deep: Include device types from child groups
+            sort: Sort field (e.g., "name", "-creationTime")
+            contract_id: Filter by contract ID
+
+        Yields:
+            DeviceType objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = DeviceTypeModel.__pydantic_validator__.validate_python
+        async for item in self._client.iter_paginated("/device-types/", params=params):
+            yield validate(item)
+
+    async def get(self, device_type_id: str) -> DeviceTypeModel:
+        """Get device type details.
+
+        Args:
+            device_type_id: Device type ID
+
+        Returns:
+            DeviceType object
+        """
+        return await self._client.get_model(
+            f"/device-types/{device_type_id}", DeviceTypeModel
+        )
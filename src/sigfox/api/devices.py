@@ -2,10 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import AsyncIterator, Iterator
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import Device, DeviceCreate, DeviceUpdate, Message
+from ._params import ParamSpec, build_params, dump_body, flag, join_csv
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("device_type_id", "deviceTypeId", None),
+    ("group_ids", "groupIds", join_csv),
+    ("deep", "deep", flag),
+    ("sort", "sort", None),
+)
+_MESSAGES_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("since", "since", None),
+    ("before", "before", None),
+)
 
 
 class DevicesAPI:
@@ -41,23 +59,39 @@ class DevicesAPI:
         Returns:
             List of Device objects
         """
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if device_type_id:
-            params["deviceTypeId"] = device_type_id
-        if group_ids:
-            params["groupIds"] = ",".join(group_ids)
-        if deep:
-            params["deep"] = "true"
-        if sort:
-            params["sort"] = sort
-
-        response = self._client.get("/devices/", params=params)
-        devices_data = response.get("data", [])
-        return [Device.model_validate(d) for d in devices_data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/devices/", Device, params=params)
+
+    def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        device_type_id: str | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        sort: str | None = None,
+    ) -> Iterator[Device]:
+        """Iterate over all devices, following pagination.
+
+        Pages are fetched lazily, so stopping early skips the remaining pages.
+
+        Args:
+            limit: Page size
+            offset: Number of devices to skip before the first page
+            device_type_id: Filter by device type ID
+            group_ids: Filter by group IDs
+            deep: Include devices from child groups
+            sort: Sort field (e.g., "name", "-lastCom")
+
+        Yields:
+            Device objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = Device.__pydantic_validator__.validate_python
+        for item in self._client.iter_paginated("/devices/", params=params):
+            yield validate(item)
 
     def get(self, device_id: str) -> Device:
         """Get device details.
@@ -68,8 +102,7 @@ class DevicesAPI:
         Returns:
             Device object
         """
-        response = self._client.get(f"/devices/{device_id}")
-        return Device.model_validate(response)
+        return self._client.get_model(f"/devices/{device_id}", Device, cache=True)
 
     def create(self, data: DeviceCreate) -> Device:
         """Create a new device.
@@ -80,7 +113,7 @@ class DevicesAPI:
         Returns:
             Created Device object
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         response = self._client.post("/devices/", data=body)
         return Device.model_validate(response)
 
@@ -91,7 +124,7 @@ class DevicesAPI:
             device_id: Device ID
             data: Device update data
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         self._client.put(f"/devices/{device_id}", data=body)
 
     def delete(self, device_id: str) -> None:
@@ -122,16 +155,143 @@ class DevicesAPI:
         Returns:
             List of Message objects
         """
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if since is not None:
-            params["since"] = since
-        if before is not None:
-            params["before"] = before
+        params = build_params(locals(), _MESSAGES_PARAMS)
+
+        return self._client.get_list(
+            f"/devices/{device_id}/messages", Message, params=params
+        )
+
+    def iter_messages(
+        self,
+        device_id: str,
+        limit: int | None = None,
+        offset: int | None = None,
+        since: int | None = None,
+        before: int | None = None,
+    ) -> Iterator[Message]:
+        """Iterate over messages for a device.
+
+        Messages are validated one at a time as they are consumed, so callers
+        that stop early do not pay for validating the rest of the response.
+
+        Args:
+            device_id: Device ID
+            limit: Maximum number of messages to return
+            offset: Number of messages to skip
+            since: Unix timestamp (ms) - only messages after this time
+            before: Unix timestamp (ms) - only messages before this time
+
+        Yields:
+            Message objects
+        """
+        params = build_params(locals(), _MESSAGES_PARAMS)
 
         response = self._client.get(f"/devices/{device_id}/messages", params=params)
-        messages_data = response.get("data", [])
-        return [Message.model_validate(m) for m in messages_data]
+        validate = Message.__pydantic_validator__.validate_python
+        for m in response.get("data", []):
+            yield validate(m)
+
+
+class AsyncDevicesAPI:
+    """Asynchronous high-level API for Sigfox devices."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        """Initialize asynchronous Devices API.
+
+        Args:
+            client: Low-level asynchronous Sigfox API client
+        """
+        self._client = client
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        device_type_id: str | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        sort: str | None = None,
+    ) -> list[Device]:
+        """List devices.
+
+        Args:
+            limit: Maximum number of devices to return
+            offset: Number of devices to skip
+            device_type_id: Filter by device type ID
+            group_ids: Filter by group IDs
+            deep: Include devices from child groups
+            sort: Sort field (e.g., "name", "-lastCom")
+
+        Returns:
+            List of Device objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list("/devices/", Device, params=params)
+
+    async def iter_all(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        device_type_id: str | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        sort: str | None = None,
+    ) -> AsyncIterator[Device]:
+        """Iterate over all devices, following pagination.
+
+        The next page is requested while the current one is being consumed.
+
+        Args:
+            limit: Page size
+            offset: Number of devices to skip before the first page
+            device_type_id: Filter by device type ID
+            group_ids: Filter by group IDs
+            deep: Include devices from child groups
+            sort: Sort field (e.g., "name", "-lastCom")
+
+        Yields:
+            Device objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = Device.__pydantic_validator__.validate_python
+        async for item in self._client.iter_paginated("/devices/", params=params):
+            yield validate(item)
+
+    async def get(self, device_id: str) -> Device:
+        """Get device details.
+
+        Args:
+            device_id: Device ID
+
+        Returns:
+            Device object
+        """
+        return await self._client.get_model(f"/devices/{device_id}", Device)
+
+    async def messages(
+        self,
+        device_id: str,
+        limit: int | None = None,
+        offset: int | None = None,
+        since: int | None = None,
+        before: int | None = None,
+    ) -> list[Message]:
+        """Get messages for a device.
+
+        Args:
+            device_id: Device ID
+            limit: Maximum number of messages to return
+            offset: Number of messages to skip
+            since: Unix timestamp (ms) - only messages after this time
+            before: Unix timestamp (ms) - only messages before this time
+
+        Returns:
+            List of Message objects
+        """
+        params = build_params(locals(), _MESSAGES_PARAMS)
+
+        return await self._client.get_list(
+            f"/devices/{device_id}/messages", Message, params=params
+        )
@@ -2,10 +2,45 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import GeolocPayload, Group, GroupCallbackError, GroupCreate, GroupUpdate
+from ._params import ParamSpec, build_params, dump_body, flag, join_csv
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("parent_ids", "parentIds", join_csv),
+    ("deep", "deep", flag),
+    ("name", "name", None),
+    ("types", "types", join_csv),
+    ("fields", "fields", None),
+    ("action", "action", None),
+    ("sort", "sort", None),
+    ("authorizations", "authorizations", flag),
+    ("page_id", "pageId", None),
+)
+_GET_PARAMS: ParamSpec = (
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
+_CALLBACKS_NOT_DELIVERED_PARAMS: ParamSpec = (
+    ("since", "since", None),
+    ("before", "before", None),
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+)
+_GEOLOC_PAYLOADS_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("page_id", "pageId", None),
+)
 
 
 class GroupsAPI:
@@ -51,33 +86,44 @@ class GroupsAPI:
         Returns:
             List of Group objects
         """
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if parent_ids:
-            params["parentIds"] = ",".join(parent_ids)
-        if deep:
-            params["deep"] = "true"
-        if name:
-            params["name"] = name
-        if types:
-            params["types"] = ",".join(str(t) for t in types)
-        if fields:
-            params["fields"] = fields
-        if action:
-            params["action"] = action
-        if sort:
-            params["sort"] = sort
-        if authorizations:
-            params["authorizations"] = "true"
-        if page_id:
-            params["pageId"] = page_id
-
-        response = self._client.get("/groups/", params=params)
-        groups_data = response.get("data", [])
-        return [Group.model_validate(g) for g in groups_data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/groups/", Group, params=params)
+
+    def iter_all(
+        self,
+        limit: int | None = None,
+        parent_ids: list[str] | None = None,
+        deep: bool = False,
+        name: str | None = None,
+        types: list[int] | None = None,
+        fields: str | None = None,
+        action: str | None = None,
+        sort: str | None = None,
+    ) -> Iterator[Group]:
+        """Iterate over all groups, following pagination.
+
+        Pages are fetched lazily and items are validated as they are consumed,
+        so stopping early skips the remaining pages.
+
+        Args:
+            limit: Page size
+            parent_ids: Filter by parent group IDs
+            deep: Retrieve all sub-groups recursively
+            name: Filter by name (contains match)
+            types: Filter by group types (0=SO, 2=Other, 5=SVNO, etc.)
+            fields: Additional fields to return (e.g., "path(name,type,level)")
+            action: Filter by resource:action pair the user has access to
+            sort: Sort field ("id", "-id", "name", "-name")
+
+        Yields:
+            Group objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = Group.__pydantic_validator__.validate_python
+        for item in self._client.iter_paginated("/groups/", params=params):
+            yield validate(item)
 
     def get(
         self,
@@ -95,14 +141,34 @@ class GroupsAPI:
         Returns:
             Group object
         """
-        params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
+        params = build_params(locals(), _GET_PARAMS)
+
+        return self._client.get_model(
+            f"/groups/{group_id}", Group, params=params or None, cache=True
+        )
 
-        response = self._client.get(f"/groups/{group_id}", params=params or None)
-        return Group.model_validate(response)
+    def get_many(
+        self,
+        group_ids: Iterable[str],
+        fields: str | None = None,
+        authorizations: bool = False,
+        max_workers: int = 16,
+    ) -> list[Group]:
+        """Get several groups concurrently.
+
+        Args:
+            group_ids: Group IDs
+            fields: Additional fields to return (e.g., "paths(name)")
+            authorizations: If true, return the list of actions/resources
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Group objects in the same order as group_ids
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(lambda group_id: self.get(group_id, fields, authorizations), group_ids)
+            )
 
     def create(self, data: GroupCreate) -> dict[str, Any]:
         """Create a new group.
@@ -113,7 +179,7 @@ class GroupsAPI:
         Returns:
             Dict with 'id' of the created group
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         response = self._client.post("/groups/", data=body)
         return response
 
@@ -124,7 +190,7 @@ class GroupsAPI:
             group_id: Group ID
             data: Group update data
         """
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         self._client.put(f"/groups/{group_id}", data=body)
 
     def delete(self, group_id: str) -> None:
@@ -155,21 +221,37 @@ class GroupsAPI:
         Returns:
             List of GroupCallbackError objects
         """
-        params: dict[str, Any] = {}
-        if since is not None:
-            params["since"] = since
-        if before is not None:
-            params["before"] = before
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-
-        response = self._client.get(
-            f"/groups/{group_id}/callbacks-not-delivered", params=params
+        params = build_params(locals(), _CALLBACKS_NOT_DELIVERED_PARAMS)
+
+        return self._client.get_list(
+            f"/groups/{group_id}/callbacks-not-delivered", GroupCallbackError, params=params
         )
-        data = response.get("data", [])
-        return [GroupCallbackError.model_validate(item) for item in data]
+
+    def iter_callbacks_not_delivered(
+        self,
+        group_id: str,
+        since: int | None = None,
+        before: int | None = None,
+        limit: int | None = None,
+    ) -> Iterator[GroupCallbackError]:
+        """Iterate over all undelivered callbacks for a group, following pagination.
+
+        Args:
+            group_id: Group ID
+            since: Starting timestamp (ms since Unix epoch)
+            before: Ending timestamp (ms since Unix epoch)
+            limit: Page size
+
+        Yields:
+            GroupCallbackError objects
+        """
+        params = build_params(locals(), _CALLBACKS_NOT_DELIVERED_PARAMS)
+
+        validate = GroupCallbackError.__pydantic_validator__.validate_python
+        for item in self._client.iter_paginated(
+            f"/groups/{group_id}/callbacks-not-delivered", params=params
+        ):
+            yield validate(item)
 
     def geoloc_payloads(
         self,
@@ -189,16 +271,254 @@ class GroupsAPI:
         Returns:
             List of GeolocPayload objects
         """
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if page_id:
-            params["pageId"] = page_id
+        params = build_params(locals(), _GEOLOC_PAYLOADS_PARAMS)
 
-        response = self._client.get(
+        return self._client.get_list(
+            f"/groups/{group_id}/geoloc-payloads", GeolocPayload, params=params
+        )
+
+    def iter_geoloc_payloads(
+        self, group_id: str, limit: int | None = None
+    ) -> Iterator[GeolocPayload]:
+        """Iterate over all geolocation payloads for a group, following pagination.
+
+        Args:
+            group_id: Group ID
+            limit: Page size
+
+        Yields:
+            GeolocPayload objects
+        """
+        params = build_params(locals(), _GEOLOC_PAYLOADS_PARAMS)
+
+        validate = GeolocPayload.__pydantic_validator__.validate_python
+        for item in self._client.iter_paginated(
             f"/groups/{group_id}/geoloc-payloads", params=params
+        ):
+            yield validate(item)
+
+
+class AsyncGroupsAPI:
+    """Asynchronous high-level API for Sigfox groups."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        """Initialize asynchronous Groups API.
+
+        Args:
+            client: Low-level asynchronous Sigfox API client
+        """
+        self._client = client
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        parent_ids: list[str] | None = None,
+        deep: bool = False,
+        name: str | None = None,
+        types: list[int] | None = None,
+        fields: str | None = None,
+        action: str | None = None,
+        sort: str | None = None,
+        authorizations: bool = False,
+        page_id: str | None = None,
+    ) -> list[Group]:
+        """List groups.
+
+        Args:
+            limit: Maximum number of groups to return
+            offset: Number of groups to skip
+            parent_ids: Filter by parent group IDs
+            deep: Retrieve all sub-groups recursively
+            name: Filter by name (contains match)
+            types: Filter by group types (0=SO, 2=Other, 5=SVNO, etc.)
+            fields: Additional fields to return (e.g., "path(name,type,level)")
+            action: Filter by resource:action pair the user has access to
+            sort: Sort field ("id", "-id", "name", "-name")
+            authorizations: If true, return the list of actions/resources the user can access
+            page_id: Token representing the page to retrieve
+
+        Returns:
+            List of Group objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list("/groups/", Group, params=params)
+
+    async def iter_all(
+        self,
+        limit: int | None = None,
+        parent_ids: list[str] | None = None,
+        deep: bool = False,
+        name: str | None = None,
+        types: list[int] | None = None,
+        fields: str | None = None,
+        action: str | None = None,
+        sort: str | None = None,
+    ) -> AsyncIterator[Group]:
+        """Iterate over all groups, following pagination.
+
+        The next page is requested while the current one is being consumed.
+
+        Args:
+            limit: Page size
+            parent_ids: Filter by parent group IDs
+            deep: Retrieve all sub-groups recursively
+            name: Filter by name (contains match)
+            types: Filter by group types (0=SO, 2=Other, 5=SVNO, etc.)
+            fields: Additional fields to return (e.g., "path(name,type,level)")
+            action: Filter by resource:action pair the user has access to
+            sort: Sort field ("id", "-id", "name", "-name")
+
+        Yields:
+            Group objects
+        """
+        params = build_params(locals(), _LIST_PARAMS)
+
+        validate = Group.__pydantic_validator__.validate_python
+        async for item in self._client.iter_paginated("/groups/", params=params):
+            yield validate(item)
+
+    async def get(
+        self,
+        group_id: str,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> Group:
+        """Get group details.
+
+        Args:
+            group_id: Group ID
+            fields: Additional fields to return (e.g., "paths(name)")
+            authorizations: If true, return the list of actions/resources
+
+        Returns:
+            Group object
+        """
+        params = build_params(locals(), _GET_PARAMS)
+
+        return await self._client.get_model(
+            f"/groups/{group_id}", Group, params=params or None
         )
-        data = response.get("data", [])
-        return [GeolocPayload.model_validate(item) for item in data]
+
+    async def get_many(
+        self,
+        group_ids: Iterable[str],
+        fields: str | None = None,
+        authorizations: bool = False,
+        concurrency: int = 16,
+    ) -> list[Group]:
+        """Get several groups concurrently.
+
+        Args:
+            group_ids: Group IDs
+            fields: Additional fields to return (e.g., "paths(name)")
+            authorizations: If true, return the list of actions/resources
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Group objects in the same order as group_ids
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(group_id: str) -> Group:
+            async with semaphore:
+                return await self.get(group_id, fields, authorizations)
+
+        return list(await asyncio.gather(*(get(g) for g in group_ids)))
+
+    async def callbacks_not_delivered(
+        self,
+        group_id: str,
+        since: int | None = None,
+        before: int | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[GroupCallbackError]:
+        """Get undelivered callbacks for a group.
+
+        Args:
+            group_id: Group ID
+            since: Starting timestamp (ms since Unix epoch)
+            before: Ending timestamp (ms since Unix epoch)
+            limit: Maximum number of items to return
+            offset: Number of items to skip
+
+        Returns:
+            List of GroupCallbackError objects
+        """
+        params = build_params(locals(), _CALLBACKS_NOT_DELIVERED_PARAMS)
+
+        return await self._client.get_list(
+            f"/groups/{group_id}/callbacks-not-delivered", GroupCallbackError, params=params
+        )
+
+    async def iter_callbacks_not_delivered(
+        self,
+        group_id: str,
+        since: int | None = None,
+        before: int | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[GroupCallbackError]:
+        """Iterate over all undelivered callbacks for a group, following pagination.
+
+        Args:
+            group_id: Group ID
+            since: Starting timestamp (ms since Unix epoch)
+            before: Ending timestamp (ms since Unix epoch)
+            limit: Page size
+
+        Yields:
+            GroupCallbackError objects
+        """
+        params = build_params(locals(), _CALLBACKS_NOT_DELIVERED_PARAMS)
+
+        validate = GroupCallbackError.__pydantic_validator__.validate_python
+        async for item in self._client.iter_paginated(
+            f"/groups/{group_id}/callbacks-not-delivered", params=params
+        ):
+            yield validate(item)
+
+    async def geoloc_payloads(
+        self,
+        group_id: str,
+        limit: int | None = None,
+        offset: int | None = None,
+        page_id: str | None = None,
+    ) -> list[GeolocPayload]:
+        """Get geolocation payloads for a group.
+
+        Args:
+            group_id: Group ID
+            limit: Maximum number of items to return
+            offset: Number of items to skip
+            page_id: Token for pagination
+
+        Returns:
+            List of GeolocPayload objects
+        """
+        params = build_params(locals(), _GEOLOC_PAYLOADS_PARAMS)
+
+        return await self._client.get_list(
+            f"/groups/{group_id}/geoloc-payloads", GeolocPayload, params=params
+        )
+
+    async def iter_geoloc_payloads(
+        self, group_id: str, limit: int | None = None
+    ) -> AsyncIterator[GeolocPayload]:
+        """Iterate over all geolocation payloads for a group, following pagination.
+
+        Args:
+            group_id: Group ID
+            limit: Page size
+
+        Yields:
+            GeolocPayload objects
+        """
+        params = build_params(locals(), _GEOLOC_PAYLOADS_PARAMS)
+
+        validate = GeolocPayload.__pydantic_validator__.validate_python
+        async for item in self._client.iter_paginated(
+            f"/groups/{group_id}/geoloc-payloads", params=params
+        ):
+            yield validate(item)
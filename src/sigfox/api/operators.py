@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any
-
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import Operator
+from ._params import ParamSpec, build_params, flag, join_csv
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("group_ids", "groupIds", join_csv),
+    ("deep", "deep", flag),
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
+_GET_PARAMS: ParamSpec = (
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
 
 
 class OperatorsAPI:
@@ -23,23 +37,9 @@ class OperatorsAPI:
         fields: str | None = None,
         authorizations: bool = False,
     ) -> list[Operator]:
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if group_ids:
-            params["groupIds"] = ",".join(group_ids)
-        if deep:
-            params["deep"] = "true"
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
-
-        response = self._client.get("/operators/", params=params)
-        data = response.get("data", [])
-        return [Operator.model_validate(o) for o in data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/operators/", Operator, params=params)
 
     def get(
         self,
@@ -47,13 +47,40 @@ class OperatorsAPI:
         fields: str | None = None,
         authorizations: bool = False,
     ) -> Operator:
-        params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
-
-        response = self._client.get(
-            f"/operators/{operator_id}", params=params or None
+        params = build_params(locals(), _GET_PARAMS)
+
+        return self._client.get_model(
+            f"/operators/{operator_id}", Operator, params=params or None
+        )
+
+
+class AsyncOperatorsAPI:
+    """Asynchronous high-level API for Sigfox operators."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        self._client = client
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> list[Operator]:
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list("/operators/", Operator, params=params)
+
+    async def get(
+        self,
+        operator_id: str,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> Operator:
+        params = build_params(locals(), _GET_PARAMS)
+
+        return await self._client.get_model(
+            f"/operators/{operator_id}", Operator, params=params or None
         )
-        return Operator.model_validate(response)
@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any
-
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import Profile
+from ._params import ParamSpec, build_params, flag
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("group_id", "groupId", None),
+    ("inherit", "inherit", flag),
+    ("fields", "fields", None),
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("authorizations", "authorizations", flag),
+)
+_GET_PARAMS: ParamSpec = (
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
 
 
 class ProfilesAPI:
@@ -23,21 +37,9 @@ class ProfilesAPI:
         offset: int | None = None,
         authorizations: bool = False,
     ) -> list[Profile]:
-        params: dict[str, Any] = {"groupId": group_id}
-        if inherit:
-            params["inherit"] = "true"
-        if fields:
-            params["fields"] = fields
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if authorizations:
-            params["authorizations"] = "true"
-
-        response = self._client.get("/profiles/", params=params)
-        data = response.get("data", [])
-        return [Profile.model_validate(p) for p in data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/profiles/", Profile, params=params)
 
     def get(
         self,
@@ -45,13 +47,40 @@ class ProfilesAPI:
         fields: str | None = None,
         authorizations: bool = False,
     ) -> Profile:
-        params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
-
-        response = self._client.get(
-            f"/profiles/{profile_id}", params=params or None
+        params = build_params(locals(), _GET_PARAMS)
+
+        return self._client.get_model(
+            f"/profiles/{profile_id}", Profile, params=params or None
+        )
+
+
+class AsyncProfilesAPI:
+    """Asynchronous high-level API for Sigfox profiles."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        self._client = client
+
+    async def list(
+        self,
+        group_id: str,
+        inherit: bool = False,
+        fields: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        authorizations: bool = False,
+    ) -> list[Profile]:
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list("/profiles/", Profile, params=params)
+
+    async def get(
+        self,
+        profile_id: str,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> Profile:
+        params = build_params(locals(), _GET_PARAMS)
+
+        return await self._client.get_model(
+            f"/profiles/{profile_id}", Profile, params=params or None
         )
-        return Profile.model_validate(response)
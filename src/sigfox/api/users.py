@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from ..async_client import AsyncSigfoxClient
 from ..client import SigfoxClient
 from ..models import User, UserCreate, UserUpdate
+from ._params import ParamSpec, build_params, dump_body, flag, join_csv
+
+
+_LIST_PARAMS: ParamSpec = (
+    ("limit", "limit", None),
+    ("offset", "offset", None),
+    ("group_ids", "groupIds", join_csv),
+    ("deep", "deep", flag),
+    ("fields", "fields", None),
+    ("sort", "sort", None),
+    ("authorizations", "authorizations", flag),
+)
+_GET_PARAMS: ParamSpec = (
+    ("fields", "fields", None),
+    ("authorizations", "authorizations", flag),
+)
 
 
 class UsersAPI:
@@ -24,25 +44,9 @@ class UsersAPI:
         sort: str | None = None,
         authorizations: bool = False,
     ) -> list[User]:
-        params: dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if group_ids:
-            params["groupIds"] = ",".join(group_ids)
-        if deep:
-            params["deep"] = "true"
-        if fields:
-            params["fields"] = fields
-        if sort:
-            params["sort"] = sort
-        if authorizations:
-            params["authorizations"] = "true"
-
-        response = self._client.get("/users/", params=params)
-        users_data = response.get("data", [])
-        return [User.model_validate(u) for u in users_data]
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return self._client.get_list("/users/", User, params=params)
 
     def get(
         self,
@@ -50,22 +54,31 @@ class UsersAPI:
         fields: str | None = None,
         authorizations: bool = False,
     ) -> User:
-        params: dict[str, Any] = {}
-        if fields:
-            params["fields"] = fields
-        if authorizations:
-            params["authorizations"] = "true"
+        params = build_params(locals(), _GET_PARAMS)
 
-        response = self._client.get(f"/users/{user_id}", params=params or None)
-        return User.model_validate(response)
+        return self._client.get_model(
+            f"/users/{user_id}", User, params=params or None, cache=True
+        )
+
+    def get_many(
+        self,
+        user_ids: Iterable[str],
+        fields: str | None = None,
+        authorizations: bool = False,
+        max_workers: int = 16,
+    ) -> list[User]:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(lambda user_id: self.get(user_id, fields, authorizations), user_ids)
+            )
 
     def create(self, data: UserCreate) -> dict[str, Any]:
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         response = self._client.post("/users/", data=body)
         return response
 
     def update(self, user_id: str, data: UserUpdate) -> None:
-        body = data.model_dump(by_alias=True, exclude_none=True)
+        body = dump_body(data)
         self._client.put(f"/users/{user_id}", data=body)
 
     def delete(self, user_id: str) -> None:
@@ -77,3 +90,92 @@ class UsersAPI:
 
     def remove_role(self, user_id: str, role_id: str) -> None:
         self._client.delete(f"/users/{user_id}/roles/{role_id}")
+
+    def add_roles_bulk(
+        self, roles_by_user: Mapping[str, list[str]], max_workers: int = 16
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(self.add_roles, roles_by_user, roles_by_user.values()))
+
+    def remove_roles_bulk(
+        self, pairs: Iterable[tuple[str, str]], max_workers: int = 16
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(lambda pair: self.remove_role(*pair), pairs))
+
+
+class AsyncUsersAPI:
+    """Asynchronous high-level API for Sigfox users (portal users)."""
+
+    def __init__(self, client: AsyncSigfoxClient):
+        self._client = client
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        group_ids: list[str] | None = None,
+        deep: bool = False,
+        fields: str | None = None,
+        sort: str | None = None,
+        authorizations: bool = False,
+    ) -> list[User]:
+        params = build_params(locals(), _LIST_PARAMS)
+
+        return await self._client.get_list("/users/", User, params=params)
+
+    async def get(
+        self,
+        user_id: str,
+        fields: str | None = None,
+        authorizations: bool = False,
+    ) -> User:
+        params = build_params(locals(), _GET_PARAMS)
+
+        return await self._client.get_model(
+            f"/users/{user_id}", User, params=params or None
+        )
+
+    async def get_many(
+        self,
+        user_ids: Iterable[str],
+        fields: str | None = None,
+        authorizations: bool = False,
+        concurrency: int = 16,
+    ) -> list[User]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(user_id: str) -> User:
+            async with semaphore:
+                return await self.get(user_id, fields, authorizations)
+
+        return list(await asyncio.gather(*(get(u) for u in user_ids)))
+
+    async def add_roles(self, user_id: str, role_ids: list[str]) -> None:
+        body = {"roleIds": role_ids}
+        await self._client.put(f"/users/{user_id}/roles", data=body)
+
+    async def remove_role(self, user_id: str, role_id: str) -> None:
+        await self._client.delete(f"/users/{user_id}/roles/{role_id}")
+
+    async def add_roles_bulk(
+        self, roles_by_user: Mapping[str, list[str]], concurrency: int = 16
+    ) -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(user_id: str, role_ids: list[str]) -> None:
+            async with semaphore:
+                await self.add_roles(user_id, role_ids)
+
+        await asyncio.gather(*(add(u, r) for u, r in roles_by_user.items()))
+
+    async def remove_roles_bulk(
+        self, pairs: Iterable[tuple[str, str]], concurrency: int = 16
+    ) -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def remove(user_id: str, role_id: str) -> None:
+            async with semaphore:
+                await self.remove_role(user_id, role_id)
+
+        await asyncio.gather(*(remove(u, r) for u, r in pairs))
@@ -0,0 +1,194 @@
+"""Asynchronous Sigfox API client."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+
+from .client import ModelT, SigfoxClient, _basic_auth, _page_validator
+from .exceptions import NetworkError
+
+
+class AsyncSigfoxClient:
+    """Asynchronous HTTP client for Sigfox API v2.
+
+    Mirrors SigfoxClient with coroutine methods so that independent requests
+    can be awaited concurrently (e.g. with asyncio.gather).
+    """
+
+    __slots__ = ("base_url", "_client")
+
+    def __init__(
+        self,
+        api_login: str,
+        api_password: str,
+        base_url: str = "https://api.sigfox.com/v2",
+        timeout: int = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 32,
+        http2: bool = False,
+    ):
+        """Initialize asynchronous Sigfox API client.
+
+        Args:
+            api_login: Sigfox API login (ID)
+            api_password: Sigfox API password (secret)
+            base_url: API base URL
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            http2: Negotiate HTTP/2 so requests are multiplexed over one
+                connection (requires the ``http2`` extra)
+        """
+        self.base_url = base_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            headers={
+                "Accept": "application/json",
+                "Authorization": _basic_auth(api_login, api_password),
+                "Content-Type": "application/json",
+            },
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=75,
+            ),
+        )
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            data: Request body data (dict, or pre-encoded JSON bytes)
+            params: Query parameters
+
+        Returns:
+            Response JSON data (empty dict for empty responses)
+
+        Raises:
+            NetworkError: If network connection fails
+            AuthenticationError: If authentication fails
+            APIError: If API returns an error
+        """
+        return await self._send(method, f"{self.base_url}{path}", data=data, params=params)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        data: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request to an absolute URL and decode the JSON response."""
+        response = await self._fetch(method, url, data=data, params=params)
+        return SigfoxClient._decode_response(response)
+
+    async def _fetch(
+        self,
+        method: str,
+        url: str,
+        data: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Send a request to an absolute URL and check its status."""
+        try:
+            response = await self._client.request(
+                method, url, params=params, **SigfoxClient._body(data)
+            )
+            SigfoxClient._handle_error(response)
+            return response
+        except httpx.NetworkError as e:
+            raise NetworkError(f"Network error: {e}") from e
+        except httpx.TimeoutException as e:
+            raise NetworkError(f"Request timeout: {e}") from e
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Make a GET request to the API."""
+        return await self._request("GET", path, params=params)
+
+    async def get_model(
+        self, path: str, model: type[ModelT], params: dict[str, Any] | None = None
+    ) -> ModelT:
+        """Make a GET request and validate the response body as a model."""
+        response = await self._fetch("GET", f"{self.base_url}{path}", params=params)
+        return model.model_validate_json(response.content)
+
+    async def get_list(
+        self, path: str, model: type[ModelT], params: dict[str, Any] | None = None
+    ) -> list[ModelT]:
+        """Make a GET request and validate the ``data`` array of the response."""
+        response = await self._fetch("GET", f"{self.base_url}{path}", params=params)
+        return _page_validator(model)(response.content).data
+
+    async def post(
+        self, path: str, data: dict[str, Any] | bytes | None = None, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make a POST request to the API."""
+        return await self._request("POST", path, data=data, params=params)
+
+    async def put(
+        self, path: str, data: dict[str, Any] | bytes | None = None, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make a PUT request to the API."""
+        return await self._request("PUT", path, data=data, params=params)
+
+    async def delete(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make a DELETE request to the API."""
+        return await self._request("DELETE", path, params=params)
+
+    async def iter_paginated(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the items of a paginated endpoint.
+
+        The next page (``paging.next``) is requested concurrently while the
+        caller consumes the current one.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters for the first page
+
+        Yields:
+            Items from the ``data`` array of each page
+        """
+        response_data = await self.get(path, params=params)
+        task = None
+        try:
+            while True:
+                items = response_data.get("data", [])
+                next_url = (response_data.get("paging") or {}).get("next") if items else None
+                task = asyncio.create_task(self._send("GET", next_url)) if next_url else None
+
+                for item in items:
+                    yield item
+
+                if task is None:
+                    return
+                response_data = await task
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
@@ -1,9 +1,18 @@
 """Sigfox API client."""
 
-from typing import Any
+import base64
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Generic, TypeVar
 
 import httpx
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 
+from ._cache import ResponseCache, TTLCache
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -12,34 +21,154 @@ from .exceptions import (
     NotFoundError,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _Page(BaseModel, Generic[ModelT]):
+    """Items of a list response; ``paging`` and other keys are ignored."""
+
+    data: list[ModelT] = []
+
+
+@lru_cache(maxsize=None)
+def _page_validator(model: type[ModelT]) -> Callable[[bytes], _Page[ModelT]]:
+    """Return the compiled JSON validator of ``_Page[model]``.
+
+    Memoized per model so list calls skip the generic parametrization
+    lookup and model_validate_json wrapper on every page.
+    """
+    return _Page[model].__pydantic_validator__.validate_json
+
+
+def _env_proxy_mounts(
+    transport_options: dict[str, Any],
+) -> dict[str, httpx.BaseTransport | None]:
+    """Build transports for the proxies configured in the environment.
+
+    httpx only honours HTTP(S)_PROXY, ALL_PROXY and NO_PROXY when no custom
+    transport is given, so the same mounts are built here explicitly, with
+    the client's own transport options. None entries (NO_PROXY hosts) fall
+    back to the default, direct transport.
+
+    Args:
+        transport_options: Keyword arguments for each httpx.HTTPTransport
+
+    Returns:
+        URL pattern -> transport mapping for httpx.Client(mounts=...)
+    """
+    from httpx._utils import get_environment_proxies
+
+    return {
+        pattern: (
+            None if proxy is None else httpx.HTTPTransport(proxy=proxy, **transport_options)
+        )
+        for pattern, proxy in get_environment_proxies().items()
+    }
+
+
+def _basic_auth(api_login: str, api_password: str) -> str:
+    """Encode credentials as an HTTP Basic ``Authorization`` header value.
+
+    The header is built once per client and sent as a default header, so
+    httpx does not run its auth flow for every request.
+    """
+    token = base64.b64encode(f"{api_login}:{api_password}".encode()).decode()
+    return f"Basic {token}"
+
 
 class SigfoxClient:
     """HTTP client for Sigfox API v2."""
 
+    __slots__ = (
+        "base_url",
+        "_client",
+        "_cache",
+        "_etags",
+        "_not_found",
+        "_inflight",
+        "_inflight_lock",
+    )
+
     def __init__(
         self,
         api_login: str,
         api_password: str,
         base_url: str = "https://api.sigfox.com/v2",
         timeout: int = 30,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        retries: int = 3,
+        cache_ttl: float = 60,
+        cache_maxsize: int = 1024,
+        http2: bool = False,
+        etag_cache: bool = False,
+        not_found_ttl: float = 60,
+        response_cache: ResponseCache | None = None,
     ):
         """Initialize Sigfox API client.
 
+        A single pooled connection is kept alive and reused across all
+        requests made through this client. Responses are requested with
+        gzip/deflate compression (and brotli when the ``brotli`` extra is
+        installed) and decompressed transparently.
+
         Args:
             api_login: Sigfox API login (ID)
             api_password: Sigfox API password (secret)
             base_url: API base URL
             timeout: Request timeout in seconds
+            max_connections: Maximum number of pooled connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            retries: Number of retries on connection failures
+            cache_ttl: Lifetime in seconds of cached GET responses (0 disables caching)
+            cache_maxsize: Maximum number of cached GET responses
+            http2: Negotiate HTTP/2 so requests are multiplexed over one
+                connection (requires the ``http2`` extra)
+            etag_cache: Remember ETags of GET responses and revalidate them
+                with If-None-Match, reusing the stored body on 304. Off by
+                default: the full body of every GET response that carries an
+                ETag is kept in memory until evicted (up to cache_maxsize
+                bodies, with no expiry), so enable it only for long-lived
+                clients that re-read the same resources
+            not_found_ttl: Lifetime in seconds of remembered 404 responses to
+                cached (``cache=True``) GETs, which are re-raised without a
+                round-trip (0 disables). Other GETs, such as list calls and
+                job polling, always reach the API
+            response_cache: Store for cached GET responses to use instead of an
+                in-process TTLCache (cache_ttl and cache_maxsize are then ignored)
         """
         self.base_url = base_url.rstrip("/")
+        transport_options: dict[str, Any] = {
+            "http2": http2,
+            "retries": retries,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=75,
+            ),
+        }
         self._client = httpx.Client(
-            auth=(api_login, api_password),
             headers={
                 "Accept": "application/json",
+                "Authorization": _basic_auth(api_login, api_password),
                 "Content-Type": "application/json",
             },
             timeout=timeout,
+            transport=httpx.HTTPTransport(**transport_options),
+            mounts=_env_proxy_mounts(transport_options),
+        )
+        if response_cache is not None:
+            self._cache = response_cache
+        else:
+            self._cache = (
+                TTLCache(maxsize=cache_maxsize, ttl=cache_ttl) if cache_ttl > 0 else None
+            )
+        self._etags = TTLCache(maxsize=cache_maxsize, ttl=float("inf")) if etag_cache else None
+        self._not_found = (
+            TTLCache(maxsize=cache_maxsize, ttl=not_found_ttl) if not_found_ttl > 0 else None
         )
+        self._inflight: dict[Hashable, Future[bytes]] = {}
+        self._inflight_lock = threading.Lock()
 
     def __enter__(self):
         """Context manager entry."""
@@ -53,7 +182,86 @@ class SigfoxClient:
         """Close the HTTP client."""
         self._client.close()
 
-    def _handle_error(self, response: httpx.Response) -> None:
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses, stored ETags and remembered 404s."""
+        for cache in (self._cache, self._etags, self._not_found):
+            if cache is not None:
+                cache.clear()
+
+    def _invalidate(self, path: str) -> None:
+        """Drop cached GET responses for the resource targeted by a mutation.
+
+        Args:
+            path: API endpoint path of the mutating request
+        """
+        # "/devices/abc/messages" -> "/devices/abc"; "/devices/" -> "/devices"
+        prefix = "/".join(path.split("/")[:3]).rstrip("/")
+
+        # Match whole path segments so "/devices/abc" spares "/devices/abcdef"
+        def matches(key: Hashable) -> bool:
+            return key[0] == prefix or key[0].startswith(prefix + "/")
+
+        for cache in (self._cache, self._etags, self._not_found):
+            if cache is not None:
+                cache.invalidate(matches)
+
+    @staticmethod
+    def _body(data: dict[str, Any] | bytes | None) -> dict[str, Any]:
+        """Build httpx request body arguments.
+
+        Pre-encoded JSON bytes are sent as-is; dicts are encoded straight to
+        bytes with pydantic-core's JSON serializer rather than stdlib json.
+
+        Args:
+            data: Request body data
+
+        Returns:
+            Keyword arguments for the httpx request method
+        """
+        if data is None:
+            return {}
+        if isinstance(data, bytes):
+            return {"content": data}
+        return {"content": to_json(data)}
+
+    @staticmethod
+    def _decode_response(response: httpx.Response) -> Any:
+        """Decode a JSON response body.
+
+        Uses pydantic-core's native JSON parser, which is faster than the
+        stdlib decoder behind ``response.json()``.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded JSON data (empty dict for 204 or empty responses)
+        """
+        if response.status_code == 204 or not response.content:
+            return {}
+        return from_json(response.content)
+
+    @classmethod
+    def _parse_and_raise(cls, response: httpx.Response) -> Any:
+        """Check the status of a response and decode its JSON body.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded JSON data (empty dict for 204 or empty responses)
+
+        Raises:
+            AuthenticationError: If status code is 401
+            AuthorizationError: If status code is 403
+            NotFoundError: If status code is 404
+            APIError: For other error status codes
+        """
+        cls._handle_error(response)
+        return cls._decode_response(response)
+
+    @staticmethod
+    def _handle_error(response: httpx.Response) -> None:
         """Handle HTTP error responses.
 
         Args:
@@ -68,11 +276,15 @@ class SigfoxClient:
         if response.is_success:
             return
 
-        try:
-            error_body = response.json()
-            error_message = error_body.get("message", response.text)
-        except Exception:
-            error_message = response.text
+        # Only JSON bodies are parsed; HTML error pages are truncated as-is.
+        # response.text is only decoded when the body has no JSON message.
+        if "json" in response.headers.get("content-type", ""):
+            try:
+                error_message = from_json(response.content)["message"]
+            except Exception:
+                error_message = response.text
+        else:
+            error_message = response.text[:256]
 
         if response.status_code == 401:
             raise AuthenticationError(
@@ -93,12 +305,15 @@ class SigfoxClient:
                 response_body=response.text,
             )
 
-    def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    def get(
+        self, path: str, params: dict[str, Any] | None = None, cache: bool = False
+    ) -> dict[str, Any]:
         """Make a GET request to the API.
 
         Args:
             path: API endpoint path (e.g., "/devices")
             params: Query parameters
+            cache: Serve and store the response in the in-process cache
 
         Returns:
             Response JSON data
@@ -108,24 +323,190 @@ class SigfoxClient:
             AuthenticationError: If authentication fails
             APIError: If API returns an error
         """
-        url = f"{self.base_url}{path}"
+        return from_json(self._get_raw(path, params, cache))
+
+    def get_model(
+        self,
+        path: str,
+        model: type[ModelT],
+        params: dict[str, Any] | None = None,
+        cache: bool = False,
+    ) -> ModelT:
+        """Make a GET request and validate the response body as a model.
+
+        The raw JSON body is validated directly, without decoding it into
+        Python dicts first.
+
+        Args:
+            path: API endpoint path (e.g., "/devices/123")
+            model: Pydantic model class of the response
+            params: Query parameters
+            cache: Serve and store the response in the in-process cache
+
+        Returns:
+            Validated model instance
+        """
+        return model.model_validate_json(self._get_raw(path, params, cache))
+
+    def get_list(
+        self,
+        path: str,
+        model: type[ModelT],
+        params: dict[str, Any] | None = None,
+        cache: bool = False,
+    ) -> list[ModelT]:
+        """Make a GET request and validate the ``data`` array of the response.
+
+        Args:
+            path: API endpoint path (e.g., "/devices/")
+            model: Pydantic model class of the list items
+            params: Query parameters
+            cache: Serve and store the response in the in-process cache
+
+        Returns:
+            List of validated model instances
+        """
+        return _page_validator(model)(self._get_raw(path, params, cache)).data
+
+    def _get_raw(
+        self, path: str, params: dict[str, Any] | None, cache: bool
+    ) -> bytes:
+        """Fetch the raw response body of a GET request.
+
+        If cache is set, serves the response from the in-process cache and
+        re-raises recently seen 404s without a round-trip. Concurrent
+        identical requests (e.g. from bulk helper threads) share a single
+        round-trip.
+        """
+        key = (path, tuple(sorted(params.items())) if params else ())
+        if cache and self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        if cache and self._not_found is not None:
+            message = self._not_found.get(key)
+            if message is not None:
+                raise NotFoundError(message)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            content = self._revalidate(path, params, key)
+        except BaseException as e:
+            if cache and isinstance(e, NotFoundError) and self._not_found is not None:
+                self._not_found.set(key, str(e))
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(content)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+        if cache and self._cache is not None:
+            self._cache.set(key, content)
+        return content
+
+    def _revalidate(
+        self, path: str, params: dict[str, Any] | None, key: Hashable
+    ) -> bytes:
+        """Fetch a GET response body, revalidating a previously seen ETag."""
+        stored = self._etags.get(key) if self._etags is not None else None
+        headers = {"If-None-Match": stored[0]} if stored is not None else None
+        response = self._fetch(f"{self.base_url}{path}", params=params, headers=headers)
+        if response.status_code == 304 and stored is not None:
+            return stored[1]
+
+        content = response.content
+        etag = response.headers.get("ETag")
+        if etag and self._etags is not None:
+            self._etags.set(key, (etag, content))
+        return content
+
+    def _get_url(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Make a GET request to an absolute URL.
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+
+        Returns:
+            Response JSON data
+        """
+        return from_json(self._fetch(url, params=params).content)
+
+    def _fetch(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Make a GET request to an absolute URL and check its status."""
         try:
-            response = self._client.get(url, params=params)
+            response = self._client.get(url, params=params, headers=headers)
             self._handle_error(response)
-            return response.json()
+            return response
         except httpx.NetworkError as e:
             raise NetworkError(f"Network error: {e}") from e
         except httpx.TimeoutException as e:
             raise NetworkError(f"Request timeout: {e}") from e
 
+    def iter_paginated(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the items of a paginated endpoint.
+
+        Pages are fetched lazily by following the ``paging.next`` link of
+        each response, so callers that stop early skip the remaining pages.
+        With prefetch enabled, the next page is requested in a background
+        thread while the caller consumes the current one.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters for the first page
+            prefetch: Fetch page N+1 while page N is being consumed
+
+        Yields:
+            Items from the ``data`` array of each page
+
+        Raises:
+            NetworkError: If network connection fails
+            APIError: If API returns an error
+        """
+        response_data = self.get(path, params=params)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            while True:
+                items = response_data.get("data", [])
+                next_url = (response_data.get("paging") or {}).get("next") if items else None
+                future = executor.submit(self._get_url, next_url) if executor and next_url else None
+
+                yield from items
+
+                if not next_url:
+                    return
+                response_data = future.result() if future else self._get_url(next_url)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def post(
-        self, path: str, data: dict[str, Any] | None = None, params: dict[str, Any] | None = None
+        self, path: str, data: dict[str, Any] | bytes | None = None, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Make a POST request to the API.
 
         Args:
             path: API endpoint path
-            data: Request body data
+            data: Request body data (dict, or pre-encoded JSON bytes)
             params: Query parameters
 
         Returns:
@@ -136,24 +517,25 @@ class SigfoxClient:
             AuthenticationError: If authentication fails
             APIError: If API returns an error
         """
+        self._invalidate(path)
         url = f"{self.base_url}{path}"
         try:
-            response = self._client.post(url, json=data, params=params)
-            self._handle_error(response)
-            return response.json()
+            return self._parse_and_raise(
+                self._client.post(url, params=params, **self._body(data))
+            )
         except httpx.NetworkError as e:
             raise NetworkError(f"Network error: {e}") from e
         except httpx.TimeoutException as e:
             raise NetworkError(f"Request timeout: {e}") from e
 
     def put(
-        self, path: str, data: dict[str, Any] | None = None, params: dict[str, Any] | None = None
+        self, path: str, data: dict[str, Any] | bytes | None = None, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Make a PUT request to the API.
 
         Args:
             path: API endpoint path
-            data: Request body data
+            data: Request body data (dict, or pre-encoded JSON bytes)
             params: Query parameters
 
         Returns:
@@ -164,14 +546,13 @@ class SigfoxClient:
             AuthenticationError: If authentication fails
             APIError: If API returns an error
         """
+        self._invalidate(path)
         url = f"{self.base_url}{path}"
         try:
-            response = self._client.put(url, json=data, params=params)
-            self._handle_error(response)
             # PUT may return empty body on success (204 No Content)
-            if response.status_code == 204 or not response.content:
-                return {}
-            return response.json()
+            return self._parse_and_raise(
+                self._client.put(url, params=params, **self._body(data))
+            )
         except httpx.NetworkError as e:
             raise NetworkError(f"Network error: {e}") from e
         except httpx.TimeoutException as e:
@@ -194,14 +575,11 @@ class SigfoxClient:
             AuthenticationError: If authentication fails
             APIError: If API returns an error
         """
+        self._invalidate(path)
         url = f"{self.base_url}{path}"
         try:
-            response = self._client.delete(url, params=params)
-            self._handle_error(response)
             # DELETE typically returns 204 No Content
-            if response.status_code == 204 or not response.content:
-                return {}
-            return response.json()
+            return self._parse_and_raise(self._client.delete(url, params=params))
         except httpx.NetworkError as e:
             raise NetworkError(f"Network error: {e}") from e
         except httpx.TimeoutException as e:
@@ -215,6 +593,10 @@ class SigfoxClient:
     ) -> list[dict[str, Any]]:
         """Get paginated results from the API.
 
+        Pages are fetched through iter_paginated, following each response's
+        ``paging.next`` link and prefetching the next page in the background
+        when all items are requested.
+
         Args:
             path: API endpoint path
             params: Query parameters
@@ -227,39 +609,8 @@ class SigfoxClient:
             NetworkError: If network connection fails
             APIError: If API returns an error
         """
-        if params is None:
-            params = {}
-
-        all_items: list[dict[str, Any]] = []
-        offset = params.get("offset", 0)
-        page_limit = params.get("limit", 100)
-
-        while True:
-            # Update pagination params
-            params["offset"] = offset
-            params["limit"] = page_limit
-
-            # Fetch page
-            response_data = self.get(path, params=params)
-            items = response_data.get("data", [])
-
-            if not items:
-                break
-
-            all_items.extend(items)
-
-            # Check if we've reached the user-specified limit
-            if limit is not None and len(all_items) >= limit:
-                all_items = all_items[:limit]
-                break
-
-            # Check if there are more pages
-            paging = response_data.get("paging", {})
-            next_url = paging.get("next")
-            if not next_url:
-                break
-
-            # Update offset for next page
-            offset += len(items)
-
-        return all_items
+        first_page = {"offset": 0, "limit": 100, **(params or {})}
+        # Prefetching only pays off when every page is needed; with a limit it
+        # could request a page past the last one consumed.
+        items = self.iter_paginated(path, params=first_page, prefetch=limit is None)
+        return list(islice(items, limit))
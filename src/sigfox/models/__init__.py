@@ -1,68 +1,132 @@
-"""Sigfox API models."""
+"""Sigfox API models.
 
-from .contract_info import (
-    ContractInfo,
-    ContractInfoOption,
-    MinContractInfo,
-    MinDeviceType as ContractInfoMinDeviceType,
-    MinGroup as ContractInfoMinGroup,
-)
-from .coverage import (
-    CoverageBulkRequest,
-    CoverageBulkResponse,
-    CoverageBulkResult,
-    CoverageLocation,
-    CoveragePrediction,
-    CoverageRedundancy,
-)
-from .api_user import (
-    ApiUser,
-    ApiUserCreate,
-    ApiUserUpdate,
-    MinGroup as ApiUserMinGroup,
-    MinProfile,
-)
-from .base_station import (
-    BaseStation,
-    BaseStationUpdate,
-    MessageBaseStation,
-    MinBaseStation,
-)
-from .device import Device, DeviceCreate, DeviceType, DeviceUpdate
-from .device_type import (
-    Contract,
-    DeviceType as DeviceTypeModel,
-    DeviceTypeCreate,
-    DeviceTypeUpdate,
-    Group as GroupRef,  # Renamed: minimal group ref nested in DeviceType
-)
-from .group import (
-    GeolocPayload,
-    Group,
-    GroupCallbackError,
-    GroupCreate,
-    GroupUpdate,
-    MinGroup,
-)
-from .message import DeviceInfo, Message
-from .pagination import PaginatedResponse, Paging
-from .operator import (
-    MinGroup as OperatorMinGroup,
-    Operator,
-)
-from .profile import (
-    MinGroup as ProfileMinGroup,
-    MinMetaRole,
-    MinRole as ProfileMinRole,
-    Profile,
-)
-from .user import (
-    MinGroup as UserMinGroup,
-    MinRole,
-    User,
-    UserCreate,
-    UserUpdate,
-)
+Model modules are imported on first attribute access (PEP 562), so that
+using one model does not pay for building the schemas of all the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .contract_info import (
+        ContractInfo,
+        ContractInfoOption,
+        MinContractInfo,
+        MinDeviceType as ContractInfoMinDeviceType,
+        MinGroup as ContractInfoMinGroup,
+    )
+    from .coverage import (
+        CoverageBulkRequest,
+        CoverageBulkResponse,
+        CoverageBulkResult,
+        CoverageLocation,
+        CoveragePrediction,
+        CoverageRedundancy,
+    )
+    from .api_user import (
+        ApiUser,
+        ApiUserCreate,
+        ApiUserUpdate,
+        MinGroup as ApiUserMinGroup,
+        MinProfile,
+    )
+    from .base_station import (
+        BaseStation,
+        BaseStationSummary,
+        BaseStationUpdate,
+        MessageBaseStation,
+        MinBaseStation,
+    )
+    from .device import Device, DeviceCreate, DeviceType, DeviceUpdate
+    from .device_type import (
+        Contract,
+        DeviceType as DeviceTypeModel,
+        DeviceTypeCreate,
+        DeviceTypeUpdate,
+        Group as GroupRef,  # Renamed: minimal group ref nested in DeviceType
+    )
+    from .group import (
+        GeolocPayload,
+        Group,
+        GroupCallbackError,
+        GroupCreate,
+        GroupUpdate,
+        MinGroup,
+    )
+    from .message import DeviceInfo, Message
+    from .pagination import PaginatedResponse, Paging
+    from .operator import (
+        MinGroup as OperatorMinGroup,
+        Operator,
+    )
+    from .profile import (
+        MinGroup as ProfileMinGroup,
+        MinMetaRole,
+        MinRole as ProfileMinRole,
+        Profile,
+    )
+    from .user import (
+        MinGroup as UserMinGroup,
+        MinRole,
+        User,
+        UserCreate,
+        UserUpdate,
+    )
+
+# Exported name -> (submodule, name in that submodule)
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "ContractInfo": ("contract_info", "ContractInfo"),
+    "ContractInfoOption": ("contract_info", "ContractInfoOption"),
+    "MinContractInfo": ("contract_info", "MinContractInfo"),
+    "ContractInfoMinDeviceType": ("contract_info", "MinDeviceType"),
+    "ContractInfoMinGroup": ("contract_info", "MinGroup"),
+    "CoverageBulkRequest": ("coverage", "CoverageBulkRequest"),
+    "CoverageBulkResponse": ("coverage", "CoverageBulkResponse"),
+    "CoverageBulkResult": ("coverage", "CoverageBulkResult"),
+    "CoverageLocation": ("coverage", "CoverageLocation"),
+    "CoveragePrediction": ("coverage", "CoveragePrediction"),
+    "CoverageRedundancy": ("coverage", "CoverageRedundancy"),
+    "ApiUser": ("api_user", "ApiUser"),
+    "ApiUserCreate": ("api_user", "ApiUserCreate"),
+    "ApiUserUpdate": ("api_user", "ApiUserUpdate"),
+    "ApiUserMinGroup": ("api_user", "MinGroup"),
+    "MinProfile": ("api_user", "MinProfile"),
+    "BaseStation": ("base_station", "BaseStation"),
+    "BaseStationSummary": ("base_station", "BaseStationSummary"),
+    "BaseStationUpdate": ("base_station", "BaseStationUpdate"),
+    "MessageBaseStation": ("base_station", "MessageBaseStation"),
+    "MinBaseStation": ("base_station", "MinBaseStation"),
+    "Device": ("device", "Device"),
+    "DeviceCreate": ("device", "DeviceCreate"),
+    "DeviceType": ("device", "DeviceType"),
+    "DeviceUpdate": ("device", "DeviceUpdate"),
+    "Contract": ("device_type", "Contract"),
+    "DeviceTypeModel": ("device_type", "DeviceType"),
+    "DeviceTypeCreate": ("device_type", "DeviceTypeCreate"),
+    "DeviceTypeUpdate": ("device_type", "DeviceTypeUpdate"),
+    "GroupRef": ("device_type", "Group"),  # minimal group ref nested in DeviceType
+    "GeolocPayload": ("group", "GeolocPayload"),
+    "Group": ("group", "Group"),
+    "GroupCallbackError": ("group", "GroupCallbackError"),
+    "GroupCreate": ("group", "GroupCreate"),
+    "GroupUpdate": ("group", "GroupUpdate"),
+    "MinGroup": ("group", "MinGroup"),
+    "DeviceInfo": ("message", "DeviceInfo"),
+    "Message": ("message", "Message"),
+    "PaginatedResponse": ("pagination", "PaginatedResponse"),
+    "Paging": ("pagination", "Paging"),
+    "OperatorMinGroup": ("operator", "MinGroup"),
+    "Operator": ("operator", "Operator"),
+    "ProfileMinGroup": ("profile", "MinGroup"),
+    "MinMetaRole": ("profile", "MinMetaRole"),
+    "ProfileMinRole": ("profile", "MinRole"),
+    "Profile": ("profile", "Profile"),
+    "UserMinGroup": ("user", "MinGroup"),
+    "MinRole": ("user", "MinRole"),
+    "User": ("user", "User"),
+    "UserCreate": ("user", "UserCreate"),
+    "UserUpdate": ("user", "UserUpdate"),
+}
 
 __all__ = [
     # Contract Info models
@@ -86,6 +150,7 @@ __all__ = [
     "MinProfile",
     # Base Station models
     "BaseStation",
+    "BaseStationSummary",
     "BaseStationUpdate",
     "MessageBaseStation",
     "MinBaseStation",
@@ -128,3 +193,17 @@ __all__ = [
     "UserMinGroup",
     "MinRole",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,17 @@
+"""Models shared by several Sigfox API resources."""
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+
+class MinGroup(BaseModel):
+    """Minimal group reference (nested in most resource responses)."""
+
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
+
+    id: str | None = None
+    name: str | None = None
+    type: int | None = None
+    level: int | None = None
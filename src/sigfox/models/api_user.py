@@ -1,43 +1,43 @@
 """API user models for Sigfox API."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+from ._common import MinGroup
 
 
 class MinProfile(BaseModel):
     """Minimal profile reference (nested in API user responses)."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
     actions: list[str] | None = None
 
 
-class MinGroup(BaseModel):
-    """Minimal group reference (nested in API user responses)."""
-
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
-
-    id: str | None = None
-    name: str | None = None
-    type: int | None = None
-    level: int | None = None
-
-
 class ApiUser(BaseModel):
     """Sigfox API user (read response model).
 
     Maps to the 'apiUser' definition in the OpenAPI spec.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="allow",
+        populate_by_name=True,
+        frozen=True,
+        defer_build=True,
+    )
 
     id: str
     name: str | None = None
     timezone: str | None = None
     group: MinGroup | None = None
-    creation_time: int | None = Field(None, alias="creationTime")
-    access_token: str | None = Field(None, alias="accessToken")
+    creation_time: int | None = None
+    access_token: str | None = None
     profiles: list[MinProfile] | None = None
     actions: list[str] | None = None
     resources: list[str] | None = None
@@ -50,12 +50,14 @@ class ApiUserCreate(BaseModel):
     Required: groupId, name, timezone, profileIds.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
-    group_id: str = Field(alias="groupId")
+    group_id: str
     name: str
     timezone: str
-    profile_ids: list[str] = Field(alias="profileIds")
+    profile_ids: list[str]
 
 
 class ApiUserUpdate(BaseModel):
@@ -65,8 +67,10 @@ class ApiUserUpdate(BaseModel):
     All fields optional.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     name: str | None = None
     timezone: str | None = None
-    profile_ids: list[str] | None = Field(None, alias="profileIds")
+    profile_ids: list[str] | None = None
@@ -1,6 +1,7 @@
 """Base station models for Sigfox API."""
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
 
 
 class MinBaseStation(BaseModel):
@@ -9,7 +10,9 @@ class MinBaseStation(BaseModel):
     Used in various API responses where only basic base station info is needed.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -22,11 +25,13 @@ class MessageBaseStation(BaseModel):
     Used in device messages to indicate which base station received the message.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
-    resource_type: int | None = Field(None, alias="resourceType")
+    resource_type: int | None = None
 
 
 class BaseStation(BaseModel):
@@ -36,7 +41,13 @@ class BaseStation(BaseModel):
     Resource types: 0=SBS (Sigfox Base Station), 1=NAP (Network Access Point)
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="allow",
+        populate_by_name=True,
+        frozen=True,
+        defer_build=True,
+    )
 
     # Identity
     id: str
@@ -45,98 +56,121 @@ class BaseStation(BaseModel):
     # Location
     lat: float | None = None
     lng: float | None = None
-    location_country: str | None = Field(None, alias="locationCountry")
+    location_country: str | None = None
 
     # Group
     group: dict | None = None
 
     # Versioning
-    version_current: str | None = Field(None, alias="versionCurrent")
-    hw_version: str | None = Field(None, alias="hwVersion")
-    hw_family: str | None = Field(None, alias="hwFamily")
+    version_current: str | None = None
+    hw_version: str | None = None
+    hw_family: str | None = None
 
     # Commissioning
-    first_commissioning_time: int | None = Field(None, alias="firstCommissioningTime")
-    commissioning_time: int | None = Field(None, alias="commissioningTime")
-    decommissioning_time: int | None = Field(None, alias="decommissioningTime")
-    operating_days: int | None = Field(None, alias="operatingDays")
+    first_commissioning_time: int | None = None
+    commissioning_time: int | None = None
+    decommissioning_time: int | None = None
+    operating_days: int | None = None
 
     # Warranty
-    manufacturer_delivery_time: int | None = Field(None, alias="manufacturerDeliveryTime")
-    warranty_time: int | None = Field(None, alias="warrantyTime")
+    manufacturer_delivery_time: int | None = None
+    warranty_time: int | None = None
 
     # Communication
-    last_communication_time: int | None = Field(None, alias="lastCommunicationTime")
-    last_ping_time: int | None = Field(None, alias="lastPingTime")
-    connection_type: int | None = Field(None, alias="connectionType")
+    last_communication_time: int | None = None
+    last_ping_time: int | None = None
+    connection_type: int | None = None
 
     # Status
-    communication_state: int | None = Field(None, alias="communicationState")
+    communication_state: int | None = None
     state: int | None = None
-    lifecycle_status: int | None = Field(None, alias="lifecycleStatus")
+    lifecycle_status: int | None = None
 
     # Configuration
     description: str | None = None
-    keep_alive: int | None = Field(None, alias="keepAlive")
+    keep_alive: int | None = None
     installer: str | None = None
     elevation: float | None = None
-    splat_radius: float | None = Field(None, alias="splatRadius")
+    splat_radius: float | None = None
 
     # Features
     muted: bool | None = None
-    transmission_authorized: bool | None = Field(None, alias="transmissionAuthorized")
-    downlink_enabled: bool | None = Field(None, alias="downlinkEnabled")
-    global_coverage_enable: bool | None = Field(None, alias="globalCoverageEnable")
+    transmission_authorized: bool | None = None
+    downlink_enabled: bool | None = None
+    global_coverage_enable: bool | None = None
 
     # Audit
-    creation_time: int | None = Field(None, alias="creationTime")
-    created_by: str | None = Field(None, alias="createdBy")
-    last_edition_time: int | None = Field(None, alias="lastEditionTime")
-    last_edited_by: str | None = Field(None, alias="lastEditedBy")
+    creation_time: int | None = None
+    created_by: str | None = None
+    last_edition_time: int | None = None
+    last_edited_by: str | None = None
 
     # RF Configuration
-    base_frequency: int | None = Field(None, alias="baseFrequency")
-    downlink_center_frequency: int | None = Field(None, alias="downlinkCenterFrequency")
-    macro_channel: int | None = Field(None, alias="macroChannel")
-    tx_power_amplification: float | None = Field(None, alias="txPowerAmplification")
+    base_frequency: int | None = None
+    downlink_center_frequency: int | None = None
+    macro_channel: int | None = None
+    tx_power_amplification: float | None = None
     protocol: int | None = None
-    pre_amp1: int | None = Field(None, alias="preAmp1")
-    pre_amp2: int | None = Field(None, alias="preAmp2")
+    pre_amp1: int | None = None
+    pre_amp2: int | None = None
     ram_log: int | None = Field(None, alias="RAMLog")
-    wwan_mode: int | None = Field(None, alias="wwanMode")
-    bit_rate: int | None = Field(None, alias="bitRate")
+    wwan_mode: int | None = None
+    bit_rate: int | None = None
 
     # Equipment
-    mast_equipment: int | None = Field(None, alias="mastEquipment")
-    mast_equipment_description: str | None = Field(None, alias="mastEquipmentDescription")
-    lna_by_pass: bool | None = Field(None, alias="lnaByPass")
-    cavity_filter_version: int | None = Field(None, alias="cavityFilterVersion")
-    cavity_filter_version_description: str | None = Field(None, alias="cavityFilterVersionDescription")
+    mast_equipment: int | None = None
+    mast_equipment_description: str | None = None
+    lna_by_pass: bool | None = None
+    cavity_filter_version: int | None = None
+    cavity_filter_version_description: str | None = None
 
     # Antenna Properties
-    antenna_gain: float | None = Field(None, alias="antennaGain")
-    antenna_noise_figure: float | None = Field(None, alias="antennaNoiseFigure")
-    antenna_insertion_loss: float | None = Field(None, alias="antennaInsertionLoss")
-    antenna_max_admissible_power: float | None = Field(None, alias="antennaMaxAdmissiblePower")
+    antenna_gain: float | None = None
+    antenna_noise_figure: float | None = None
+    antenna_insertion_loss: float | None = None
+    antenna_max_admissible_power: float | None = None
 
     # RF Loss/Gain
-    environment_loss: float | None = Field(None, alias="environmentLoss")
-    cable_loss: float | None = Field(None, alias="cableLoss")
-    gain_flag: bool | None = Field(None, alias="gainFlag")
-    mast_equipment_gain: float | None = Field(None, alias="mastEquipmentGain")
-    mast_equipment_noise_figure: float | None = Field(None, alias="mastEquipmentNoiseFigure")
-    lna_insertion_loss: float | None = Field(None, alias="lnaInsertionLoss")
-    cavity_filter_insertion_loss: float | None = Field(None, alias="cavityFilterInsertionLoss")
-    tx_power_margin: float | None = Field(None, alias="txPowerMargin")
+    environment_loss: float | None = None
+    cable_loss: float | None = None
+    gain_flag: bool | None = None
+    mast_equipment_gain: float | None = None
+    mast_equipment_noise_figure: float | None = None
+    lna_insertion_loss: float | None = None
+    cavity_filter_insertion_loss: float | None = None
+    tx_power_margin: float | None = None
 
     # Optional
     antenna: dict | None = None
-    monarch_beacon_enabled: bool | None = Field(None, alias="monarchBeaconEnabled")
-    service_coverage: str | None = Field(None, alias="serviceCoverage")
+    monarch_beacon_enabled: bool | None = None
+    service_coverage: str | None = None
 
     # Queue
-    queue_in: int | None = Field(None, alias="queueIn")
-    queue_out: int | None = Field(None, alias="queueOut")
+    queue_in: int | None = None
+    queue_out: int | None = None
+
+
+class BaseStationSummary(BaseModel):
+    """Commonly displayed subset of a base station.
+
+    Used by list endpoints so that only a handful of fields are validated per
+    item; other keys in the response are ignored. Use BaseStation for the
+    complete set of properties.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="ignore",
+        populate_by_name=True,
+        frozen=True,
+        defer_build=True,
+    )
+
+    id: str
+    name: str | None = None
+    state: int | None = None
+    lat: float | None = None
+    lng: float | None = None
 
 
 class BaseStationUpdate(BaseModel):
@@ -146,27 +180,29 @@ class BaseStationUpdate(BaseModel):
     All fields are optional (PUT only updates provided fields).
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     name: str | None = None
     description: str | None = None
-    base_station_alert_time: int | None = Field(None, alias="baseStationAlertTime")
-    transmission_authorized: bool | None = Field(None, alias="transmissionAuthorized")
+    base_station_alert_time: int | None = None
+    transmission_authorized: bool | None = None
     installer: str | None = None
-    global_coverage_enable: bool | None = Field(None, alias="globalCoverageEnable")
+    global_coverage_enable: bool | None = None
     elevation: float | None = None
-    splat_radius: float | None = Field(None, alias="splatRadius")
-    mast_equipment: int | None = Field(None, alias="mastEquipment")
-    mast_equipment_description: str | None = Field(None, alias="mastEquipmentDescription")
-    lna_by_pass: bool | None = Field(None, alias="lnaByPass")
-    cavity_filter_version: int | None = Field(None, alias="cavityFilterVersion")
-    cavity_filter_version_description: str | None = Field(None, alias="cavityFilterVersionDescription")
-    environment_loss: float | None = Field(None, alias="environmentLoss")
-    cable_loss: float | None = Field(None, alias="cableLoss")
-    antenna_gain: float | None = Field(None, alias="antennaGain")
-    antenna_noise_figure: float | None = Field(None, alias="antennaNoiseFigure")
-    antenna_insertion_loss: float | None = Field(None, alias="antennaInsertionLoss")
-    antenna_max_admissible_power: float | None = Field(None, alias="antennaMaxAdmissiblePower")
-    service_coverage: str | None = Field(None, alias="serviceCoverage")
+    splat_radius: float | None = None
+    mast_equipment: int | None = None
+    mast_equipment_description: str | None = None
+    lna_by_pass: bool | None = None
+    cavity_filter_version: int | None = None
+    cavity_filter_version_description: str | None = None
+    environment_loss: float | None = None
+    cable_loss: float | None = None
+    antenna_gain: float | None = None
+    antenna_noise_figure: float | None = None
+    antenna_insertion_loss: float | None = None
+    antenna_max_admissible_power: float | None = None
+    service_coverage: str | None = None
     antenna: dict | None = None
-    monarch_beacon_enabled: bool | None = Field(None, alias="monarchBeaconEnabled")
+    monarch_beacon_enabled: bool | None = None
@@ -1,12 +1,15 @@
 """Contract info models for Sigfox API."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class MinGroup(BaseModel):
     """Minimal group reference (nested in contract info responses)."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -19,17 +22,21 @@ class MinGroup(BaseModel):
 class MinDeviceType(BaseModel):
     """Minimal device type reference (nested in contract info responses)."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
-    project_id: str | None = Field(None, alias="projectId")
+    project_id: str | None = None
 
 
 class MinContractInfo(BaseModel):
     """Minimal contract info reference (e.g. for 'order' field)."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -40,7 +47,9 @@ class MinContractInfo(BaseModel):
 class ContractInfoOption(BaseModel):
     """A premium option activated in a contract."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     parameters: dict | None = None
@@ -53,42 +62,42 @@ class ContractInfo(BaseModel):
     Combines fields from 'commonContractInfo' and 'contractInfo'.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
 
     # From commonContractInfo
-    activation_end_time: int | None = Field(None, alias="activationEndTime")
-    communication_end_time: int | None = Field(None, alias="communicationEndTime")
+    activation_end_time: int | None = None
+    communication_end_time: int | None = None
     bidir: bool | None = None
-    high_priority_downlink: bool | None = Field(None, alias="highPriorityDownlink")
-    max_uplink_frames: int | None = Field(None, alias="maxUplinkFrames")
-    max_downlink_frames: int | None = Field(None, alias="maxDownlinkFrames")
-    max_tokens: int | None = Field(None, alias="maxTokens")
-    automatic_renewal: bool | None = Field(None, alias="automaticRenewal")
-    renewal_duration: int | None = Field(None, alias="renewalDuration")
+    high_priority_downlink: bool | None = None
+    max_uplink_frames: int | None = None
+    max_downlink_frames: int | None = None
+    max_tokens: int | None = None
+    automatic_renewal: bool | None = None
+    renewal_duration: int | None = None
     options: list[ContractInfoOption] | None = None
 
     # From contractInfo
-    contract_id: str | None = Field(None, alias="contractId")
-    user_id: str | None = Field(None, alias="userId")
+    contract_id: str | None = None
+    user_id: str | None = None
     group: MinGroup | None = None
     order: MinContractInfo | None = None
-    pricing_model: int | None = Field(None, alias="pricingModel")
-    created_by: str | None = Field(None, alias="createdBy")
-    last_edition_time: int | None = Field(None, alias="lastEditionTime")
-    creation_time: int | None = Field(None, alias="creationTime")
-    last_edited_by: str | None = Field(None, alias="lastEditedBy")
-    start_time: int | None = Field(None, alias="startTime")
+    pricing_model: int | None = None
+    created_by: str | None = None
+    last_edition_time: int | None = None
+    creation_time: int | None = None
+    last_edited_by: str | None = None
+    start_time: int | None = None
     timezone: str | None = None
-    subscription_plan: int | None = Field(None, alias="subscriptionPlan")
-    token_duration: int | None = Field(None, alias="tokenDuration")
-    blacklisted_territories: list[MinGroup] | None = Field(
-        None, alias="blacklistedTerritories"
-    )
-    tokens_in_use: int | None = Field(None, alias="tokensInUse")
-    tokens_used: int | None = Field(None, alias="tokensUsed")
-    device_type: MinDeviceType | None = Field(None, alias="deviceType")
+    subscription_plan: int | None = None
+    token_duration: int | None = None
+    blacklisted_territories: list[MinGroup] | None = None
+    tokens_in_use: int | None = None
+    tokens_used: int | None = None
+    device_type: MinDeviceType | None = None
     actions: list[str] | None = None
     resources: list[str] | None = None
@@ -1,12 +1,15 @@
 """Coverage models for Sigfox API."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class CoverageLocation(BaseModel):
     """A single lat/lng coordinate for bulk coverage requests."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     lat: float
     lng: float
@@ -21,30 +24,36 @@ class CoveragePrediction(BaseModel):
     margins[2] = margin for 3+ base station redundancy
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
-    location_covered: bool | None = Field(None, alias="locationCovered")
+    location_covered: bool | None = None
     margins: list[int] | None = None
 
 
 class CoverageBulkRequest(BaseModel):
     """Request body for POST /coverages/global/predictions/bulk."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     locations: list[CoverageLocation]
     radius: int | None = None
-    group_id: str | None = Field(None, alias="groupId")
+    group_id: str | None = None
 
 
 class CoverageBulkResult(BaseModel):
     """Coverage prediction result for one location in a bulk response."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     lat: float | None = None
     lng: float | None = None
-    location_covered: bool | None = Field(None, alias="locationCovered")
+    location_covered: bool | None = None
     margins: list[int] | None = None
 
 
@@ -54,9 +63,11 @@ class CoverageBulkResponse(BaseModel):
     jobDone is False if the job is still processing.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
-    job_done: bool | None = Field(None, alias="jobDone")
+    job_done: bool | None = None
     time: int | None = None
     results: list[CoverageBulkResult] | None = None
 
@@ -68,6 +79,8 @@ class CoverageRedundancy(BaseModel):
     redundancy: 0=no coverage, 1=1 BS, 2=2 BSs, 3=3+ BSs
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     redundancy: int | None = None
@@ -1,14 +1,15 @@
 """Device models for Sigfox API."""
 
-from typing import Any
-
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class DeviceType(BaseModel):
     """Nested device type information."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -17,22 +18,24 @@ class DeviceType(BaseModel):
 class Device(BaseModel):
     """Sigfox device."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str
     name: str | None = None
-    device_type: DeviceType | None = Field(None, alias="deviceType")
+    device_type: DeviceType | None = None
     state: int | None = None
-    com_state: int | None = Field(None, alias="comState")
-    last_com: int | None = Field(None, alias="lastCom")
-    creation_time: int | None = Field(None, alias="creationTime")
-    activation_time: int | None = Field(None, alias="activationTime")
+    com_state: int | None = None
+    last_com: int | None = None
+    creation_time: int | None = None
+    activation_time: int | None = None
     pac: str | None = None
-    sequence_number: int | None = Field(None, alias="sequenceNumber")
+    sequence_number: int | None = None
     lqi: int | None = None
-    satellite_capable: bool | None = Field(None, alias="satelliteCapable")
+    satellite_capable: bool | None = None
     repeater: bool | None = None
-    automatic_renewal: bool | None = Field(None, alias="automaticRenewal")
+    automatic_renewal: bool | None = None
     lat: float | None = None
     lng: float | None = None
     prototype: bool | None = None
@@ -42,29 +45,33 @@ class Device(BaseModel):
 class DeviceCreate(BaseModel):
     """Data for creating a new device."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str
     name: str
-    device_type_id: str = Field(alias="deviceTypeId")
+    device_type_id: str
     pac: str
     lat: float | None = None
     lng: float | None = None
-    product_certificate: str | None = Field(None, alias="productCertificate")
+    product_certificate: str | None = None
     prototype: bool | None = None
-    automatic_renewal: bool | None = Field(None, alias="automaticRenewal")
+    automatic_renewal: bool | None = None
     activable: bool | None = None
 
 
 class DeviceUpdate(BaseModel):
     """Data for updating a device."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     name: str | None = None
     lat: float | None = None
     lng: float | None = None
-    product_certificate: str | None = Field(None, alias="productCertificate")
+    product_certificate: str | None = None
     prototype: bool | None = None
-    automatic_renewal: bool | None = Field(None, alias="automaticRenewal")
+    automatic_renewal: bool | None = None
     activable: bool | None = None
@@ -1,14 +1,15 @@
 """Device type models for Sigfox API."""
 
-from typing import Any
-
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class Group(BaseModel):
     """Nested group information."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -17,7 +18,9 @@ class Group(BaseModel):
 class Contract(BaseModel):
     """Nested contract information."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -26,52 +29,59 @@ class Contract(BaseModel):
 class DeviceType(BaseModel):
     """Sigfox device type."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str
     name: str | None = None
     description: str | None = None
     group: Group | None = None
     contract: Contract | None = None
-    keep_alive: int | None = Field(None, alias="keepAlive")
-    alert_email: str | None = Field(None, alias="alertEmail")
-    payload_type: int | None = Field(None, alias="payloadType")
-    payload_config: str | None = Field(None, alias="payloadConfig")
-    downlink_mode: int | None = Field(None, alias="downlinkMode")
-    downlink_data_string: str | None = Field(None, alias="downlinkDataString")
-    automatic_renewal: bool | None = Field(None, alias="automaticRenewal")
-    creation_time: int | None = Field(None, alias="creationTime")
-    last_edited_time: int | None = Field(None, alias="lastEditedTime")
+    keep_alive: int | None = None
+    alert_email: str | None = None
+    payload_type: int | None = None
+    payload_config: str | None = None
+    downlink_mode: int | None = None
+    downlink_data_string: str | None = None
+    automatic_renewal: bool | None = None
+    creation_time: int | None = None
+    last_edited_time: int | None = None
 
 
 class DeviceTypeCreate(BaseModel):
     """Data for creating a new device type."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     name: str
-    group_id: str = Field(alias="groupId")
+    group_id: str
     description: str | None = None
-    keep_alive: int | None = Field(None, alias="keepAlive")
-    alert_email: str | None = Field(None, alias="alertEmail")
-    payload_type: int | None = Field(None, alias="payloadType")
-    payload_config: str | None = Field(None, alias="payloadConfig")
-    downlink_mode: int | None = Field(None, alias="downlinkMode")
-    downlink_data_string: str | None = Field(None, alias="downlinkDataString")
-    automatic_renewal: bool | None = Field(None, alias="automaticRenewal")
+    keep_alive: int | None = None
+    alert_email: str | None = None
+    payload_type: int | None = None
+    payload_config: str | None = None
+    downlink_mode: int | None = None
+    downlink_data_string: str | None = None
+    automatic_renewal: bool | None = None
+    contract_id: str | None = None
 
 
 class DeviceTypeUpdate(BaseModel):
     """Data for updating a device type."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     name: str | None = None
     description: str | None = None
-    keep_alive: int | None = Field(None, alias="keepAlive")
-    alert_email: str | None = Field(None, alias="alertEmail")
-    payload_type: int | None = Field(None, alias="payloadType")
-    payload_config: str | None = Field(None, alias="payloadConfig")
-    downlink_mode: int | None = Field(None, alias="downlinkMode")
-    downlink_data_string: str | None = Field(None, alias="downlinkDataString")
-    automatic_renewal: bool | None = Field(None, alias="automaticRenewal")
+    keep_alive: int | None = None
+    alert_email: str | None = None
+    payload_type: int | None = None
+    payload_config: str | None = None
+    downlink_mode: int | None = None
+    downlink_data_string: str | None = None
+    automatic_renewal: bool | None = None
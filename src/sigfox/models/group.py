@@ -1,17 +1,9 @@
 """Group models for Sigfox API."""
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
 
-
-class MinGroup(BaseModel):
-    """Minimal group reference (used in path arrays)."""
-
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
-
-    id: str | None = None
-    name: str | None = None
-    type: int | None = None
-    level: int | None = None
+from ._common import MinGroup
 
 
 class Group(BaseModel):
@@ -23,7 +15,13 @@ class Group(BaseModel):
       7=NIP, 8=DIST, 9=Channel, 10=Starter, 11=Partner
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        extra="allow",
+        populate_by_name=True,
+        frozen=True,
+        defer_build=True,
+    )
 
     id: str
     name: str | None = None
@@ -32,20 +30,20 @@ class Group(BaseModel):
     timezone: str | None = None
     name_ci: str | None = Field(None, alias="nameCI")
     path: list[MinGroup] | None = None
-    created_by: str | None = Field(None, alias="createdBy")
-    creation_time: int | None = Field(None, alias="creationTime")
+    created_by: str | None = None
+    creation_time: int | None = None
     leaf: bool | None = None
     actions: list[str] | None = None
-    is_account: bool | None = Field(None, alias="isAccount")
+    is_account: bool | None = None
     # Fields from billableGroup (present on Basic, Partners, Channel, etc.)
     billable: bool | None = None
-    technical_email: str | None = Field(None, alias="technicalEmail")
-    max_prototype_allowed: int | None = Field(None, alias="maxPrototypeAllowed")
-    current_prototype_count: int | None = Field(None, alias="currentPrototypeCount")
+    technical_email: str | None = None
+    max_prototype_allowed: int | None = None
+    current_prototype_count: int | None = None
     # Fields from SO/NIP subtypes
     country_iso_alpha3: str | None = Field(None, alias="countryISOAlpha3")
     # Fields from SVNO/DIST subtypes
-    network_operator_id: str | None = Field(None, alias="networkOperatorId")
+    network_operator_id: str | None = None
 
 
 class GroupCreate(BaseModel):
@@ -55,21 +53,23 @@ class GroupCreate(BaseModel):
     Required: name, description, type, timezone, parentId.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     name: str
     description: str
     type: int
     timezone: str
-    parent_id: str = Field(alias="parentId")
-    technical_email: str | None = Field(None, alias="technicalEmail")
-    account_id: str | None = Field(None, alias="accountId")
+    parent_id: str
+    technical_email: str | None = None
+    account_id: str | None = None
     # Optional subtype-specific fields
-    network_operator_id: str | None = Field(None, alias="networkOperatorId")
+    network_operator_id: str | None = None
     country_iso_alpha3: str | None = Field(None, alias="countryISOAlpha3")
     # Billable group fields
     billable: bool | None = None
-    max_prototype_allowed: int | None = Field(None, alias="maxPrototypeAllowed")
+    max_prototype_allowed: int | None = None
 
 
 class GroupUpdate(BaseModel):
@@ -79,7 +79,9 @@ class GroupUpdate(BaseModel):
     All fields optional (PUT only updates provided fields).
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     name: str | None = None
     description: str | None = None
@@ -87,8 +89,8 @@ class GroupUpdate(BaseModel):
     timezone: str | None = None
     # Billable group fields
     billable: bool | None = None
-    technical_email: str | None = Field(None, alias="technicalEmail")
-    max_prototype_allowed: int | None = Field(None, alias="maxPrototypeAllowed")
+    technical_email: str | None = None
+    max_prototype_allowed: int | None = None
 
 
 class GroupCallbackError(BaseModel):
@@ -97,11 +99,13 @@ class GroupCallbackError(BaseModel):
     Maps to 'groupErrorMessages' in the OpenAPI spec.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     device: str | None = None
-    device_url: str | None = Field(None, alias="deviceUrl")
-    device_type: str | None = Field(None, alias="deviceType")
+    device_url: str | None = None
+    device_type: str | None = None
     time: int | None = None
     data: str | None = None
     snr: str | None = None
@@ -117,7 +121,9 @@ class GeolocPayload(BaseModel):
     Maps to 'baseGeolocation' in the OpenAPI spec.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
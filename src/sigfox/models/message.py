@@ -1,12 +1,15 @@
 """Message models for Sigfox API."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class DeviceInfo(BaseModel):
     """Nested device information in message."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -15,14 +18,16 @@ class DeviceInfo(BaseModel):
 class Message(BaseModel):
     """Sigfox message."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     time: int | None = None
     device: DeviceInfo | None = None
     data: str | None = None
-    seq_number: int | None = Field(None, alias="seqNumber")
+    seq_number: int | None = None
     lqi: int | None = None
-    nb_frames: int | None = Field(None, alias="nbFrames")
+    nb_frames: int | None = None
     operator: str | None = None
     country: str | None = None
-    computed_location: dict | None = Field(None, alias="computedLocation")
+    computed_location: dict | None = None
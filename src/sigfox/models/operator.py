@@ -1,17 +1,9 @@
 """Operator models for Sigfox API."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
-
-class MinGroup(BaseModel):
-    """Minimal group reference (nested in operator responses)."""
-
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
-
-    id: str | None = None
-    name: str | None = None
-    type: int | None = None
-    level: int | None = None
+from ._common import MinGroup
 
 
 class Operator(BaseModel):
@@ -21,13 +13,15 @@ class Operator(BaseModel):
     Operators represent Sigfox Network Operators (SNOs).
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str
     name: str | None = None
     group: MinGroup | None = None
-    host_operator: bool | None = Field(None, alias="hostOperator")
-    contract_id: str | None = Field(None, alias="contractId")
-    creation_time: int | None = Field(None, alias="creationTime")
+    host_operator: bool | None = None
+    contract_id: str | None = None
+    creation_time: int | None = None
     actions: list[str] | None = None
     resources: list[str] | None = None
@@ -3,6 +3,7 @@
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
 
 T = TypeVar("T")
 
@@ -10,7 +11,9 @@ T = TypeVar("T")
 class Paging(BaseModel):
     """Pagination information."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     next: str | None = None
     previous: str | None = Field(None, alias="prev")
@@ -19,7 +22,9 @@ class Paging(BaseModel):
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated API response."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     data: list[T]
     paging: Paging | None = None
@@ -1,12 +1,17 @@
 """Profile models for Sigfox API."""
 
 from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+from ._common import MinGroup
 
 
 class MinMetaRole(BaseModel):
     """Minimal role reference within a role's path."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
@@ -15,24 +20,15 @@ class MinMetaRole(BaseModel):
 class MinRole(BaseModel):
     """Minimal role reference (nested in profile responses)."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
     path: list[MinMetaRole] | None = None
 
 
-class MinGroup(BaseModel):
-    """Minimal group reference (nested in profile responses)."""
-
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
-
-    id: str | None = None
-    name: str | None = None
-    type: int | None = None
-    level: int | None = None
-
-
 class Profile(BaseModel):
     """Sigfox profile (read response model).
 
@@ -40,7 +36,9 @@ class Profile(BaseModel):
     Profiles define sets of roles that can be assigned to API users.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str
     name: str | None = None
@@ -1,29 +1,23 @@
 """User models for Sigfox API."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+from ._common import MinGroup
 
 
 class MinRole(BaseModel):
     """Minimal role reference (nested in user responses)."""
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str | None = None
     name: str | None = None
     path: list[dict] | None = None
 
 
-class MinGroup(BaseModel):
-    """Minimal group reference (nested in user responses)."""
-
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
-
-    id: str | None = None
-    name: str | None = None
-    type: int | None = None
-    level: int | None = None
-
-
 class User(BaseModel):
     """Sigfox user (read response model).
 
@@ -31,17 +25,19 @@ class User(BaseModel):
     These are human portal users, distinct from API users.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
     id: str
-    first_name: str | None = Field(None, alias="firstName")
-    last_name: str | None = Field(None, alias="lastName")
+    first_name: str | None = None
+    last_name: str | None = None
     email: str | None = None
     timezone: str | None = None
-    creation_time: int | None = Field(None, alias="creationTime")
-    last_login_time: int | None = Field(None, alias="lastLoginTime")
+    creation_time: int | None = None
+    last_login_time: int | None = None
     group: MinGroup | None = None
-    user_roles: list[MinRole] | None = Field(None, alias="userRoles")
+    user_roles: list[MinRole] | None = None
     actions: list[str] | None = None
     resources: list[str] | None = None
 
@@ -53,14 +49,16 @@ class UserCreate(BaseModel):
     Required: groupId, firstName, lastName, email, timezone, roleIds.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
-    group_id: str = Field(alias="groupId")
-    first_name: str = Field(alias="firstName")
-    last_name: str = Field(alias="lastName")
+    group_id: str
+    first_name: str
+    last_name: str
     email: str
     timezone: str
-    role_ids: list[str] = Field(alias="roleIds")
+    role_ids: list[str]
 
 
 class UserUpdate(BaseModel):
@@ -70,10 +68,12 @@ class UserUpdate(BaseModel):
     All fields optional.
     """
 
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(
+        alias_generator=to_camel, extra="allow", populate_by_name=True, defer_build=True
+    )
 
-    first_name: str | None = Field(None, alias="firstName")
-    last_name: str | None = Field(None, alias="lastName")
+    first_name: str | None = None
+    last_name: str | None = None
     email: str | None = None
     timezone: str | None = None
-    role_ids: list[str] | None = Field(None, alias="roleIds")
+    role_ids: list[str] | None = None
@@ -1,6 +1,29 @@
 """Sigfox API client facade."""
 
-from .api import ApiUsersAPI, BaseStationsAPI, ContractInfosAPI, CoveragesAPI, DevicesAPI, DeviceTypesAPI, GroupsAPI, OperatorsAPI, ProfilesAPI, UsersAPI
+from .api import (
+    ApiUsersAPI,
+    AsyncApiUsersAPI,
+    AsyncBaseStationsAPI,
+    AsyncContractInfosAPI,
+    AsyncCoveragesAPI,
+    AsyncDevicesAPI,
+    AsyncDeviceTypesAPI,
+    AsyncGroupsAPI,
+    AsyncOperatorsAPI,
+    AsyncProfilesAPI,
+    AsyncUsersAPI,
+    BaseStationsAPI,
+    ContractInfosAPI,
+    CoveragesAPI,
+    DevicesAPI,
+    DeviceTypesAPI,
+    GroupsAPI,
+    OperatorsAPI,
+    ProfilesAPI,
+    UsersAPI,
+)
+from ._cache import ResponseCache
+from .async_client import AsyncSigfoxClient
 from .client import SigfoxClient
 
 
@@ -17,12 +40,30 @@ class Sigfox:
         ...     print(device.id, device.name)
     """
 
+    __slots__ = (
+        "_client",
+        "api_users",
+        "base_stations",
+        "contract_infos",
+        "coverages",
+        "devices",
+        "device_types",
+        "groups",
+        "operators",
+        "profiles",
+        "users",
+    )
+
     def __init__(
         self,
         login: str,
         password: str,
         base_url: str = "https://api.sigfox.com/v2",
         timeout: int = 30,
+        cache_ttl: float = 60,
+        http2: bool = False,
+        response_cache: ResponseCache | None = None,
+        etag_cache: bool = False,
     ):
         """Initialize Sigfox API client.
 
@@ -31,12 +72,22 @@ class Sigfox:
             password: Sigfox API password (secret)
             base_url: API base URL
             timeout: Request timeout in seconds
+            cache_ttl: Lifetime in seconds of cached GET responses (0 disables caching)
+            http2: Negotiate HTTP/2 (requires the ``http2`` extra)
+            response_cache: Store for cached GET responses replacing the
+                in-process cache (see SigfoxClient)
+            etag_cache: Revalidate repeated GETs with their stored ETag (keeps
+                response bodies in memory; see SigfoxClient)
         """
         self._client = SigfoxClient(
             api_login=login,
             api_password=password,
             base_url=base_url,
             timeout=timeout,
+            cache_ttl=cache_ttl,
+            http2=http2,
+            response_cache=response_cache,
+            etag_cache=etag_cache,
         )
         self.api_users = ApiUsersAPI(self._client)
         self.base_stations = BaseStationsAPI(self._client)
@@ -60,3 +111,79 @@ class Sigfox:
     def close(self):
         """Close the underlying HTTP client."""
         self._client.close()
+
+
+class AsyncSigfox:
+    """High-level asynchronous Sigfox API client.
+
+    Exposes coroutine versions of the read operations so that independent
+    requests can be issued concurrently.
+
+    Example:
+        >>> async with AsyncSigfox(login="api_login", password="api_password") as client:
+        ...     devices = await client.devices.list(limit=10)
+        ...     messages = await asyncio.gather(
+        ...         *(client.devices.messages(d.id) for d in devices)
+        ...     )
+    """
+
+    __slots__ = (
+        "_client",
+        "api_users",
+        "base_stations",
+        "contract_infos",
+        "coverages",
+        "devices",
+        "device_types",
+        "groups",
+        "operators",
+        "profiles",
+        "users",
+    )
+
+    def __init__(
+        self,
+        login: str,
+        password: str,
+        base_url: str = "https://api.sigfox.com/v2",
+        timeout: int = 30,
+        http2: bool = False,
+    ):
+        """Initialize asynchronous Sigfox API client.
+
+        Args:
+            login: Sigfox API login (ID)
+            password: Sigfox API password (secret)
+            base_url: API base URL
+            timeout: Request timeout in seconds
+            http2: Negotiate HTTP/2 (requires the ``http2`` extra)
+        """
+        self._client = AsyncSigfoxClient(
+            api_login=login,
+            api_password=password,
+            base_url=base_url,
+            timeout=timeout,
+            http2=http2,
+        )
+        self.api_users = AsyncApiUsersAPI(self._client)
+        self.base_stations = AsyncBaseStationsAPI(self._client)
+        self.contract_infos = AsyncContractInfosAPI(self._client)
+        self.coverages = AsyncCoveragesAPI(self._client)
+        self.devices = AsyncDevicesAPI(self._client)
+        self.device_types = AsyncDeviceTypesAPI(self._client)
+        self.groups = AsyncGroupsAPI(self._client)
+        self.operators = AsyncOperatorsAPI(self._client)
+        self.profiles = AsyncProfilesAPI(self._client)
+        self.users = AsyncUsersAPI(self._client)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP client."""
+        await self._client.close()
@@ -1,30 +1,98 @@
 """Main CLI application."""
 
+from importlib import import_module
+
 import click
 
-from .commands import api_users, base_stations, config_cmd, contract_infos, coverages, device_types, devices, groups, operators, profiles, users
 
+class LazyGroup(click.Group):
+    """Click group that imports its subcommand modules on first use.
+
+    Only the module of the invoked command (and the models it needs) is
+    imported, instead of the whole command tree at startup.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_commands: dict[str, str] | None = None,
+        lazy_help: dict[str, str] | None = None,
+        **kwargs,
+    ):
+        """Initialize the group.
+
+        Args:
+            lazy_commands: Command name -> "module:attribute" import path,
+                relative to this package
+            lazy_help: Command name -> short help shown in --help, so listing
+                the commands does not import their modules
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
 
-@click.group()
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module, attr = self.lazy_commands[cmd_name].split(":")
+            self.add_command(getattr(import_module(module, __package__), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(map(len, names))
+        rows = []
+        for name in names:
+            if name in self.lazy_help and name not in self.commands:
+                rows.append((name, self.lazy_help[name]))
+                continue
+            cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "api-users": ".commands.api_users:api_users",
+        "base-stations": ".commands.base_stations:base_stations",
+        "config": ".commands.config_cmd:config",
+        "contract-infos": ".commands.contract_infos:contract_infos",
+        "coverages": ".commands.coverages:coverages",
+        "devices": ".commands.devices:devices",
+        "device-types": ".commands.device_types:device_types",
+        "groups": ".commands.groups:groups",
+        "operators": ".commands.operators:operators",
+        "profiles": ".commands.profiles:profiles",
+        "shell": ".commands.shell:shell",
+        "users": ".commands.users:users",
+    },
+    lazy_help={
+        "api-users": "Manage Sigfox API users.",
+        "base-stations": "Manage Sigfox base stations.",
+        "config": "Manage Sigfox CLI configuration.",
+        "contract-infos": "Manage Sigfox contract infos (subscriptions).",
+        "coverages": "Query Sigfox coverage predictions.",
+        "devices": "Manage Sigfox devices.",
+        "device-types": "Manage Sigfox device types.",
+        "groups": "Manage Sigfox groups.",
+        "operators": "Manage Sigfox operators (network operators).",
+        "profiles": "Manage Sigfox profiles.",
+        "shell": "Run several commands over one shared API connection.",
+        "users": "Manage Sigfox users (portal users).",
+    },
+)
 @click.version_option(version="0.1.0", prog_name="sigfox")
 def cli():
     """Sigfox CLI - Command-line tool for Sigfox API v2."""
     pass
 
 
-# Register command groups
-cli.add_command(api_users.api_users)
-cli.add_command(base_stations.base_stations)
-cli.add_command(config_cmd.config)
-cli.add_command(contract_infos.contract_infos)
-cli.add_command(coverages.coverages)
-cli.add_command(devices.devices)
-cli.add_command(device_types.device_types)
-cli.add_command(groups.groups)
-cli.add_command(operators.operators)
-cli.add_command(profiles.profiles)
-cli.add_command(users.users)
-
-
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,111 @@
+"""On-disk cache of GET responses shared between CLI invocations."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory path (not created until something is cached)."""
+    return Path(os.path.expanduser("~")) / ".cache" / "sigfox-cli"
+
+
+class DiskCache:
+    """TTL cache of GET response bodies stored as one file per request.
+
+    Implements the SDK's ResponseCache interface so that it can replace the
+    client's in-process cache. Entries live in a directory private to the
+    current user; each file holds a JSON header line (expiry time and key)
+    followed by the raw response body. Filesystem errors are treated as
+    cache misses so a read-only or full disk never fails a command.
+    """
+
+    def __init__(self, directory: Path, ttl: float):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache entries
+            ttl: Time-to-live of each entry in seconds
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, key: Hashable) -> Path:
+        return self.directory / hashlib.sha256(repr(key).encode()).hexdigest()
+
+    @staticmethod
+    def _read(path: Path) -> tuple[float, Hashable, bytes] | None:
+        """Return (expiry time, key, body) of an entry file, or None."""
+        try:
+            header, _, body = path.read_bytes().partition(b"\n")
+            expires_at, req_path, params = json.loads(header)
+        except (OSError, ValueError):
+            return None
+        return expires_at, (req_path, tuple(map(tuple, params))), body
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached body for key, or None if missing or expired."""
+        path = self._path(key)
+        entry = self._read(path)
+        if entry is None:
+            return None
+        expires_at, _, body = entry
+        if expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return body
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store the response body value under key."""
+        req_path, params = key
+        header = json.dumps([time.time() + self.ttl, req_path, params]).encode()
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write to a private temp file and rename it so readers never see
+            # a partial entry
+            with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as f:
+                f.write(header + b"\n" + value)
+            os.replace(f.name, self._path(key))
+        except OSError:
+            pass
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies predicate."""
+        for path in self._entries():
+            entry = self._read(path)
+            if entry is not None and predicate(entry[1]):
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _entries(self) -> list[Path]:
+        try:
+            return [p for p in self.directory.iterdir() if p.is_file()]
+        except OSError:
+            return []
+
+
+def get_disk_cache(login: str, base_url: str, ttl: float) -> DiskCache:
+    """Return the disk cache for an API account.
+
+    Each login and base URL gets its own directory, so responses are never
+    shared between accounts.
+
+    Args:
+        login: Sigfox API login (ID)
+        base_url: API base URL
+        ttl: Time-to-live of cached responses in seconds
+
+    Returns:
+        Disk cache for the account
+    """
+    account = hashlib.sha256(f"{login}\n{base_url}".encode()).hexdigest()[:32]
+    return DiskCache(get_cache_dir() / account, ttl)
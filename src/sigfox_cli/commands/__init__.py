@@ -1,17 +1,84 @@
 """Shared utilities for CLI commands."""
 
-from sigfox import Sigfox, SigfoxClient
+from __future__ import annotations
 
-from ..config import load_config
-from ..exceptions import ConfigError
+import functools
+from collections.abc import Callable, Iterator, Sequence
+from itertools import chain
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import click
 
-def get_client_from_config(api_login: str | None, api_password: str | None) -> SigfoxClient:
+from ..config import SigfoxConfig, load_config
+from ..exceptions import ConfigError, SigfoxCLIError
+from ..output import print_error
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from sigfox import Sigfox, SigfoxClient
+
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound="BaseModel")
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Shared by every command's --output option and the config prompt
+OUTPUT_CHOICE = click.Choice(["table", "json"])
+
+
+def api_credentials(fn: F) -> F:
+    """Add the --api-login and --api-password options to a command.
+
+    Args:
+        fn: Command callback
+
+    Returns:
+        Command callback with both options attached
+    """
+    fn = click.option(
+        "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
+    )(fn)
+    return click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")(fn)
+
+
+def handle_cli_errors(fn: F) -> F:
+    """Report errors raised by a command and abort it.
+
+    SigfoxCLIError (including API errors) is printed as-is and any other
+    exception as an unexpected error; click.Abort and click's own usage
+    errors pass through untouched.
+
+    Args:
+        fn: Command callback
+
+    Returns:
+        Wrapped command callback
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except (click.Abort, click.ClickException):
+            raise
+        except SigfoxCLIError as e:
+            print_error(str(e))
+            raise click.Abort()
+        except Exception as e:
+            print_error(f"Unexpected error: {e}")
+            raise click.Abort()
+
+    return wrapper  # type: ignore[return-value]
+
+
+def get_client_from_config(
+    api_login: str | None, api_password: str | None, cfg: SigfoxConfig | None = None
+) -> SigfoxClient:
     """Get Sigfox API client from configuration or CLI args.
 
     Args:
         api_login: Optional API login from CLI
         api_password: Optional API password from CLI
+        cfg: Configuration already loaded by the command (loaded here if None)
 
     Returns:
         Configured SigfoxClient
@@ -19,7 +86,8 @@ def get_client_from_config(api_login: str | None, api_password: str | None) -> S
     Raises:
         ConfigError: If credentials are not configured
     """
-    cfg = load_config()
+    if cfg is None:
+        cfg = load_config()
 
     # Use CLI args if provided, otherwise use config
     login = api_login or cfg.api_login
@@ -31,6 +99,8 @@ def get_client_from_config(api_login: str | None, api_password: str | None) -> S
             "Run 'sigfox config init' or provide --api-login and --api-password options."
         )
 
+    from sigfox import SigfoxClient
+
     return SigfoxClient(
         api_login=login,
         api_password=password,
@@ -39,12 +109,15 @@ def get_client_from_config(api_login: str | None, api_password: str | None) -> S
     )
 
 
-def get_sigfox_from_config(api_login: str | None, api_password: str | None) -> Sigfox:
+def get_sigfox_from_config(
+    api_login: str | None, api_password: str | None, cfg: SigfoxConfig | None = None
+) -> Sigfox:
     """Get high-level Sigfox API client from configuration or CLI args.
 
     Args:
         api_login: Optional API login from CLI
         api_password: Optional API password from CLI
+        cfg: Configuration already loaded by the command (loaded here if None)
 
     Returns:
         Configured Sigfox client with high-level API access
@@ -52,7 +125,8 @@ def get_sigfox_from_config(api_login: str | None, api_password: str | None) -> S
     Raises:
         ConfigError: If credentials are not configured
     """
-    cfg = load_config()
+    if cfg is None:
+        cfg = load_config()
 
     # Use CLI args if provided, otherwise use config
     login = api_login or cfg.api_login
@@ -64,12 +138,84 @@ def get_sigfox_from_config(api_login: str | None, api_password: str | None) -> S
             "Run 'sigfox config init' or provide --api-login and --api-password options."
         )
 
-    return Sigfox(
-        login=login,
-        password=password,
-        base_url=cfg.api_base_url,
-        timeout=cfg.timeout,
-    )
+    from ..session import get_sigfox
 
+    return get_sigfox(login, password, cfg.api_base_url, cfg.timeout, cfg.cache_ttl)
 
-__all__ = ["get_client_from_config", "get_sigfox_from_config"]
+
+def parse_id_list(value: str) -> list[str]:
+    """Split a comma-separated option value into IDs.
+
+    Whitespace around each ID is stripped and empty entries are dropped.
+
+    Args:
+        value: Comma-separated IDs (e.g. ``"id1, id2"``)
+
+    Returns:
+        List of IDs
+
+    Raises:
+        click.BadParameter: If the value contains no IDs
+    """
+    ids = [x for p in value.split(",") if (x := p.strip())]
+    if not ids:
+        raise click.BadParameter(f"No IDs given in {value!r}.")
+    return ids
+
+
+def iter_pages(
+    fetch: Callable[..., Sequence[ModelT]],
+    limit: int,
+    offset: int = 0,
+    page_size: int = 100,
+) -> Iterator[ModelT]:
+    """Fetch up to ``limit`` items page by page and yield them.
+
+    Each page is handed on before the next one is requested, so only one
+    page of models is held in memory at a time. Models are yielded as-is so
+    that JSON output can serialize them without an intermediate dict.
+
+    Args:
+        fetch: List method called with ``limit`` and ``offset`` keyword arguments
+        limit: Maximum number of items to yield
+        offset: Number of items to skip
+        page_size: Maximum number of items requested per call
+
+    Yields:
+        Items of each page
+    """
+    remaining = limit
+    while remaining > 0:
+        size = min(page_size, remaining)
+        page = fetch(limit=size, offset=offset)
+        yield from page
+        if len(page) < size:
+            return
+        offset += size
+        remaining -= size
+
+
+def peek(items: Iterator[T]) -> Iterator[T] | None:
+    """Return an iterator over all of ``items``, or None if there are none.
+
+    Args:
+        items: Iterator to check
+
+    Returns:
+        Iterator yielding the same items, or None when ``items`` is empty
+    """
+    for first in items:
+        return chain((first,), items)
+    return None
+
+
+__all__ = [
+    "OUTPUT_CHOICE",
+    "api_credentials",
+    "get_client_from_config",
+    "get_sigfox_from_config",
+    "handle_cli_errors",
+    "iter_pages",
+    "parse_id_list",
+    "peek",
+]
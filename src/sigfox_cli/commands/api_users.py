@@ -1,11 +1,20 @@
 """API user commands."""
 
+import sys
+from functools import partial
+
 import click
-from sigfox.models import ApiUserCreate, ApiUserUpdate
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    iter_pages,
+    parse_id_list,
+    peek,
+)
 from ..config import load_config
-from ..exceptions import SigfoxCLIError
 from ..output import (
     output_api_user_detail,
     output_api_user_list,
@@ -16,6 +25,11 @@ from ..output import (
     print_warning,
 )
 
+_FIELDS_CHOICE = click.Choice([
+    "group(name,type,level,bssId,customerBssId)",
+    "profiles(name,roles(name,perms(name)))",
+])
+
 
 @click.group(name="api-users")
 def api_users():
@@ -25,17 +39,17 @@ def api_users():
 
 @api_users.command(name="list")
 @click.option(
-    "--limit", type=int, default=100, help="Maximum number of API users to fetch"
+    "--limit",
+    type=click.IntRange(min=1),
+    default=100,
+    help="Maximum number of API users to fetch",
 )
 @click.option("--offset", type=int, default=0, help="Number of API users to skip")
 @click.option("--profile-id", help="Filter by profile ID")
 @click.option("--group-ids", help="Filter by group IDs (comma-separated)")
 @click.option(
     "--fields",
-    type=click.Choice([
-        "group(name,type,level,bssId,customerBssId)",
-        "profiles(name,roles(name,perms(name)))",
-    ]),
+    type=_FIELDS_CHOICE,
     help="Additional fields to return",
 )
 @click.option(
@@ -47,13 +61,11 @@ def api_users():
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def list_api_users(
     limit: int,
     offset: int,
@@ -74,46 +86,34 @@ def list_api_users(
         sigfox api-users list --group-ids abc123,def456
         sigfox api-users list --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        group_ids_list = group_ids.split(",") if group_ids else None
-
-        with client:
-            result = client.api_users.list(
-                limit=limit,
-                offset=offset,
-                profile_id=profile_id,
-                group_ids=group_ids_list,
-                fields=fields,
-                authorizations=authorizations,
-            )
-
-            if not result:
-                print_info("No API users found.")
-                return
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    group_ids_list = parse_id_list(group_ids) if group_ids else None
+
+    with client:
+        fetch = partial(
+            client.api_users.list,
+            profile_id=profile_id,
+            group_ids=group_ids_list,
+            fields=fields,
+            authorizations=authorizations,
+        )
+        data = peek(iter_pages(fetch, limit, offset))
 
-            data = [u.model_dump(by_alias=True) for u in result]
-            output_api_user_list(data, output_format)
+        if data is None:
+            print_info("No API users found.")
+            return
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+        output_api_user_list(data, output_format)
 
 
 @api_users.command(name="get")
 @click.argument("api_user_id")
 @click.option(
     "--fields",
-    type=click.Choice([
-        "group(name,type,level,bssId,customerBssId)",
-        "profiles(name,roles(name,perms(name)))",
-    ]),
+    type=_FIELDS_CHOICE,
     help="Additional fields to return",
 )
 @click.option(
@@ -125,13 +125,11 @@ def list_api_users(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def get_api_user(
     api_user_id: str,
     fields: str | None,
@@ -147,24 +145,15 @@ def get_api_user(
         sigfox api-users get 5138e7dfa2f1fffaf25fd409 --authorizations
         sigfox api-users get 5138e7dfa2f1fffaf25fd409 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            user = client.api_users.get(
-                api_user_id, fields=fields, authorizations=authorizations
-            )
-            user_data = user.model_dump(by_alias=True)
-            output_api_user_detail(user_data, output_format)
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    with client:
+        user = client.api_users.get(
+            api_user_id, fields=fields, authorizations=authorizations
+        )
+        output_api_user_detail(user, output_format)
 
 
 @api_users.command(name="create")
@@ -176,21 +165,26 @@ def get_api_user(
     help="Timezone (Java TimeZone ID, e.g., 'Europe/Paris')",
 )
 @click.option("--profile-ids", required=True, help="Profile IDs (comma-separated)")
+@click.option(
+    "--no-refetch",
+    is_flag=True,
+    default=False,
+    help="Only print the new ID instead of fetching and showing the API user",
+)
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def create_api_user(
     group_id: str,
     name: str,
     timezone: str,
     profile_ids: str,
+    no_refetch: bool,
     output: str | None,
     api_login: str | None,
     api_password: str | None,
@@ -200,36 +194,37 @@ def create_api_user(
     Examples:
         sigfox api-users create --group-id abc123 --name "My API User" \\
             --timezone "Europe/Paris" --profile-ids prof1,prof2
+        sigfox api-users create --group-id abc123 --name "My API User" \\
+            --timezone "Europe/Paris" --profile-ids prof1 --no-refetch
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        profile_ids_list = [p.strip() for p in profile_ids.split(",")]
-
-        user_data = ApiUserCreate(
-            group_id=group_id,
-            name=name,
-            timezone=timezone,
-            profile_ids=profile_ids_list,
-        )
+    from sigfox.models import ApiUserCreate
 
-        with client:
-            result = client.api_users.create(user_data)
-            user_id = result.get("id", "unknown")
-            print_success(f"API user created successfully (ID: {user_id})")
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-            # Fetch and display the created API user
-            user = client.api_users.get(user_id)
-            output_api_user_detail(user.model_dump(by_alias=True), output_format)
+    profile_ids_list = parse_id_list(profile_ids)
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    user_data = ApiUserCreate(
+        group_id=group_id,
+        name=name,
+        timezone=timezone,
+        profile_ids=profile_ids_list,
+    )
+
+    with client:
+        result = client.api_users.create(user_data)
+        user_id = result.get("id", "unknown")
+        print_success(f"API user created successfully (ID: {user_id})")
+        if no_refetch:
+            return
+
+        # The create response normally holds only the ID; fetch the API user
+        # unless it already came back in full
+        if result.keys() - {"id"}:
+            output_api_user_detail(result, output_format)
+        else:
+            output_api_user_detail(client.api_users.get(user_id), output_format)
 
 
 @api_users.command(name="update")
@@ -237,10 +232,8 @@ def create_api_user(
 @click.option("--name", help="API user name (max 100 characters)")
 @click.option("--timezone", help="Timezone (Java TimeZone ID)")
 @click.option("--profile-ids", help="Profile IDs (comma-separated, replaces existing)")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def update_api_user(
     api_user_id: str,
     name: str | None,
@@ -256,43 +249,33 @@ def update_api_user(
         sigfox api-users update 5138e7dfa2f1fffaf25fd409 --timezone "America/New_York"
         sigfox api-users update 5138e7dfa2f1fffaf25fd409 --profile-ids prof1,prof2
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-
-        has_updates = any([
-            name is not None,
-            timezone is not None,
-            profile_ids is not None,
-        ])
-
-        if not has_updates:
-            print_error(
-                "No update fields specified. Use --name, --timezone, --profile-ids."
-            )
-            raise click.Abort()
+    from sigfox.models import ApiUserUpdate
 
-        profile_ids_list = (
-            [p.strip() for p in profile_ids.split(",")]
-            if profile_ids is not None
-            else None
-        )
+    client = get_sigfox_from_config(api_login, api_password)
 
-        user_update = ApiUserUpdate(
-            name=name,
-            timezone=timezone,
-            profile_ids=profile_ids_list,
+    has_updates = (
+        name is not None
+        or timezone is not None
+        or profile_ids is not None
+    )
+
+    if not has_updates:
+        print_error(
+            "No update fields specified. Use --name, --timezone, --profile-ids."
         )
+        raise click.Abort()
 
-        with client:
-            client.api_users.update(api_user_id, user_update)
-            print_success(f"API user {api_user_id} updated successfully.")
+    profile_ids_list = parse_id_list(profile_ids) if profile_ids is not None else None
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    user_update = ApiUserUpdate(
+        name=name,
+        timezone=timezone,
+        profile_ids=profile_ids_list,
+    )
+
+    with client:
+        client.api_users.update(api_user_id, user_update)
+        print_success(f"API user {api_user_id} updated successfully.")
 
 
 @api_users.command(name="delete")
@@ -300,10 +283,8 @@ def update_api_user(
 @click.option(
     "--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def delete_api_user(
     api_user_id: str,
     force: bool,
@@ -316,27 +297,17 @@ def delete_api_user(
         sigfox api-users delete 5138e7dfa2f1fffaf25fd409
         sigfox api-users delete 5138e7dfa2f1fffaf25fd409 --force
     """
-    try:
-        if not force:
-            click.confirm(
-                f"Are you sure you want to delete API user {api_user_id}?",
-                abort=True,
-            )
-
-        client = get_sigfox_from_config(api_login, api_password)
+    if not force:
+        click.confirm(
+            f"Are you sure you want to delete API user {api_user_id}?",
+            abort=True,
+        )
 
-        with client:
-            client.api_users.delete(api_user_id)
-            print_success(f"API user {api_user_id} deleted successfully.")
+    client = get_sigfox_from_config(api_login, api_password)
 
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    with client:
+        client.api_users.delete(api_user_id)
+        print_success(f"API user {api_user_id} deleted successfully.")
 
 
 @api_users.command(name="add-profiles")
@@ -344,10 +315,8 @@ def delete_api_user(
 @click.option(
     "--profile-ids", required=True, help="Profile IDs to associate (comma-separated)"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def add_profiles(
     api_user_id: str,
     profile_ids: str,
@@ -359,69 +328,102 @@ def add_profiles(
     Examples:
         sigfox api-users add-profiles 5138e7dfa2f1fffaf25fd409 --profile-ids prof1,prof2
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        profile_ids_list = [p.strip() for p in profile_ids.split(",")]
+    client = get_sigfox_from_config(api_login, api_password)
+    profile_ids_list = parse_id_list(profile_ids)
 
-        with client:
-            client.api_users.add_profiles(api_user_id, profile_ids_list)
-            print_success(
-                f"Profiles associated to API user {api_user_id} successfully."
-            )
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    with client:
+        client.api_users.add_profiles(api_user_id, profile_ids_list)
+        print_success(
+            f"Profiles associated to API user {api_user_id} successfully."
+        )
 
 
 @api_users.command(name="remove-profile")
 @click.argument("api_user_id")
-@click.argument("profile_id")
+@click.argument("profile_id", required=False)
 @click.option(
-    "--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt"
+    "--profile-id",
+    "-p",
+    "extra_profile_ids",
+    multiple=True,
+    help="Profile ID to remove (repeatable, or comma-separated)",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
 @click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
+    "--from-stdin",
+    is_flag=True,
+    default=False,
+    help="Also read profile IDs from stdin (one per line; requires --force)",
 )
+@click.option(
+    "--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt"
+)
+@api_credentials
+@handle_cli_errors
 def remove_profile(
     api_user_id: str,
-    profile_id: str,
+    profile_id: str | None,
+    extra_profile_ids: tuple[str, ...],
+    from_stdin: bool,
     force: bool,
     api_login: str | None,
     api_password: str | None,
 ):
-    """Remove a profile from an API user.
+    """Remove one or more profiles from an API user.
+
+    Several profiles are removed concurrently over one connection pool.
 
     Examples:
         sigfox api-users remove-profile 5138e7dfa2f1fffaf25fd409 51cc7155e4b00d18ddb99230
         sigfox api-users remove-profile 5138e7dfa2f1fffaf25fd409 51cc7155e4b00d18ddb99230 --force
+        sigfox api-users remove-profile 5138e7dfa2f1fffaf25fd409 -p prof1 -p prof2,prof3
+        cat profile_ids.txt | sigfox api-users remove-profile 5138e7dfa2f1fffaf25fd409 --from-stdin -f
     """
-    try:
-        if not force:
-            click.confirm(
-                f"Are you sure you want to remove profile {profile_id} from API user {api_user_id}?",
-                abort=True,
-            )
+    if from_stdin and not force:
+        # stdin is consumed by the IDs, so the confirmation prompt could not be read
+        raise click.UsageError("--from-stdin requires --force.")
+
+    raw = [profile_id] if profile_id else []
+    for value in extra_profile_ids:
+        raw.extend(value.split(","))
+    if from_stdin:
+        raw.extend(sys.stdin.read().split())
+    profile_ids = list(dict.fromkeys(p for p in map(str.strip, raw) if p))
+    if not profile_ids:
+        raise click.UsageError("Specify PROFILE_ID, --profile-id or --from-stdin.")
+
+    if not force:
+        targets = (
+            f"profile {profile_ids[0]}"
+            if len(profile_ids) == 1
+            else f"{len(profile_ids)} profiles ({', '.join(profile_ids)})"
+        )
+        click.confirm(
+            f"Are you sure you want to remove {targets} from API user {api_user_id}?",
+            abort=True,
+        )
 
-        client = get_sigfox_from_config(api_login, api_password)
+    client = get_sigfox_from_config(api_login, api_password)
 
-        with client:
-            client.api_users.remove_profile(api_user_id, profile_id)
+    with client:
+        if len(profile_ids) == 1:
+            client.api_users.remove_profile(api_user_id, profile_ids[0])
             print_success(
-                f"Profile {profile_id} removed from API user {api_user_id} successfully."
+                f"Profile {profile_ids[0]} removed from API user {api_user_id} successfully."
             )
+            return
 
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
+        failures = client.api_users.remove_profiles_bulk(
+            [(api_user_id, pid) for pid in profile_ids], max_workers=8
+        )
+
+    removed = len(profile_ids) - len(failures)
+    if removed:
+        print_success(
+            f"{removed} profile(s) removed from API user {api_user_id} successfully."
+        )
+    if failures:
+        for (_, pid), exc in failures.items():
+            print_error(f"Failed to remove profile {pid}: {exc}")
         raise click.Abort()
 
 
@@ -433,13 +435,11 @@ def remove_profile(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def renew_credential(
     api_user_id: str,
     force: bool,
@@ -455,33 +455,23 @@ def renew_credential(
         sigfox api-users renew-credential 5138e7dfa2f1fffaf25fd409
         sigfox api-users renew-credential 5138e7dfa2f1fffaf25fd409 --force
     """
-    try:
-        if not force:
-            click.confirm(
-                f"This will invalidate the current password for API user {api_user_id}. Continue?",
-                abort=True,
-            )
+    if not force:
+        click.confirm(
+            f"This will invalidate the current password for API user {api_user_id}. Continue?",
+            abort=True,
+        )
 
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            result = client.api_users.renew_credential(api_user_id)
-
-            if output_format == "json":
-                output_json(result)
-            else:
-                access_token = result.get("accessToken", "N/A")
-                print_success(f"New credential generated for API user {api_user_id}.")
-                print_warning(f"New access token: {access_token}")
-                print_info("Save this token now -- it cannot be retrieved later.")
-
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        result = client.api_users.renew_credential(api_user_id)
+
+        if output_format == "json":
+            output_json(result)
+        else:
+            access_token = result.get("accessToken", "N/A")
+            print_success(f"New credential generated for API user {api_user_id}.")
+            print_warning(f"New access token: {access_token}")
+            print_info("Save this token now -- it cannot be retrieved later.")
@@ -1,11 +1,19 @@
 """Base station commands."""
 
+from functools import partial
+
 import click
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    iter_pages,
+    peek,
+)
 from ..config import load_config
-from ..exceptions import SigfoxCLIError
-from ..output import output_message_list, print_error, print_info
+from ..output import output_message_list, print_info
 
 
 @click.group(name="base-stations")
@@ -22,16 +30,21 @@ def base_stations():
 )
 @click.option("--since", type=int, help="Starting timestamp (milliseconds since Unix epoch)")
 @click.option("--before", type=int, help="Ending timestamp (milliseconds since Unix epoch)")
-@click.option("--limit", type=int, default=100, help="Maximum number of messages to fetch")
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=100,
+    help="Maximum number of messages to fetch",
+)
 @click.option("--offset", type=int, default=0, help="Number of messages to skip")
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def list_messages(
     station_id: str,
     fields: str | None,
@@ -54,32 +67,22 @@ def list_messages(
         sigfox base-stations messages 1A2B3C --fields "device(name)"
         sigfox base-stations messages 1A2B3C --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            messages = client.base_stations.list_messages(
-                station_id=station_id,
-                fields=fields,
-                since=since,
-                before=before,
-                limit=limit,
-                offset=offset,
-            )
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-            if not messages:
-                print_info(f"No messages found for base station {station_id}.")
-                return
+    with client:
+        fetch = partial(
+            client.base_stations.list_messages,
+            station_id=station_id,
+            fields=fields,
+            since=since,
+            before=before,
+        )
+        messages_data = peek(iter_pages(fetch, limit, offset))
 
-            # Convert Pydantic models to dicts for output
-            messages_data = [m.model_dump(by_alias=True) for m in messages]
-            output_message_list(messages_data, output_format)
+        if messages_data is None:
+            print_info(f"No messages found for base station {station_id}.")
+            return
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+        output_message_list(messages_data, output_format)
@@ -1,7 +1,10 @@
 """Configuration commands."""
 
+from typing import TextIO
+
 import click
 
+from . import OUTPUT_CHOICE
 from ..config import get_config_file, load_config, save_config
 from ..output import print_error, print_info, print_success
 
@@ -13,35 +16,69 @@ def config():
 
 
 @config.command(name="init")
-def init():
-    """Initialize configuration interactively."""
-    print_info("Sigfox CLI Configuration Setup")
-    print_info(f"Configuration will be saved to: {get_config_file()}")
-    print_info("")
-
-    # Prompt for API credentials
-    api_login = click.prompt("API Login (ID)", type=str)
-    api_password = click.prompt("API Password (Secret)", type=str, hide_input=True)
-
-    # Optional settings
-    api_base_url = click.prompt(
-        "API Base URL",
-        type=str,
-        default="https://api.sigfox.com/v2",
-        show_default=True,
-    )
-    output_format = click.prompt(
-        "Default output format",
-        type=click.Choice(["table", "json"]),
-        default="table",
-        show_default=True,
-    )
-    timeout = click.prompt(
-        "Request timeout (seconds)",
-        type=int,
-        default=30,
-        show_default=True,
-    )
+@click.option(
+    "--from-file",
+    type=click.File("r"),
+    help="Read settings from a JSON file ('-' for stdin) instead of prompting",
+)
+def init(from_file: TextIO | None):
+    """Initialize configuration interactively.
+
+    With --from-file, settings are read from a JSON object with the keys
+    api_login, api_password and optionally api_base_url, output_format,
+    timeout and cache_ttl, and no prompts are shown.
+
+    Examples:
+        sigfox config init
+        echo '{"api_login": "ID", "api_password": "SECRET"}' | sigfox config init --from-file -
+    """
+    if from_file is not None:
+        from pydantic import ValidationError
+
+        from ..config import ConfigInit
+
+        try:
+            settings = ConfigInit.model_validate_json(from_file.read())
+        except ValidationError as e:
+            print_error(f"Invalid configuration in {from_file.name}: {e}")
+            raise click.Abort()
+        api_login = settings.api_login
+        api_password = settings.api_password
+        api_base_url = settings.api_base_url
+        output_format = settings.output_format
+        timeout = settings.timeout
+        cache_ttl = settings.cache_ttl
+    else:
+        print_info(
+            "Sigfox CLI Configuration Setup",
+            f"Configuration will be saved to: {get_config_file()}",
+            "",
+        )
+
+        # Prompt for API credentials
+        api_login = click.prompt("API Login (ID)", type=str)
+        api_password = click.prompt("API Password (Secret)", type=str, hide_input=True)
+
+        # Optional settings
+        api_base_url = click.prompt(
+            "API Base URL",
+            type=str,
+            default="https://api.sigfox.com/v2",
+            show_default=True,
+        )
+        output_format = click.prompt(
+            "Default output format",
+            type=OUTPUT_CHOICE,
+            default="table",
+            show_default=True,
+        )
+        timeout = click.prompt(
+            "Request timeout (seconds)",
+            type=int,
+            default=30,
+            show_default=True,
+        )
+        cache_ttl = None
 
     # Save configuration
     try:
@@ -51,6 +88,7 @@ def init():
             api_base_url=api_base_url,
             output_format=output_format,
             timeout=timeout,
+            cache_ttl=cache_ttl,
         )
         print_success(f"Configuration saved to {get_config_file()}")
         print_info("You can now use Sigfox CLI commands.")
@@ -65,15 +103,18 @@ def show():
     try:
         cfg = load_config()
 
-        print_info("Current Configuration:")
-        print_info("")
-        print_info(f"  API Login: {cfg.api_login or '[not set]'}")
-        print_info(f"  API Password: {'[set]' if cfg.api_password else '[not set]'}")
-        print_info(f"  API Base URL: {cfg.api_base_url}")
-        print_info(f"  Default Output Format: {cfg.output_format}")
-        print_info(f"  Timeout: {cfg.timeout}s")
-        print_info("")
-        print_info(f"Config file: {get_config_file()}")
+        print_info(
+            "Current Configuration:",
+            "",
+            f"  API Login: {cfg.api_login or '[not set]'}",
+            f"  API Password: {'[set]' if cfg.api_password else '[not set]'}",
+            f"  API Base URL: {cfg.api_base_url}",
+            f"  Default Output Format: {cfg.output_format}",
+            f"  Timeout: {cfg.timeout}s",
+            f"  Response Cache TTL: {f'{cfg.cache_ttl}s' if cfg.cache_ttl else 'disabled'}",
+            "",
+            f"Config file: {get_config_file()}",
+        )
 
         if not cfg.is_configured:
             print_error("API credentials are not configured.")
@@ -93,8 +134,16 @@ def set_value(key: str, value: str):
     Examples:
         sigfox config set api_login YOUR_LOGIN
         sigfox config set output_format json
+        sigfox config set cache_ttl 30
     """
-    valid_keys = ["api_login", "api_password", "api_base_url", "output_format", "timeout"]
+    valid_keys = [
+        "api_login",
+        "api_password",
+        "api_base_url",
+        "output_format",
+        "timeout",
+        "cache_ttl",
+    ]
 
     if key not in valid_keys:
         print_error(f"Invalid configuration key: {key}")
@@ -103,7 +152,7 @@ def set_value(key: str, value: str):
 
     try:
         # Convert value type if needed
-        if key == "timeout":
+        if key in ("timeout", "cache_ttl"):
             value = int(value)
         elif key == "output_format" and value not in ["table", "json"]:
             print_error(f"Invalid output format: {value}")
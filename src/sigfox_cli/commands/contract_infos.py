@@ -1,15 +1,22 @@
 """Contract info commands."""
 
+from functools import partial
+
 import click
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    iter_pages,
+    peek,
+)
 from ..config import load_config
-from ..exceptions import SigfoxCLIError
 from ..output import (
     output_contract_info_detail,
     output_contract_info_list,
     output_device_list,
-    print_error,
     print_info,
 )
 
@@ -21,17 +28,28 @@ def contract_infos():
 
 
 @contract_infos.command(name="list")
-@click.option("--limit", type=int, default=100, help="Maximum number of contracts to fetch")
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=100,
+    help="Maximum number of contracts to fetch",
+)
 @click.option("--offset", type=int, default=0, help="Number of contracts to skip")
 @click.option("--name", help="Filter by contract name (substring match)")
 @click.option("--group-id", help="Filter by group ID")
-@click.option("--group-type", type=int, help="Filter by group type (2=BASIC, 9=CHANNEL)")
+@click.option(
+    "--group-type",
+    type=click.Choice(["2", "9"]),
+    help="Filter by group type (2=BASIC, 9=CHANNEL)",
+)
 @click.option("--deep", is_flag=True, default=False, help="Include contracts from child groups")
 @click.option("--up", is_flag=True, default=False, help="Include contracts from ancestor groups")
 @click.option("--order-ids", help="Filter by order IDs (comma-separated)")
 @click.option("--contract-ids", help="Filter by external contract IDs (comma-separated)")
-@click.option("--subscription-plan", type=int, help="Filter by subscription plan (0-6)")
-@click.option("--pricing-model", type=int, help="Filter by pricing model (1-3)")
+@click.option(
+    "--subscription-plan", type=click.IntRange(0, 6), help="Filter by subscription plan (0-6)"
+)
+@click.option("--pricing-model", type=click.IntRange(1, 3), help="Filter by pricing model (1-3)")
 @click.option("--fields", help="Additional fields to return")
 @click.option(
     "--authorizations",
@@ -40,16 +58,16 @@ def contract_infos():
     help="Return actions and resources",
 )
 @click.option(
-    "--output", "-o", type=click.Choice(["table", "json"]), help="Output format"
+    "--output", "-o", type=OUTPUT_CHOICE, help="Output format"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def list_contract_infos(
     limit: int,
     offset: int,
     name: str | None,
     group_id: str | None,
-    group_type: int | None,
+    group_type: str | None,
     deep: bool,
     up: bool,
     order_ids: str | None,
@@ -71,41 +89,32 @@ def list_contract_infos(
         sigfox contract-infos list --subscription-plan 1
         sigfox contract-infos list --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            result = client.contract_infos.list(
-                limit=limit,
-                offset=offset,
-                name=name,
-                group_id=group_id,
-                group_type=group_type,
-                deep=deep,
-                up=up,
-                order_ids=order_ids,
-                contract_ids=contract_ids,
-                subscription_plan=subscription_plan,
-                pricing_model=pricing_model,
-                fields=fields,
-                authorizations=authorizations,
-            )
-
-            if not result:
-                print_info("No contract infos found.")
-                return
-
-            data = [c.model_dump(by_alias=True) for c in result]
-            output_contract_info_list(data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        fetch = partial(
+            client.contract_infos.list,
+            name=name,
+            group_id=group_id,
+            group_type=int(group_type) if group_type else None,
+            deep=deep,
+            up=up,
+            order_ids=order_ids,
+            contract_ids=contract_ids,
+            subscription_plan=subscription_plan,
+            pricing_model=pricing_model,
+            fields=fields,
+            authorizations=authorizations,
+        )
+        data = peek(iter_pages(fetch, limit, offset))
+
+        if data is None:
+            print_info("No contract infos found.")
+            return
+
+        output_contract_info_list(data, output_format)
 
 
 @contract_infos.command(name="get")
@@ -118,10 +127,10 @@ def list_contract_infos(
     help="Return actions and resources",
 )
 @click.option(
-    "--output", "-o", type=click.Choice(["table", "json"]), help="Output format"
+    "--output", "-o", type=OUTPUT_CHOICE, help="Output format"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def get_contract_info(
     contract_id: str,
     fields: str | None,
@@ -137,23 +146,15 @@ def get_contract_info(
         sigfox contract-infos get 572f1204017975032d8ec1dd --authorizations
         sigfox contract-infos get 572f1204017975032d8ec1dd --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            contract = client.contract_infos.get(
-                contract_id, fields=fields, authorizations=authorizations
-            )
-            output_contract_info_detail(contract.model_dump(by_alias=True), output_format)
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    with client:
+        contract = client.contract_infos.get(
+            contract_id, fields=fields, authorizations=authorizations
+        )
+        output_contract_info_detail(contract, output_format)
 
 
 @contract_infos.command(name="list-devices")
@@ -162,10 +163,10 @@ def get_contract_info(
 @click.option("--fields", help="Additional fields to return")
 @click.option("--limit", type=int, default=100, help="Maximum number of devices to fetch")
 @click.option(
-    "--output", "-o", type=click.Choice(["table", "json"]), help="Output format"
+    "--output", "-o", type=OUTPUT_CHOICE, help="Output format"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def list_devices(
     contract_id: str,
     device_type_id: str | None,
@@ -182,28 +183,20 @@ def list_devices(
         sigfox contract-infos list-devices 572f1204017975032d8ec1dd --limit 50
         sigfox contract-infos list-devices 572f1204017975032d8ec1dd --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            devices = client.contract_infos.list_devices(
-                contract_id,
-                device_type_id=device_type_id,
-                fields=fields,
-                limit=limit,
-            )
-
-            if not devices:
-                print_info("No devices found for this contract.")
-                return
-
-            output_device_list(devices, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        devices = client.contract_infos.list_devices(
+            contract_id,
+            device_type_id=device_type_id,
+            fields=fields,
+            limit=limit,
+        )
+
+        if not devices:
+            print_info("No devices found for this contract.")
+            return
+
+        output_device_list(devices, output_format)
@@ -1,22 +1,32 @@
 """Coverage commands."""
 
-import json
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import click
-from sigfox.models import CoverageBulkRequest, CoverageLocation
 
-from . import get_sigfox_from_config
+from . import OUTPUT_CHOICE, api_credentials, get_sigfox_from_config, handle_cli_errors
 from ..config import load_config
-from ..exceptions import ConfigError, SigfoxCLIError
 from ..output import (
     output_coverage_bulk_response,
     output_coverage_prediction,
     output_coverage_redundancy,
     print_error,
-    print_info,
 )
 
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+    from sigfox.models import CoverageLocation
+
+
+@lru_cache(maxsize=1)
+def _locations_adapter() -> "TypeAdapter[list[CoverageLocation]]":
+    """Return the validator of --locations, built on first use."""
+    from pydantic import TypeAdapter
+    from sigfox.models import CoverageLocation
+
+    return TypeAdapter(list[CoverageLocation])
+
 
 @click.group(name="coverages")
 def coverages():
@@ -31,11 +41,11 @@ def coverages():
 @click.option("--group-id", help="Filter by group ID")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def global_prediction(
     lat: float,
     lng: float,
@@ -52,26 +62,18 @@ def global_prediction(
         sigfox coverages global-prediction --lat 48.8566 --lng 2.3522 --radius 100
         sigfox coverages global-prediction --lat 48.8566 --lng 2.3522 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            result = client.coverages.get_global_prediction(
-                lat=lat,
-                lng=lng,
-                radius=radius,
-                group_id=group_id,
-            )
-            output_coverage_prediction(result.model_dump(by_alias=True), output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        result = client.coverages.get_global_prediction(
+            lat=lat,
+            lng=lng,
+            radius=radius,
+            group_id=group_id,
+        )
+        output_coverage_prediction(result, output_format)
 
 
 @coverages.command(name="bulk-start")
@@ -82,8 +84,8 @@ def global_prediction(
 )
 @click.option("--radius", type=int, help="Estimated radius of the device location (meters)")
 @click.option("--group-id", help="Filter by group ID")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def bulk_start(
     locations: str,
     radius: int | None,
@@ -97,45 +99,42 @@ def bulk_start(
         sigfox coverages bulk-start --locations '[{"lat": 48.86, "lng": 2.35}]'
         sigfox coverages bulk-start --locations '[{"lat": 48.86, "lng": 2.35}, {"lat": 51.51, "lng": -0.13}]'
     """
+    from sigfox.models import CoverageBulkRequest
+
     try:
-        locations_data: list[dict[str, Any]] = json.loads(locations)
-        location_objs = [CoverageLocation(lat=loc["lat"], lng=loc["lng"]) for loc in locations_data]
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        # Parse and validate in one pass, without an intermediate list of dicts
+        location_objs = _locations_adapter().validate_json(locations)
+    except ValueError as e:
         print_error(f"Invalid --locations JSON: {e}")
         raise click.Abort()
 
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-
-        request = CoverageBulkRequest(
-            locations=location_objs,
-            radius=radius,
-            group_id=group_id,
+    client = get_sigfox_from_config(api_login, api_password)
+
+    # Locations were validated above; skip re-validating the whole list
+    request = CoverageBulkRequest.model_construct(
+        locations=location_objs,
+        radius=radius,
+        group_id=group_id,
+    )
+
+    with client:
+        result = client.coverages.start_bulk_prediction(request)
+        job_id = result.get("jobId", "unknown")
+        click.echo(
+            f"Bulk job started. Job ID: {job_id}\n"
+            f"Run: sigfox coverages bulk-get {job_id}"
         )
 
-        with client:
-            result = client.coverages.start_bulk_prediction(request)
-            job_id = result.get("jobId", "unknown")
-            click.echo(f"Bulk job started. Job ID: {job_id}")
-            click.echo(f"Run: sigfox coverages bulk-get {job_id}")
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
-
 
 @coverages.command(name="bulk-get")
 @click.argument("job_id")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def bulk_get(
     job_id: str,
     output: str | None,
@@ -148,21 +147,13 @@ def bulk_get(
         sigfox coverages bulk-get <job_id>
         sigfox coverages bulk-get <job_id> --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-        with client:
-            result = client.coverages.get_bulk_prediction(job_id)
-            output_coverage_bulk_response(result.model_dump(by_alias=True), output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    with client:
+        result = client.coverages.get_bulk_prediction(job_id)
+        output_coverage_bulk_response(result, output_format)
 
 
 @coverages.command(name="operator-redundancy")
@@ -177,11 +168,11 @@ def bulk_get(
 @click.option("--device-class-id", type=int, help="Sigfox device class (0u, 1u, 2u, 3u)")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def operator_redundancy(
     lat: float,
     lng: float,
@@ -200,24 +191,16 @@ def operator_redundancy(
         sigfox coverages operator-redundancy --lat 48.8566 --lng 2.3522 --operator-id abc123
         sigfox coverages operator-redundancy --lat 48.8566 --lng 2.3522 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            result = client.coverages.get_operator_redundancy(
-                lat=lat,
-                lng=lng,
-                operator_id=operator_id,
-                device_situation=device_situation,
-                device_class_id=device_class_id,
-            )
-            output_coverage_redundancy(result.model_dump(by_alias=True), output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        result = client.coverages.get_operator_redundancy(
+            lat=lat,
+            lng=lng,
+            operator_id=operator_id,
+            device_situation=device_situation,
+            device_class_id=device_class_id,
+        )
+        output_coverage_redundancy(result, output_format)
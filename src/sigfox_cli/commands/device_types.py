@@ -1,13 +1,15 @@
 """Device type commands."""
 
-from typing import Any
-
 import click
-from sigfox.models import DeviceTypeCreate, DeviceTypeUpdate
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    parse_id_list,
+)
 from ..config import load_config
-from ..exceptions import ConfigError, SigfoxCLIError
 from ..output import (
     output_device_type_detail,
     output_device_type_list,
@@ -34,11 +36,11 @@ def device_types():
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def list_device_types(
     limit: int,
     offset: int,
@@ -60,39 +62,30 @@ def list_device_types(
         sigfox device-types list --group-ids abc123,def456 --deep
         sigfox device-types list --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        # Convert comma-separated group IDs to list
-        group_ids_list = group_ids.split(",") if group_ids else None
-
-        # Fetch device types using high-level API
-        with client:
-            device_types = client.device_types.list(
-                limit=limit,
-                offset=offset,
-                name=name,
-                group_ids=group_ids_list,
-                deep=deep,
-                sort=sort,
-            )
-
-            if not device_types:
-                print_info("No device types found.")
-                return
-
-            # Convert Pydantic models to dicts for output
-            data = [dt.model_dump(by_alias=True) for dt in device_types]
-            output_device_type_list(data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    # Convert comma-separated group IDs to list
+    group_ids_list = parse_id_list(group_ids) if group_ids else None
+
+    # Fetch device types using high-level API
+    with client:
+        device_types = client.device_types.list(
+            limit=limit,
+            offset=offset,
+            name=name,
+            group_ids=group_ids_list,
+            deep=deep,
+            sort=sort,
+            contract_id=contract_id,
+        )
+
+        if not device_types:
+            print_info("No device types found.")
+            return
+
+        output_device_type_list(device_types, output_format)
 
 
 @device_types.command(name="get")
@@ -100,11 +93,11 @@ def list_device_types(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def get_device_type(
     device_type_id: str,
     output: str | None,
@@ -117,23 +110,14 @@ def get_device_type(
         sigfox device-types get 5d8cdc8fea06bb6e41234567
         sigfox device-types get 5d8cdc8fea06bb6e41234567 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        # Fetch device type using high-level API
-        with client:
-            device_type = client.device_types.get(device_type_id)
-            device_type_data = device_type.model_dump(by_alias=True)
-            output_device_type_detail(device_type_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    # Fetch device type using high-level API
+    with client:
+        device_type = client.device_types.get(device_type_id)
+        output_device_type_detail(device_type, output_format)
 
 
 @device_types.command(name="create")
@@ -149,11 +133,11 @@ def get_device_type(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def create_device_type(
     name: str,
     group_id: str,
@@ -175,37 +159,30 @@ def create_device_type(
         sigfox device-types create --name "My Type" --group-id abc123 --description "Test" --contract-id def456
         sigfox device-types create --name "My Type" --group-id abc123 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        # Create DeviceTypeCreate model
-        device_type_data = DeviceTypeCreate(
-            name=name,
-            group_id=group_id,
-            description=description,
-            keep_alive=keep_alive,
-            alert_email=alert_email,
-            payload_type=payload_type,
-            downlink_mode=downlink_mode,
-            downlink_data_string=downlink_data,
-            contract_id=contract_id,
-        )
-
-        # Create device type using high-level API
-        with client:
-            created_device_type = client.device_types.create(device_type_data)
-            print_success(f"Device type created successfully (ID: {created_device_type.id})")
-            result = created_device_type.model_dump(by_alias=True)
-            output_device_type_detail(result, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    from sigfox.models import DeviceTypeCreate
+
+    # Create DeviceTypeCreate model
+    device_type_data = DeviceTypeCreate(
+        name=name,
+        group_id=group_id,
+        description=description,
+        keep_alive=keep_alive,
+        alert_email=alert_email,
+        payload_type=payload_type,
+        downlink_mode=downlink_mode,
+        downlink_data_string=downlink_data,
+        contract_id=contract_id,
+    )
+
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    # Create device type using high-level API
+    with client:
+        created_device_type = client.device_types.create(device_type_data)
+        print_success(f"Device type created successfully (ID: {created_device_type.id})")
+        output_device_type_detail(created_device_type, output_format)
 
 
 @device_types.command(name="update")
@@ -217,8 +194,8 @@ def create_device_type(
 @click.option("--payload-type", type=int, help="Payload type")
 @click.option("--downlink-mode", type=int, help="Downlink mode")
 @click.option("--downlink-data", help="Downlink data (hex string)")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def update_device_type(
     device_type_id: str,
     name: str | None,
@@ -238,53 +215,36 @@ def update_device_type(
         sigfox device-types update 5d8cdc8fea06bb6e41234567 --description "Updated description"
         sigfox device-types update 5d8cdc8fea06bb6e41234567 --keep-alive 3600
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-
-        # Check if any fields are specified
-        has_updates = any([
-            name is not None,
-            description is not None,
-            keep_alive is not None,
-            alert_email is not None,
-            payload_type is not None,
-            downlink_mode is not None,
-            downlink_data is not None,
-        ])
-
-        if not has_updates:
-            print_error("No update fields specified. Use --name, --description, etc.")
-            raise click.Abort()
-
-        # Create DeviceTypeUpdate model
-        device_type_update = DeviceTypeUpdate(
-            name=name,
-            description=description,
-            keep_alive=keep_alive,
-            alert_email=alert_email,
-            payload_type=payload_type,
-            downlink_mode=downlink_mode,
-            downlink_data_string=downlink_data,
-        )
+    from sigfox.models import DeviceTypeUpdate
+
+    device_type_update = DeviceTypeUpdate(
+        name=name,
+        description=description,
+        keep_alive=keep_alive,
+        alert_email=alert_email,
+        payload_type=payload_type,
+        downlink_mode=downlink_mode,
+        downlink_data_string=downlink_data,
+    )
+
+    # Unset options are None and left out of the request body
+    if not device_type_update.model_dump(exclude_none=True):
+        print_error("No update fields specified. Use --name, --description, etc.")
+        raise click.Abort()
 
-        # Update device type using high-level API
-        with client:
-            client.device_types.update(device_type_id, device_type_update)
-            print_success(f"Device type {device_type_id} updated successfully.")
+    client = get_sigfox_from_config(api_login, api_password)
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    # Update device type using high-level API
+    with client:
+        client.device_types.update(device_type_id, device_type_update)
+        print_success(f"Device type {device_type_id} updated successfully.")
 
 
 @device_types.command(name="delete")
 @click.argument("device_type_id")
 @click.option("--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def delete_device_type(
     device_type_id: str,
     force: bool,
@@ -297,25 +257,15 @@ def delete_device_type(
         sigfox device-types delete 5d8cdc8fea06bb6e41234567
         sigfox device-types delete 5d8cdc8fea06bb6e41234567 --force
     """
-    try:
-        if not force:
-            click.confirm(
-                f"Are you sure you want to delete device type {device_type_id}?",
-                abort=True,
-            )
-
-        client = get_sigfox_from_config(api_login, api_password)
-
-        # Delete device type using high-level API
-        with client:
-            client.device_types.delete(device_type_id)
-            print_success(f"Device type {device_type_id} deleted successfully.")
-
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    if not force:
+        click.confirm(
+            f"Are you sure you want to delete device type {device_type_id}?",
+            abort=True,
+        )
+
+    client = get_sigfox_from_config(api_login, api_password)
+
+    # Delete device type using high-level API
+    with client:
+        client.device_types.delete(device_type_id)
+        print_success(f"Device type {device_type_id} deleted successfully.")
@@ -1,13 +1,15 @@
 """Device commands."""
 
-from typing import Any
-
 import click
-from sigfox.models import DeviceCreate, DeviceUpdate
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    parse_id_list,
+)
 from ..config import load_config
-from ..exceptions import ConfigError, SigfoxCLIError
 from ..output import (
     output_device_detail,
     output_device_list,
@@ -33,11 +35,11 @@ def devices():
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def list_devices(
     limit: int,
     offset: int,
@@ -58,39 +60,29 @@ def list_devices(
         sigfox devices list --group-ids abc123,def456 --deep
         sigfox devices list --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        # Convert comma-separated group IDs to list
-        group_ids_list = group_ids.split(",") if group_ids else None
-
-        # Fetch devices using high-level API
-        with client:
-            devices = client.devices.list(
-                limit=limit,
-                offset=offset,
-                device_type_id=device_type_id,
-                group_ids=group_ids_list,
-                deep=deep,
-                sort=sort,
-            )
-
-            if not devices:
-                print_info("No devices found.")
-                return
-
-            # Convert Pydantic models to dicts for output
-            devices_data = [d.model_dump(by_alias=True) for d in devices]
-            output_device_list(devices_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    # Convert comma-separated group IDs to list
+    group_ids_list = parse_id_list(group_ids) if group_ids else None
+
+    # Fetch devices using high-level API
+    with client:
+        devices = client.devices.list(
+            limit=limit,
+            offset=offset,
+            device_type_id=device_type_id,
+            group_ids=group_ids_list,
+            deep=deep,
+            sort=sort,
+        )
+
+        if not devices:
+            print_info("No devices found.")
+            return
+
+        output_device_list(devices, output_format)
 
 
 @devices.command(name="get")
@@ -98,11 +90,11 @@ def list_devices(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def get_device(
     device_id: str,
     output: str | None,
@@ -115,23 +107,14 @@ def get_device(
         sigfox devices get 1A2B3C
         sigfox devices get 1A2B3C --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        # Fetch device using high-level API
-        with client:
-            device = client.devices.get(device_id)
-            device_data = device.model_dump(by_alias=True)
-            output_device_detail(device_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    # Fetch device using high-level API
+    with client:
+        device = client.devices.get(device_id)
+        output_device_detail(device, output_format)
 
 
 @devices.command(name="messages")
@@ -143,11 +126,11 @@ def get_device(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def list_messages(
     device_id: str,
     limit: int,
@@ -166,35 +149,25 @@ def list_messages(
         sigfox devices messages 1A2B3C --since 1609459200000
         sigfox devices messages 1A2B3C --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        # Fetch messages using high-level API
-        with client:
-            messages = client.devices.messages(
-                device_id=device_id,
-                limit=limit,
-                offset=offset,
-                since=since,
-                before=before,
-            )
-
-            if not messages:
-                print_info("No messages found.")
-                return
-
-            # Convert Pydantic models to dicts for output
-            messages_data = [m.model_dump(by_alias=True) for m in messages]
-            output_message_list(messages_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    # Fetch messages using high-level API
+    with client:
+        messages = client.devices.messages(
+            device_id=device_id,
+            limit=limit,
+            offset=offset,
+            since=since,
+            before=before,
+        )
+
+        if not messages:
+            print_info("No messages found.")
+            return
+
+        output_message_list(messages, output_format)
 
 
 @devices.command(name="create")
@@ -211,11 +184,11 @@ def list_messages(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def create_device(
     device_id: str,
     name: str,
@@ -238,43 +211,36 @@ def create_device(
         sigfox devices create --device-id 1A2B3C --name "Test" --device-type-id 5d8cdc8fea06bb6e41234567 --pac ABC123 --lat 48.8585715 --lng 2.2922923
         sigfox devices create --device-id 1A2B3C --name "Prototype" --device-type-id 5d8cdc8fea06bb6e41234567 --pac ABC123 --prototype
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        # Build product certificate if provided
-        product_cert = {"key": product_certificate} if product_certificate else None
-
-        # Create DeviceCreate model
-        device_data = DeviceCreate(
-            id=device_id,
-            name=name,
-            device_type_id=device_type_id,
-            pac=pac,
-            lat=lat,
-            lng=lng,
-            product_certificate=product_cert,
-            prototype=prototype,
-            automatic_renewal=automatic_renewal,
-            activable=activable,
-        )
-
-        # Create device using high-level API
-        with client:
-            created_device = client.devices.create(device_data)
-            print_info(f"Device created successfully: {created_device.id}")
-
-            # Display the created device
-            device_dict = created_device.model_dump(by_alias=True)
-            output_device_detail(device_dict, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    from sigfox.models import DeviceCreate
+
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    # Build product certificate if provided
+    product_cert = {"key": product_certificate} if product_certificate else None
+
+    # Create DeviceCreate model
+    device_data = DeviceCreate(
+        id=device_id,
+        name=name,
+        device_type_id=device_type_id,
+        pac=pac,
+        lat=lat,
+        lng=lng,
+        product_certificate=product_cert,
+        prototype=prototype,
+        automatic_renewal=automatic_renewal,
+        activable=activable,
+    )
+
+    # Create device using high-level API
+    with client:
+        created_device = client.devices.create(device_data)
+        print_info(f"Device created successfully: {created_device.id}")
+
+        # Display the created device
+        output_device_detail(created_device, output_format)
 
 
 @devices.command(name="update")
@@ -286,8 +252,8 @@ def create_device(
 @click.option("--prototype", type=bool, help="Prototype status (true/false)")
 @click.option("--automatic-renewal", type=bool, help="Automatic token renewal (true/false)")
 @click.option("--activable", type=bool, help="Device can take a token (true/false)")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def update_device(
     device_id: str,
     name: str | None,
@@ -308,56 +274,50 @@ def update_device(
         sigfox devices update 1A2B3C --prototype true
         sigfox devices update 1A2B3C --name "Updated" --automatic-renewal false
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-
-        # Check if any fields are specified
-        has_updates = any([
-            name is not None,
-            lat is not None,
-            lng is not None,
-            product_certificate is not None,
-            prototype is not None,
-            automatic_renewal is not None,
-            activable is not None,
-        ])
-
-        if not has_updates:
-            print_error("No update fields specified. Use --name, --lat, --lng, etc.")
-            raise click.Abort()
-
-        # Build product certificate if provided
-        product_cert = {"key": product_certificate} if product_certificate is not None else None
-
-        # Create DeviceUpdate model
-        device_update = DeviceUpdate(
-            name=name,
-            lat=lat,
-            lng=lng,
-            product_certificate=product_cert,
-            prototype=prototype,
-            automatic_renewal=automatic_renewal,
-            activable=activable,
-        )
+    from sigfox.models import DeviceUpdate
+
+    client = get_sigfox_from_config(api_login, api_password)
+
+    # Check if any fields are specified
+    has_updates = (
+        name is not None
+        or lat is not None
+        or lng is not None
+        or product_certificate is not None
+        or prototype is not None
+        or automatic_renewal is not None
+        or activable is not None
+    )
+
+    if not has_updates:
+        print_error("No update fields specified. Use --name, --lat, --lng, etc.")
+        raise click.Abort()
 
-        # Update device using high-level API
-        with client:
-            client.devices.update(device_id, device_update)
-            print_info(f"Device {device_id} updated successfully.")
+    # Build product certificate if provided
+    product_cert = {"key": product_certificate} if product_certificate is not None else None
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    # Create DeviceUpdate model
+    device_update = DeviceUpdate(
+        name=name,
+        lat=lat,
+        lng=lng,
+        product_certificate=product_cert,
+        prototype=prototype,
+        automatic_renewal=automatic_renewal,
+        activable=activable,
+    )
+
+    # Update device using high-level API
+    with client:
+        client.devices.update(device_id, device_update)
+        print_info(f"Device {device_id} updated successfully.")
 
 
 @devices.command(name="delete")
 @click.argument("device_id")
 @click.option("--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def delete_device(
     device_id: str,
     force: bool,
@@ -370,25 +330,15 @@ def delete_device(
         sigfox devices delete 1A2B3C
         sigfox devices delete 1A2B3C --force
     """
-    try:
-        if not force:
-            click.confirm(
-                f"Are you sure you want to delete device {device_id}?",
-                abort=True,
-            )
-
-        client = get_sigfox_from_config(api_login, api_password)
-
-        # Delete device using high-level API
-        with client:
-            client.devices.delete(device_id)
-            print_info(f"Device {device_id} deleted successfully.")
-
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    if not force:
+        click.confirm(
+            f"Are you sure you want to delete device {device_id}?",
+            abort=True,
+        )
+
+    client = get_sigfox_from_config(api_login, api_password)
+
+    # Delete device using high-level API
+    with client:
+        client.devices.delete(device_id)
+        print_info(f"Device {device_id} deleted successfully.")
@@ -1,13 +1,15 @@
 """Group commands."""
 
-from typing import Any
-
 import click
-from sigfox.models import GroupCreate, GroupUpdate
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    parse_id_list,
+)
 from ..config import load_config
-from ..exceptions import ConfigError, SigfoxCLIError
 from ..output import (
     output_callback_error_list,
     output_geoloc_payload_list,
@@ -57,11 +59,11 @@ def groups():
 @click.option("--page-id", help="Pagination token for the page to retrieve")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def list_groups(
     limit: int,
     offset: int,
@@ -89,42 +91,33 @@ def list_groups(
         sigfox groups list --sort name
         sigfox groups list --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        parent_ids_list = parent_ids.split(",") if parent_ids else None
-        types_list = [int(t.strip()) for t in types.split(",")] if types else None
-
-        with client:
-            result = client.groups.list(
-                limit=limit,
-                offset=offset,
-                parent_ids=parent_ids_list,
-                deep=deep,
-                name=name,
-                types=types_list,
-                fields=fields,
-                action=action,
-                sort=sort,
-                authorizations=authorizations,
-                page_id=page_id,
-            )
-
-            if not result:
-                print_info("No groups found.")
-                return
-
-            data = [g.model_dump(by_alias=True) for g in result]
-            output_group_list(data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    parent_ids_list = parse_id_list(parent_ids) if parent_ids else None
+    types_list = [int(t.strip()) for t in types.split(",")] if types else None
+
+    with client:
+        result = client.groups.list(
+            limit=limit,
+            offset=offset,
+            parent_ids=parent_ids_list,
+            deep=deep,
+            name=name,
+            types=types_list,
+            fields=fields,
+            action=action,
+            sort=sort,
+            authorizations=authorizations,
+            page_id=page_id,
+        )
+
+        if not result:
+            print_info("No groups found.")
+            return
+
+        output_group_list(result, output_format)
 
 
 @groups.command(name="get")
@@ -133,11 +126,11 @@ def list_groups(
 @click.option("--authorizations", is_flag=True, default=False, help="Return user's actions and resources")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def get_group(
     group_id: str,
     fields: str | None,
@@ -153,22 +146,13 @@ def get_group(
         sigfox groups get 572f1204017975032d8ec1dd --authorizations
         sigfox groups get 572f1204017975032d8ec1dd --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            group = client.groups.get(group_id, fields=fields, authorizations=authorizations)
-            group_data = group.model_dump(by_alias=True)
-            output_group_detail(group_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        group = client.groups.get(group_id, fields=fields, authorizations=authorizations)
+        output_group_detail(group, output_format)
 
 
 @groups.command(name="create")
@@ -185,11 +169,11 @@ def get_group(
 @click.option("--max-prototypes", type=int, help="Max prototypes allowed")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def create_group(
     name: str,
     description: str,
@@ -212,40 +196,34 @@ def create_group(
         sigfox groups create --name "My Group" --description "Test group" --type 8 --timezone "Europe/Paris" --parent-id abc123
         sigfox groups create --name "SVNO Group" --description "SVNO" --type 5 --timezone "Europe/Paris" --parent-id abc123 --network-operator-id def456
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        group_data = GroupCreate(
-            name=name,
-            description=description,
-            type=group_type,
-            timezone=timezone,
-            parent_id=parent_id,
-            technical_email=technical_email,
-            account_id=account_id,
-            network_operator_id=network_operator_id,
-            country_iso_alpha3=country_iso,
-            billable=billable,
-            max_prototype_allowed=max_prototypes,
-        )
-
-        with client:
-            result = client.groups.create(group_data)
-            group_id = result.get("id", "unknown")
-            print_success(f"Group created successfully (ID: {group_id})")
-
-            # Fetch and display the created group
-            group = client.groups.get(group_id)
-            output_group_detail(group.model_dump(by_alias=True), output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    from sigfox.models import GroupCreate
+
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    group_data = GroupCreate(
+        name=name,
+        description=description,
+        type=group_type,
+        timezone=timezone,
+        parent_id=parent_id,
+        technical_email=technical_email,
+        account_id=account_id,
+        network_operator_id=network_operator_id,
+        country_iso_alpha3=country_iso,
+        billable=billable,
+        max_prototype_allowed=max_prototypes,
+    )
+
+    with client:
+        result = client.groups.create(group_data)
+        group_id = result.get("id", "unknown")
+        print_success(f"Group created successfully (ID: {group_id})")
+
+        # Fetch and display the created group
+        group = client.groups.get(group_id)
+        output_group_detail(group, output_format)
 
 
 @groups.command(name="update")
@@ -257,8 +235,8 @@ def create_group(
 @click.option("--billable", type=bool, help="Whether the group is billable")
 @click.option("--technical-email", help="Technical contact email")
 @click.option("--max-prototypes", type=int, help="Max prototypes allowed")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def update_group(
     group_id: str,
     name: str | None,
@@ -277,50 +255,44 @@ def update_group(
         sigfox groups update 572f1204017975032d8ec1dd --name "New Name"
         sigfox groups update 572f1204017975032d8ec1dd --description "Updated desc" --timezone "America/New_York"
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-
-        has_updates = any([
-            name is not None,
-            description is not None,
-            group_type is not None,
-            timezone is not None,
-            billable is not None,
-            technical_email is not None,
-            max_prototypes is not None,
-        ])
-
-        if not has_updates:
-            print_error("No update fields specified. Use --name, --description, --timezone, etc.")
-            raise click.Abort()
-
-        group_update = GroupUpdate(
-            name=name,
-            description=description,
-            type=group_type,
-            timezone=timezone,
-            billable=billable,
-            technical_email=technical_email,
-            max_prototype_allowed=max_prototypes,
-        )
+    from sigfox.models import GroupUpdate
+
+    client = get_sigfox_from_config(api_login, api_password)
+
+    has_updates = (
+        name is not None
+        or description is not None
+        or group_type is not None
+        or timezone is not None
+        or billable is not None
+        or technical_email is not None
+        or max_prototypes is not None
+    )
+
+    if not has_updates:
+        print_error("No update fields specified. Use --name, --description, --timezone, etc.")
+        raise click.Abort()
 
-        with client:
-            client.groups.update(group_id, group_update)
-            print_success(f"Group {group_id} updated successfully.")
+    group_update = GroupUpdate(
+        name=name,
+        description=description,
+        type=group_type,
+        timezone=timezone,
+        billable=billable,
+        technical_email=technical_email,
+        max_prototype_allowed=max_prototypes,
+    )
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    with client:
+        client.groups.update(group_id, group_update)
+        print_success(f"Group {group_id} updated successfully.")
 
 
 @groups.command(name="delete")
 @click.argument("group_id")
 @click.option("--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def delete_group(
     group_id: str,
     force: bool,
@@ -333,27 +305,17 @@ def delete_group(
         sigfox groups delete 572f1204017975032d8ec1dd
         sigfox groups delete 572f1204017975032d8ec1dd --force
     """
-    try:
-        if not force:
-            click.confirm(
-                f"Are you sure you want to delete group {group_id}?",
-                abort=True,
-            )
-
-        client = get_sigfox_from_config(api_login, api_password)
-
-        with client:
-            client.groups.delete(group_id)
-            print_success(f"Group {group_id} deleted successfully.")
-
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    if not force:
+        click.confirm(
+            f"Are you sure you want to delete group {group_id}?",
+            abort=True,
+        )
+
+    client = get_sigfox_from_config(api_login, api_password)
+
+    with client:
+        client.groups.delete(group_id)
+        print_success(f"Group {group_id} deleted successfully.")
 
 
 @groups.command(name="callbacks-not-delivered")
@@ -364,11 +326,11 @@ def delete_group(
 @click.option("--offset", type=int, default=0, help="Number of items to skip")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def callbacks_not_delivered(
     group_id: str,
     since: int | None,
@@ -387,33 +349,24 @@ def callbacks_not_delivered(
         sigfox groups callbacks-not-delivered abc123 --limit 50
         sigfox groups callbacks-not-delivered abc123 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            errors = client.groups.callbacks_not_delivered(
-                group_id=group_id,
-                since=since,
-                before=before,
-                limit=limit,
-                offset=offset,
-            )
-
-            if not errors:
-                print_info("No undelivered callbacks found.")
-                return
-
-            data = [e.model_dump(by_alias=True) for e in errors]
-            output_callback_error_list(data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        errors = client.groups.callbacks_not_delivered(
+            group_id=group_id,
+            since=since,
+            before=before,
+            limit=limit,
+            offset=offset,
+        )
+
+        if not errors:
+            print_info("No undelivered callbacks found.")
+            return
+
+        output_callback_error_list(errors, output_format)
 
 
 @groups.command(name="geoloc-payloads")
@@ -423,11 +376,11 @@ def callbacks_not_delivered(
 @click.option("--page-id", help="Pagination token for the page to retrieve")
 @click.option(
     "--output", "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option("--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)")
+@api_credentials
+@handle_cli_errors
 def geoloc_payloads(
     group_id: str,
     limit: int,
@@ -444,29 +397,20 @@ def geoloc_payloads(
         sigfox groups geoloc-payloads abc123 --limit 50
         sigfox groups geoloc-payloads abc123 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            payloads = client.groups.geoloc_payloads(
-                group_id=group_id,
-                limit=limit,
-                offset=offset,
-                page_id=page_id,
-            )
-
-            if not payloads:
-                print_info("No geolocation payloads found.")
-                return
-
-            data = [p.model_dump(by_alias=True) for p in payloads]
-            output_geoloc_payload_list(data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        payloads = client.groups.geoloc_payloads(
+            group_id=group_id,
+            limit=limit,
+            offset=offset,
+            page_id=page_id,
+        )
+
+        if not payloads:
+            print_info("No geolocation payloads found.")
+            return
+
+        output_geoloc_payload_list(payloads, output_format)
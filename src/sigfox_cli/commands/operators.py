@@ -2,14 +2,17 @@
 
 import click
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    parse_id_list,
+)
 from ..config import load_config
-from ..exceptions import SigfoxCLIError
 from ..output import (
-    output_json,
     output_operator_detail,
     output_operator_list,
-    print_error,
     print_info,
 )
 
@@ -45,13 +48,11 @@ def operators():
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def list_operators(
     limit: int,
     offset: int,
@@ -72,36 +73,27 @@ def list_operators(
         sigfox operators list --deep
         sigfox operators list --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        group_ids_list = group_ids.split(",") if group_ids else None
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-        with client:
-            result = client.operators.list(
-                limit=limit,
-                offset=offset,
-                group_ids=group_ids_list,
-                deep=deep,
-                fields=fields,
-                authorizations=authorizations,
-            )
+    group_ids_list = parse_id_list(group_ids) if group_ids else None
 
-            if not result:
-                print_info("No operators found.")
-                return
+    with client:
+        result = client.operators.list(
+            limit=limit,
+            offset=offset,
+            group_ids=group_ids_list,
+            deep=deep,
+            fields=fields,
+            authorizations=authorizations,
+        )
 
-            data = [o.model_dump(by_alias=True) for o in result]
-            output_operator_list(data, output_format)
+        if not result:
+            print_info("No operators found.")
+            return
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+        output_operator_list(result, output_format)
 
 
 @operators.command(name="get")
@@ -119,13 +111,11 @@ def list_operators(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def get_operator(
     operator_id: str,
     fields: str | None,
@@ -141,21 +131,12 @@ def get_operator(
         sigfox operators get 5138e7dfa2f1fffaf25fd409 --authorizations
         sigfox operators get 5138e7dfa2f1fffaf25fd409 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            operator = client.operators.get(
-                operator_id, fields=fields, authorizations=authorizations
-            )
-            operator_data = operator.model_dump(by_alias=True)
-            output_operator_detail(operator_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        operator = client.operators.get(
+            operator_id, fields=fields, authorizations=authorizations
+        )
+        output_operator_detail(operator, output_format)
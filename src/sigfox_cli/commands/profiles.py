@@ -2,14 +2,11 @@
 
 import click
 
-from . import get_sigfox_from_config
+from . import OUTPUT_CHOICE, api_credentials, get_sigfox_from_config, handle_cli_errors
 from ..config import load_config
-from ..exceptions import SigfoxCLIError
 from ..output import (
-    output_json,
     output_profile_detail,
     output_profile_list,
-    print_error,
     print_info,
 )
 
@@ -49,13 +46,11 @@ def profiles():
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def list_profiles(
     group_id: str,
     inherit: bool,
@@ -74,34 +69,25 @@ def list_profiles(
         sigfox profiles list --group-id abc123 --inherit
         sigfox profiles list --group-id abc123 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-        with client:
-            result = client.profiles.list(
-                group_id=group_id,
-                inherit=inherit,
-                fields=fields,
-                limit=limit,
-                offset=offset,
-                authorizations=authorizations,
-            )
+    with client:
+        result = client.profiles.list(
+            group_id=group_id,
+            inherit=inherit,
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            authorizations=authorizations,
+        )
 
-            if not result:
-                print_info("No profiles found.")
-                return
+        if not result:
+            print_info("No profiles found.")
+            return
 
-            data = [p.model_dump(by_alias=True) for p in result]
-            output_profile_list(data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+        output_profile_list(result, output_format)
 
 
 @profiles.command(name="get")
@@ -119,13 +105,11 @@ def list_profiles(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def get_profile(
     profile_id: str,
     fields: str | None,
@@ -141,21 +125,12 @@ def get_profile(
         sigfox profiles get 572f71a08916342398fb65c5 --authorizations
         sigfox profiles get 572f71a08916342398fb65c5 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            profile = client.profiles.get(
-                profile_id, fields=fields, authorizations=authorizations
-            )
-            profile_data = profile.model_dump(by_alias=True)
-            output_profile_detail(profile_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        profile = client.profiles.get(
+            profile_id, fields=fields, authorizations=authorizations
+        )
+        output_profile_detail(profile, output_format)
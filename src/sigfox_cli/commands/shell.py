@@ -0,0 +1,51 @@
+"""Interactive shell command."""
+
+import shlex
+
+import click
+
+from ..output import print_error, print_info
+from ..session import session
+
+
+@click.command(name="shell")
+@click.pass_context
+def shell(ctx: click.Context):
+    """Run several commands over one shared API connection.
+
+    Each line is parsed like a normal command line (without the leading
+    "sigfox"). Clients are kept open between commands, so repeated calls
+    reuse the same connection pool. Type "exit" or press Ctrl-D to leave.
+
+    Examples:
+        sigfox shell
+        sigfox> devices list --limit 10
+        sigfox> devices get 1A2B3C
+        sigfox> exit
+    """
+    root = ctx.find_root().command
+    print_info('Type a command (e.g. "devices list"), or "exit" to quit.')
+    with session():
+        while True:
+            try:
+                line = input("sigfox> ")
+            except EOFError:
+                break
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                print_error(f"Invalid command line: {e}")
+                continue
+            if not args:
+                continue
+            if args[0] in ("exit", "quit"):
+                break
+            if args[0] == "shell":
+                print_error("Already in a shell.")
+                continue
+            try:
+                root.main(args, prog_name="sigfox", standalone_mode=False)
+            except click.Abort:
+                pass
+            except click.ClickException as e:
+                e.show()
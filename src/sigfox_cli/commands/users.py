@@ -1,13 +1,16 @@
 """User commands."""
 
 import click
-from sigfox.models import UserCreate, UserUpdate
 
-from . import get_sigfox_from_config
+from . import (
+    OUTPUT_CHOICE,
+    api_credentials,
+    get_sigfox_from_config,
+    handle_cli_errors,
+    parse_id_list,
+)
 from ..config import load_config
-from ..exceptions import SigfoxCLIError
 from ..output import (
-    output_json,
     output_user_detail,
     output_user_list,
     print_error,
@@ -51,13 +54,11 @@ def users():
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def list_users(
     limit: int,
     offset: int,
@@ -79,37 +80,28 @@ def list_users(
         sigfox users list --deep
         sigfox users list --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        group_ids_list = group_ids.split(",") if group_ids else None
-
-        with client:
-            result = client.users.list(
-                limit=limit,
-                offset=offset,
-                group_ids=group_ids_list,
-                deep=deep,
-                fields=fields,
-                sort=sort,
-                authorizations=authorizations,
-            )
-
-            if not result:
-                print_info("No users found.")
-                return
-
-            data = [u.model_dump(by_alias=True) for u in result]
-            output_user_list(data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    group_ids_list = parse_id_list(group_ids) if group_ids else None
+
+    with client:
+        result = client.users.list(
+            limit=limit,
+            offset=offset,
+            group_ids=group_ids_list,
+            deep=deep,
+            fields=fields,
+            sort=sort,
+            authorizations=authorizations,
+        )
+
+        if not result:
+            print_info("No users found.")
+            return
+
+        output_user_list(result, output_format)
 
 
 @users.command(name="get")
@@ -127,13 +119,11 @@ def list_users(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def get_user(
     user_id: str,
     fields: str | None,
@@ -149,24 +139,15 @@ def get_user(
         sigfox users get 5138e7dfa2f1fffaf25fd409 --authorizations
         sigfox users get 5138e7dfa2f1fffaf25fd409 --output json
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        with client:
-            user = client.users.get(
-                user_id, fields=fields, authorizations=authorizations
-            )
-            user_data = user.model_dump(by_alias=True)
-            output_user_detail(user_data, output_format)
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
+
+    with client:
+        user = client.users.get(
+            user_id, fields=fields, authorizations=authorizations
+        )
+        output_user_detail(user, output_format)
 
 
 @users.command(name="create")
@@ -183,13 +164,11 @@ def get_user(
 @click.option(
     "--output",
     "-o",
-    type=click.Choice(["table", "json"]),
+    type=OUTPUT_CHOICE,
     help="Output format",
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def create_user(
     group_id: str,
     first_name: str,
@@ -208,37 +187,31 @@ def create_user(
             --last-name "Doe" --email "john.doe@example.com" \\
             --timezone "Europe/Paris" --role-ids role1,role2
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        cfg = load_config()
-        output_format = output or cfg.output_format
-
-        role_ids_list = [r.strip() for r in role_ids.split(",")]
-
-        user_data = UserCreate(
-            group_id=group_id,
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            timezone=timezone,
-            role_ids=role_ids_list,
-        )
+    from sigfox.models import UserCreate
 
-        with client:
-            result = client.users.create(user_data)
-            user_id = result.get("id", "unknown")
-            print_success(f"User created successfully (ID: {user_id})")
+    cfg = load_config()
+    client = get_sigfox_from_config(api_login, api_password, cfg)
+    output_format = output or cfg.output_format
 
-            # Fetch and display the created user
-            user = client.users.get(user_id)
-            output_user_detail(user.model_dump(by_alias=True), output_format)
+    role_ids_list = parse_id_list(role_ids)
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    user_data = UserCreate(
+        group_id=group_id,
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        timezone=timezone,
+        role_ids=role_ids_list,
+    )
+
+    with client:
+        result = client.users.create(user_data)
+        user_id = result.get("id", "unknown")
+        print_success(f"User created successfully (ID: {user_id})")
+
+        # Fetch and display the created user
+        user = client.users.get(user_id)
+        output_user_detail(user, output_format)
 
 
 @users.command(name="update")
@@ -248,10 +221,8 @@ def create_user(
 @click.option("--email", help="User's email address")
 @click.option("--timezone", help="Timezone (Java TimeZone ID)")
 @click.option("--role-ids", help="Role IDs (comma-separated, replaces existing)")
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def update_user(
     user_id: str,
     first_name: str | None,
@@ -270,58 +241,46 @@ def update_user(
         sigfox users update 5138e7dfa2f1fffaf25fd409 --timezone "America/New_York"
         sigfox users update 5138e7dfa2f1fffaf25fd409 --role-ids role1,role2
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-
-        has_updates = any([
-            first_name is not None,
-            last_name is not None,
-            email is not None,
-            timezone is not None,
-            role_ids is not None,
-        ])
-
-        if not has_updates:
-            print_error(
-                "No update fields specified. Use --first-name, --last-name, --email, --timezone, or --role-ids."
-            )
-            raise click.Abort()
-
-        role_ids_list = (
-            [r.strip() for r in role_ids.split(",")]
-            if role_ids is not None
-            else None
-        )
+    from sigfox.models import UserUpdate
 
-        user_update = UserUpdate(
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            timezone=timezone,
-            role_ids=role_ids_list,
-        )
+    client = get_sigfox_from_config(api_login, api_password)
 
-        with client:
-            client.users.update(user_id, user_update)
-            print_success(f"User {user_id} updated successfully.")
+    has_updates = (
+        first_name is not None
+        or last_name is not None
+        or email is not None
+        or timezone is not None
+        or role_ids is not None
+    )
 
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
+    if not has_updates:
+        print_error(
+            "No update fields specified. Use --first-name, --last-name, --email, --timezone, or --role-ids."
+        )
         raise click.Abort()
 
+    role_ids_list = parse_id_list(role_ids) if role_ids is not None else None
+
+    user_update = UserUpdate(
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        timezone=timezone,
+        role_ids=role_ids_list,
+    )
+
+    with client:
+        client.users.update(user_id, user_update)
+        print_success(f"User {user_id} updated successfully.")
+
 
 @users.command(name="delete")
 @click.argument("user_id")
 @click.option(
     "--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def delete_user(
     user_id: str,
     force: bool,
@@ -334,27 +293,17 @@ def delete_user(
         sigfox users delete 5138e7dfa2f1fffaf25fd409
         sigfox users delete 5138e7dfa2f1fffaf25fd409 --force
     """
-    try:
-        if not force:
-            click.confirm(
-                f"Are you sure you want to delete user {user_id}?",
-                abort=True,
-            )
-
-        client = get_sigfox_from_config(api_login, api_password)
-
-        with client:
-            client.users.delete(user_id)
-            print_success(f"User {user_id} deleted successfully.")
-
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    if not force:
+        click.confirm(
+            f"Are you sure you want to delete user {user_id}?",
+            abort=True,
+        )
+
+    client = get_sigfox_from_config(api_login, api_password)
+
+    with client:
+        client.users.delete(user_id)
+        print_success(f"User {user_id} deleted successfully.")
 
 
 @users.command(name="add-roles")
@@ -362,10 +311,8 @@ def delete_user(
 @click.option(
     "--role-ids", required=True, help="Role IDs to associate (comma-separated)"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def add_roles(
     user_id: str,
     role_ids: str,
@@ -377,22 +324,14 @@ def add_roles(
     Examples:
         sigfox users add-roles 5138e7dfa2f1fffaf25fd409 --role-ids role1,role2
     """
-    try:
-        client = get_sigfox_from_config(api_login, api_password)
-        role_ids_list = [r.strip() for r in role_ids.split(",")]
-
-        with client:
-            client.users.add_roles(user_id, role_ids_list)
-            print_success(
-                f"Roles associated to user {user_id} successfully."
-            )
-
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    client = get_sigfox_from_config(api_login, api_password)
+    role_ids_list = parse_id_list(role_ids)
+
+    with client:
+        client.users.add_roles(user_id, role_ids_list)
+        print_success(
+            f"Roles associated to user {user_id} successfully."
+        )
 
 
 @users.command(name="remove-role")
@@ -401,10 +340,8 @@ def add_roles(
 @click.option(
     "--force", "-f", is_flag=True, default=False, help="Skip confirmation prompt"
 )
-@click.option("--api-login", envvar="SIGFOX_API_LOGIN", help="API login (ID)")
-@click.option(
-    "--api-password", envvar="SIGFOX_API_PASSWORD", help="API password (secret)"
-)
+@api_credentials
+@handle_cli_errors
 def remove_role(
     user_id: str,
     role_id: str,
@@ -418,26 +355,16 @@ def remove_role(
         sigfox users remove-role 5138e7dfa2f1fffaf25fd409 role001
         sigfox users remove-role 5138e7dfa2f1fffaf25fd409 role001 --force
     """
-    try:
-        if not force:
-            click.confirm(
-                f"Are you sure you want to remove role {role_id} from user {user_id}?",
-                abort=True,
-            )
-
-        client = get_sigfox_from_config(api_login, api_password)
-
-        with client:
-            client.users.remove_role(user_id, role_id)
-            print_success(
-                f"Role {role_id} removed from user {user_id} successfully."
-            )
-
-    except click.Abort:
-        raise
-    except SigfoxCLIError as e:
-        print_error(str(e))
-        raise click.Abort()
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        raise click.Abort()
+    if not force:
+        click.confirm(
+            f"Are you sure you want to remove role {role_id} from user {user_id}?",
+            abort=True,
+        )
+
+    client = get_sigfox_from_config(api_login, api_password)
+
+    with client:
+        client.users.remove_role(user_id, role_id)
+        print_success(
+            f"Role {role_id} removed from user {user_id} successfully."
+        )
@@ -1,9 +1,11 @@
 """Configuration management for Sigfox CLI."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-from pydantic import Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -45,6 +47,11 @@ class SigfoxConfig(BaseSettings):
         ge=1,
         le=300,
     )
+    cache_ttl: int = Field(
+        default=0,
+        description="Lifetime in seconds of GET responses cached on disk (0 disables)",
+        ge=0,
+    )
 
     @property
     def is_configured(self) -> bool:
@@ -58,25 +65,84 @@ class SigfoxConfig(BaseSettings):
         return self.api_password.get_secret_value()
 
 
+class ConfigInit(BaseModel):
+    """Settings accepted by ``config init --from-file``.
+
+    Defaults and bounds match SigfoxConfig; unknown keys are rejected so
+    typos are reported instead of silently ignored.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    api_login: str
+    api_password: str
+    api_base_url: str = "https://api.sigfox.com/v2"
+    output_format: Literal["table", "json"] = "table"
+    timeout: int = Field(default=30, ge=1, le=300)
+    cache_ttl: int = Field(default=0, ge=0)
+
+
 def get_config_dir() -> Path:
     """Get the configuration directory path."""
-    config_dir = Path.home() / ".config" / "sigfox-cli"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return _config_paths(os.path.expanduser("~"))[0]
 
 
 def get_config_file() -> Path:
     """Get the configuration file path."""
-    return get_config_dir() / "config.toml"
+    return _config_paths(os.path.expanduser("~"))[1]
+
+
+@lru_cache(maxsize=1)
+def _config_paths(home: str) -> tuple[Path, Path]:
+    """Resolve (and create) the config directory once per home directory.
+
+    Keyed on the expanded ``~`` (what Path.home() returns) rather than
+    Path.home() itself, which costs several times more to construct.
+    """
+    config_dir = Path(home) / ".config" / "sigfox-cli"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir, config_dir / "config.toml"
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return (mtime, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 def load_config() -> SigfoxConfig:
-    """Load configuration from environment and config file."""
+    """Load configuration from environment and config file.
+
+    The result is memoized for the process and reloaded only when the
+    SIGFOX_* environment, the working directory's .env file or the config
+    file changes, so repeated calls do not re-read and re-parse the files.
+    """
+    config_file = get_config_file()
+    env_file = Path.cwd() / ".env"
+    env = tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("SIGFOX_"))
+    )
+    return _load_config(
+        config_file, _file_stamp(config_file), env_file, _file_stamp(env_file), env
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_config(
+    config_file: Path,
+    config_stamp: tuple[int, int] | None,
+    env_file: Path,
+    env_stamp: tuple[int, int] | None,
+    env: tuple[tuple[str, str], ...],
+) -> SigfoxConfig:
+    """Load the configuration; the arguments only key the memoized result."""
     config = SigfoxConfig()
 
     # Try to load from TOML config file
-    config_file = get_config_file()
-    if config_file.exists():
+    if config_stamp is not None:
         import tomllib
 
         with open(config_file, "rb") as f:
@@ -96,6 +162,8 @@ def load_config() -> SigfoxConfig:
                 config.output_format = output["default_format"]
             if "timeout" in api:
                 config.timeout = api["timeout"]
+            if "cache_ttl" in api and "cache_ttl" not in config.model_fields_set:
+                config.cache_ttl = api["cache_ttl"]
 
     return config
 
@@ -106,6 +174,7 @@ def save_config(
     api_base_url: str | None = None,
     output_format: str | None = None,
     timeout: int | None = None,
+    cache_ttl: int | None = None,
 ) -> None:
     """Save configuration to TOML file."""
     config_file = get_config_file()
@@ -127,24 +196,28 @@ def save_config(
         if api_password is not None:
             config_data["auth"]["api_password"] = api_password
 
-    if api_base_url is not None or timeout is not None:
+    if api_base_url is not None or timeout is not None or cache_ttl is not None:
         if "api" not in config_data:
             config_data["api"] = {}
         if api_base_url is not None:
             config_data["api"]["base_url"] = api_base_url
         if timeout is not None:
             config_data["api"]["timeout"] = timeout
+        if cache_ttl is not None:
+            config_data["api"]["cache_ttl"] = cache_ttl
 
     if output_format is not None:
         if "output" not in config_data:
             config_data["output"] = {}
         config_data["output"]["default_format"] = output_format
 
-    # Write to file
+    # Write to file (recreating the directory if it was removed meanwhile)
     import tomli_w
 
+    config_file.parent.mkdir(parents=True, exist_ok=True)
     with open(config_file, "wb") as f:
         tomli_w.dump(config_data, f)
 
     # Set proper permissions (read/write for owner only)
     config_file.chmod(0o600)
+    _load_config.cache_clear()
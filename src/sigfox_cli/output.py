@@ -1,11 +1,11 @@
 """Output formatting utilities."""
 
-import json
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
 from rich.console import Console
-from rich.json import JSON
+from rich.highlighter import JSONHighlighter
 from rich.table import Table
 
 
@@ -47,35 +47,81 @@ def format_hex(hex_str: str | None, max_length: int = 32) -> str:
     return hex_str
 
 
+def _is_model(item: Any) -> bool:
+    """Return whether item is a pydantic model (checked without importing pydantic)."""
+    return hasattr(item, "__pydantic_serializer__")
+
+
+def _to_dict(item: Any) -> Any:
+    """Dump a pydantic model with its API (camelCase) field names; pass dicts through."""
+    return item.model_dump(by_alias=True) if _is_model(item) else item
+
+
+def _to_json(item: Any) -> str:
+    """Serialize an item as indented JSON.
+
+    Pydantic models are written by their compiled serializer straight to
+    JSON, skipping the intermediate dict. Other data goes through
+    pydantic-core's to_json, which is several times faster than json.dumps
+    and also handles datetimes.
+    """
+    if _is_model(item):
+        return item.__pydantic_serializer__.to_json(item, by_alias=True, indent=2).decode()
+    from pydantic_core import to_json
+
+    return to_json(item, indent=2).decode()
+
+
 def output_json(data: Any) -> None:
     """Output data as formatted JSON.
 
+    Iterators are written as a JSON array one item at a time, without
+    collecting them into a list first. Pydantic models (alone, in a list or
+    from an iterator) are serialized directly with their API field names.
+
     Args:
         data: Data to output
     """
     if isinstance(data, str):
         console.print(data)
+    elif isinstance(data, Iterator):
+        _output_json_stream(data)
+    elif isinstance(data, list) and data and _is_model(data[0]):
+        _output_json_stream(iter(data))
     else:
-        json_str = json.dumps(data, indent=2, ensure_ascii=False)
-        console.print(JSON(json_str))
+        text = JSONHighlighter()(_to_json(data))
+        text.no_wrap = True
+        text.overflow = None
+        console.print(text)
+
+
+def _output_json_stream(items: Iterator[Any]) -> None:
+    """Write items as an indented JSON array, printing each as it arrives."""
+    highlight = JSONHighlighter()
+    console.print("[", markup=False, highlight=False)
+    previous = None
+    for item in items:
+        if previous is not None:
+            console.print(highlight(f"{previous},"))
+        previous = "  " + _to_json(item).replace("\n", "\n  ")
+    if previous is not None:
+        console.print(highlight(previous))
+    console.print("]", markup=False, highlight=False)
 
 
 def output_table(
-    data: list[dict[str, Any]],
+    data: Iterable[Any],
     columns: list[tuple[str, str]],
     title: str | None = None,
 ) -> None:
     """Output data as a table.
 
     Args:
-        data: List of data items
+        data: Data items as dicts or pydantic models (a list, or an iterator
+            consumed once)
         columns: List of (header, key) tuples defining table columns
         title: Optional table title
     """
-    if not data:
-        console.print("[dim]No data to display[/dim]")
-        return
-
     table = Table(title=title, show_header=True, header_style="bold cyan")
 
     # Add columns
@@ -83,7 +129,7 @@ def output_table(
         table.add_column(header)
 
     # Add rows
-    for item in data:
+    for item in map(_to_dict, data):
         row = []
         for _, key in columns:
             # Support nested keys with dot notation (e.g., "device.name")
@@ -109,14 +155,18 @@ def output_table(
 
         table.add_row(*row)
 
+    if not table.row_count:
+        console.print("[dim]No data to display[/dim]")
+        return
+
     console.print(table)
 
 
-def output_device_list(devices: list[dict[str, Any]], output_format: str = "table") -> None:
+def output_device_list(devices: list[Any], output_format: str = "table") -> None:
     """Output device list in specified format.
 
     Args:
-        devices: List of device data
+        devices: List of device data (dicts or Device models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -133,16 +183,17 @@ def output_device_list(devices: list[dict[str, Any]], output_format: str = "tabl
         output_table(devices, columns, title="Devices")
 
 
-def output_device_detail(device: dict[str, Any], output_format: str = "table") -> None:
+def output_device_detail(device: Any, output_format: str = "table") -> None:
     """Output device details in specified format.
 
     Args:
-        device: Device data
+        device: Device data (a dict or Device model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(device)
     else:
+        device = _to_dict(device)
         # Create a two-column table for key-value pairs
         table = Table(show_header=False, title="Device Details")
         table.add_column("Property", style="bold cyan")
@@ -189,11 +240,12 @@ def output_device_detail(device: dict[str, Any], output_format: str = "table") -
         console.print(table)
 
 
-def output_message_list(messages: list[dict[str, Any]], output_format: str = "table") -> None:
+def output_message_list(messages: Iterable[Any], output_format: str = "table") -> None:
     """Output message list in specified format.
 
     Args:
-        messages: List of message data
+        messages: Message dicts or models (a list, or an iterator streamed as it
+            is consumed)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -210,11 +262,11 @@ def output_message_list(messages: list[dict[str, Any]], output_format: str = "ta
         output_table(messages, columns, title="Messages")
 
 
-def output_device_type_list(device_types: list[dict[str, Any]], output_format: str = "table") -> None:
+def output_device_type_list(device_types: list[Any], output_format: str = "table") -> None:
     """Output device type list in specified format.
 
     Args:
-        device_types: List of device type data
+        device_types: List of device type data (dicts or DeviceType models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -232,16 +284,17 @@ def output_device_type_list(device_types: list[dict[str, Any]], output_format: s
         output_table(device_types, columns, title="Device Types")
 
 
-def output_device_type_detail(device_type: dict[str, Any], output_format: str = "table") -> None:
+def output_device_type_detail(device_type: Any, output_format: str = "table") -> None:
     """Output device type details in specified format.
 
     Args:
-        device_type: Device type data
+        device_type: Device type data (a dict or DeviceType model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(device_type)
     else:
+        device_type = _to_dict(device_type)
         table = Table(show_header=False, title="Device Type Details")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -285,11 +338,11 @@ def output_device_type_detail(device_type: dict[str, Any], output_format: str =
         console.print(table)
 
 
-def output_group_list(groups: list[dict[str, Any]], output_format: str = "table") -> None:
+def output_group_list(groups: list[Any], output_format: str = "table") -> None:
     """Output group list in specified format.
 
     Args:
-        groups: List of group data
+        groups: List of group data (dicts or models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -306,16 +359,17 @@ def output_group_list(groups: list[dict[str, Any]], output_format: str = "table"
         output_table(groups, columns, title="Groups")
 
 
-def output_group_detail(group: dict[str, Any], output_format: str = "table") -> None:
+def output_group_detail(group: Any, output_format: str = "table") -> None:
     """Output group details in specified format.
 
     Args:
-        group: Group data
+        group: Group data (a dict or Group model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(group)
     else:
+        group = _to_dict(group)
         table = Table(show_header=False, title="Group Details")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -361,12 +415,12 @@ def output_group_detail(group: dict[str, Any], output_format: str = "table") ->
 
 
 def output_callback_error_list(
-    errors: list[dict[str, Any]], output_format: str = "table"
+    errors: list[Any], output_format: str = "table"
 ) -> None:
     """Output callback error list in specified format.
 
     Args:
-        errors: List of callback error data
+        errors: List of callback error data (dicts or models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -384,12 +438,12 @@ def output_callback_error_list(
 
 
 def output_geoloc_payload_list(
-    payloads: list[dict[str, Any]], output_format: str = "table"
+    payloads: list[Any], output_format: str = "table"
 ) -> None:
     """Output geolocation payload list in specified format.
 
     Args:
-        payloads: List of geolocation payload data
+        payloads: List of geolocation payload data (dicts or models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -403,12 +457,13 @@ def output_geoloc_payload_list(
 
 
 def output_api_user_list(
-    api_users: list[dict[str, Any]], output_format: str = "table"
+    api_users: Iterable[Any], output_format: str = "table"
 ) -> None:
     """Output API user list in specified format.
 
     Args:
-        api_users: List of API user data
+        api_users: API user dicts or models (a list, or an iterator streamed as
+            it is consumed)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -425,17 +480,18 @@ def output_api_user_list(
 
 
 def output_api_user_detail(
-    api_user: dict[str, Any], output_format: str = "table"
+    api_user: Any, output_format: str = "table"
 ) -> None:
     """Output API user details in specified format.
 
     Args:
-        api_user: API user data
+        api_user: API user data (a dict or ApiUser model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(api_user)
     else:
+        api_user = _to_dict(api_user)
         table = Table(show_header=False, title="API User Details")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -481,12 +537,12 @@ def output_api_user_detail(
 
 
 def output_user_list(
-    users: list[dict[str, Any]], output_format: str = "table"
+    users: list[Any], output_format: str = "table"
 ) -> None:
     """Output user list in specified format.
 
     Args:
-        users: List of user data
+        users: List of user data (dicts or models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -505,17 +561,18 @@ def output_user_list(
 
 
 def output_user_detail(
-    user: dict[str, Any], output_format: str = "table"
+    user: Any, output_format: str = "table"
 ) -> None:
     """Output user details in specified format.
 
     Args:
-        user: User data
+        user: User data (a dict or User model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(user)
     else:
+        user = _to_dict(user)
         table = Table(show_header=False, title="User Details")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -562,16 +619,17 @@ def output_user_detail(
         console.print(table)
 
 
-def output_coverage_prediction(data: dict[str, Any], output_format: str = "table") -> None:
+def output_coverage_prediction(data: Any, output_format: str = "table") -> None:
     """Output coverage prediction in specified format.
 
     Args:
-        data: Coverage prediction data (locationCovered, margins)
+        data: Coverage prediction data as a dict or model (locationCovered, margins)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(data)
     else:
+        data = _to_dict(data)
         table = Table(show_header=False, title="Coverage Prediction")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -588,16 +646,17 @@ def output_coverage_prediction(data: dict[str, Any], output_format: str = "table
         console.print(table)
 
 
-def output_coverage_bulk_response(data: dict[str, Any], output_format: str = "table") -> None:
+def output_coverage_bulk_response(data: Any, output_format: str = "table") -> None:
     """Output bulk coverage prediction response in specified format.
 
     Args:
-        data: Bulk coverage response data (jobDone, time, results)
+        data: Bulk coverage response data as a dict or model (jobDone, time, results)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(data)
     else:
+        data = _to_dict(data)
         job_done = data.get("jobDone")
         if job_done is False:
             console.print("[yellow]Job still processing. Try again later.[/yellow]")
@@ -630,16 +689,17 @@ def output_coverage_bulk_response(data: dict[str, Any], output_format: str = "ta
         console.print(table)
 
 
-def output_coverage_redundancy(data: dict[str, Any], output_format: str = "table") -> None:
+def output_coverage_redundancy(data: Any, output_format: str = "table") -> None:
     """Output operator redundancy coverage in specified format.
 
     Args:
-        data: Redundancy coverage data (redundancy)
+        data: Redundancy coverage data as a dict or model (redundancy)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(data)
     else:
+        data = _to_dict(data)
         table = Table(show_header=False, title="Operator Redundancy")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -670,13 +730,22 @@ PRICING_MODEL_LABELS = {
 }
 
 
+def _label_subscription_plan(item: dict[str, Any]) -> dict[str, Any]:
+    """Resolve the subscription plan integer of a contract info to its label."""
+    plan = item.get("subscriptionPlan")
+    if plan is not None:
+        item["subscriptionPlan"] = SUBSCRIPTION_PLAN_LABELS.get(plan, str(plan))
+    return item
+
+
 def output_contract_info_list(
-    contract_infos: list[dict[str, Any]], output_format: str = "table"
+    contract_infos: Iterable[Any], output_format: str = "table"
 ) -> None:
     """Output contract info list in specified format.
 
     Args:
-        contract_infos: List of contract info data
+        contract_infos: Contract info dicts or models (a list, or an iterator
+            streamed as it is consumed)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -693,26 +762,26 @@ def output_contract_info_list(
             ("Tokens In Use", "tokensInUse"),
             ("Max Tokens", "maxTokens"),
         ]
-        # Resolve subscription plan integer to label before passing to table
-        for item in contract_infos:
-            plan = item.get("subscriptionPlan")
-            if plan is not None:
-                item["subscriptionPlan"] = SUBSCRIPTION_PLAN_LABELS.get(plan, str(plan))
-        output_table(contract_infos, columns, title="Contract Infos")
+        rows = (
+            _label_subscription_plan(_to_dict(contract_info))
+            for contract_info in contract_infos
+        )
+        output_table(rows, columns, title="Contract Infos")
 
 
 def output_contract_info_detail(
-    contract_info: dict[str, Any], output_format: str = "table"
+    contract_info: Any, output_format: str = "table"
 ) -> None:
     """Output contract info details in specified format.
 
     Args:
-        contract_info: Contract info data
+        contract_info: Contract info data (a dict or ContractInfo model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(contract_info)
     else:
+        contract_info = _to_dict(contract_info)
         table = Table(show_header=False, title="Contract Info Details")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -774,12 +843,12 @@ def output_contract_info_detail(
 
 
 def output_operator_list(
-    operators: list[dict[str, Any]], output_format: str = "table"
+    operators: list[Any], output_format: str = "table"
 ) -> None:
     """Output operator list in specified format.
 
     Args:
-        operators: List of operator data
+        operators: List of operator data (dicts or models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
@@ -797,17 +866,18 @@ def output_operator_list(
 
 
 def output_operator_detail(
-    operator: dict[str, Any], output_format: str = "table"
+    operator: Any, output_format: str = "table"
 ) -> None:
     """Output operator details in specified format.
 
     Args:
-        operator: Operator data
+        operator: Operator data (a dict or Operator model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(operator)
     else:
+        operator = _to_dict(operator)
         table = Table(show_header=False, title="Operator Details")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -845,22 +915,23 @@ def output_operator_detail(
 
 
 def output_profile_list(
-    profiles: list[dict[str, Any]], output_format: str = "table"
+    profiles: list[Any], output_format: str = "table"
 ) -> None:
     """Output profile list in specified format.
 
     Args:
-        profiles: List of profile data
+        profiles: List of profile data (dicts or models)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(profiles)
     else:
+        profiles = list(map(_to_dict, profiles))
         for item in profiles:
             roles = item.get("roles")
             if roles and isinstance(roles, list):
                 item["_roles_display"] = ", ".join(
-                    r.get("name", r.get("id", "?")) for r in roles
+                    [r.get("name", r.get("id", "?")) for r in roles]
                 )
             else:
                 item["_roles_display"] = "-"
@@ -875,17 +946,18 @@ def output_profile_list(
 
 
 def output_profile_detail(
-    profile: dict[str, Any], output_format: str = "table"
+    profile: Any, output_format: str = "table"
 ) -> None:
     """Output profile details in specified format.
 
     Args:
-        profile: Profile data
+        profile: Profile data (a dict or Profile model)
         output_format: Output format ("table" or "json")
     """
     if output_format == "json":
         output_json(profile)
     else:
+        profile = _to_dict(profile)
         table = Table(show_header=False, title="Profile Details")
         table.add_column("Property", style="bold cyan")
         table.add_column("Value")
@@ -951,10 +1023,10 @@ def print_warning(message: str) -> None:
     console.print(f"[yellow]⚠[/yellow] {message}")
 
 
-def print_info(message: str) -> None:
-    """Print info message.
+def print_info(*messages: str) -> None:
+    """Print info messages, one per line, in a single write.
 
     Args:
-        message: Info message
+        messages: Info messages
     """
-    console.print(f"[blue]ℹ[/blue] {message}")
+    console.print("\n".join(f"[blue]ℹ[/blue] {message}" for message in messages))
@@ -0,0 +1,89 @@
+"""Client sharing across the commands run in one process."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sigfox import Sigfox
+
+# (login, password, base URL, timeout, cache TTL, ETag cache) -> client; None
+# outside a session
+_clients: dict[tuple[str, str, str, int, int, bool], "SharedSigfox"] | None = None
+
+
+class SharedSigfox(Sigfox):
+    """Sigfox client whose connection pool outlives a single command."""
+
+    __slots__ = ()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Keep the client open; it is closed when the session ends."""
+
+
+@contextmanager
+def session() -> Iterator[None]:
+    """Share one Sigfox client per set of credentials until the block exits.
+
+    Commands run inside the block reuse the same connection pool (and the
+    client's response, ETag and 404 caches) instead of building a new
+    client each time.
+    """
+    global _clients
+    _clients = {}
+    try:
+        yield
+    finally:
+        clients, _clients = _clients, None
+        for client in clients.values():
+            client.close()
+
+
+def get_sigfox(
+    login: str,
+    password: str,
+    base_url: str,
+    timeout: int,
+    cache_ttl: int = 0,
+    etag_cache: bool | None = None,
+) -> Sigfox:
+    """Return the session's client for these settings, or a new client.
+
+    Args:
+        login: Sigfox API login (ID)
+        password: Sigfox API password (secret)
+        base_url: API base URL
+        timeout: Request timeout in seconds
+        cache_ttl: Lifetime in seconds of GET responses cached on disk, shared
+            with later invocations (0 keeps the client's in-process cache)
+        etag_cache: Revalidate repeated GETs with their stored ETag. Defaults
+            to on inside session(), whose clients are long-lived and re-read
+            the same resources, and off for single commands
+
+    Returns:
+        A shared client inside session(), otherwise a new Sigfox client
+    """
+    cls = Sigfox
+    if etag_cache is None:
+        etag_cache = _clients is not None
+    if _clients is not None:
+        key = (login, password, base_url, timeout, cache_ttl, etag_cache)
+        client = _clients.get(key)
+        if client is not None:
+            return client
+        cls = SharedSigfox
+
+    response_cache = None
+    if cache_ttl > 0:
+        from .cache import get_disk_cache
+
+        response_cache = get_disk_cache(login, base_url, cache_ttl)
+    client = cls(
+        login=login,
+        password=password,
+        base_url=base_url,
+        timeout=timeout,
+        response_cache=response_cache,
+        etag_cache=etag_cache,
+    )
+    if _clients is not None:
+        _clients[key] = client
+    return client
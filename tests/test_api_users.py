@@ -1,5 +1,7 @@
 """Tests for api-users commands."""
 
+import json
+
 import httpx
 import pytest
 import respx
@@ -54,6 +56,12 @@ def test_list_api_users_empty(runner):
     assert "No API users found" in result.output
 
 
+def test_list_api_users_rejects_zero_limit(runner):
+    """Test --limit 0 fails at parse time instead of listing nothing."""
+    result = runner.invoke(cli, ["api-users", "list", "--limit", "0"])
+    assert result.exit_code == 2
+
+
 @respx.mock
 def test_list_api_users_json(runner):
     """Test listing API users in JSON format."""
@@ -159,6 +167,46 @@ def test_create_api_user(runner):
     assert "created successfully" in result.output
 
 
+@respx.mock
+def test_create_api_user_uses_full_create_response(runner):
+    """Test create skips the follow-up GET when the response has the API user."""
+    respx.post("https://api.sigfox.com/v2/api-users/").mock(
+        return_value=httpx.Response(
+            201,
+            json={"id": "newusr001", "name": "New User", "timezone": "Europe/Paris"},
+        )
+    )
+    get_route = respx.get("https://api.sigfox.com/v2/api-users/newusr001")
+    result = runner.invoke(
+        cli,
+        [
+            "api-users", "create", "--group-id", "grp001", "--name", "New User",
+            "--timezone", "Europe/Paris", "--profile-ids", "prof001",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "New User" in result.output
+    assert not get_route.called
+
+
+@respx.mock
+def test_create_api_user_no_refetch(runner):
+    """Test create --no-refetch prints the new ID without fetching the API user."""
+    respx.post("https://api.sigfox.com/v2/api-users/").mock(
+        return_value=httpx.Response(201, json={"id": "newusr001"})
+    )
+    get_route = respx.get("https://api.sigfox.com/v2/api-users/newusr001")
+    result = runner.invoke(
+        cli,
+        [
+            "api-users", "create", "--group-id", "grp001", "--name", "New User",
+            "--timezone", "Europe/Paris", "--profile-ids", "prof001", "--no-refetch",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "newusr001" in result.output
+    assert not get_route.called
+
 def test_create_api_user_missing_name(runner):
     """Test creating an API user without required name."""
     result = runner.invoke(
@@ -326,6 +374,31 @@ def test_add_profiles(runner):
     assert "Profiles associated" in result.output
 
 
+
+@respx.mock
+def test_add_profiles_strips_ids(runner):
+    """Test add-profiles strips whitespace and drops empty IDs."""
+    route = respx.put("https://api.sigfox.com/v2/api-users/usr001/profiles").mock(
+        return_value=httpx.Response(204)
+    )
+    result = runner.invoke(
+        cli,
+        ["api-users", "add-profiles", "usr001", "--profile-ids", " prof001, ,prof002,"],
+    )
+    assert result.exit_code == 0
+    assert json.loads(route.calls.last.request.content) == {
+        "profileIds": ["prof001", "prof002"]
+    }
+
+
+def test_add_profiles_rejects_empty_ids(runner):
+    """Test add-profiles fails before any request when no ID is given."""
+    result = runner.invoke(
+        cli, ["api-users", "add-profiles", "usr001", "--profile-ids", " , "]
+    )
+    assert result.exit_code == 2
+    assert "No IDs given" in result.output
+
 # --- Remove Profile ---
 
 
@@ -353,6 +426,64 @@ def test_remove_profile_confirm_abort(runner):
     assert result.exit_code != 0
 
 
+
+@respx.mock
+def test_remove_profile_batch(runner):
+    """Test removing several profiles given as options and on stdin."""
+    routes = {
+        pid: respx.delete(
+            f"https://api.sigfox.com/v2/api-users/usr001/profiles/{pid}"
+        ).mock(return_value=httpx.Response(204))
+        for pid in ("prof001", "prof002", "prof003")
+    }
+    result = runner.invoke(
+        cli,
+        [
+            "api-users", "remove-profile", "usr001", "prof001",
+            "-p", "prof002,prof001", "--from-stdin", "--force",
+        ],
+        input="prof003\n",
+    )
+    assert result.exit_code == 0
+    assert "3 profile(s) removed" in result.output
+    assert all(route.call_count == 1 for route in routes.values())
+
+
+@respx.mock
+def test_remove_profile_batch_reports_failures(runner):
+    """Test a batch removal reports each failed profile and exits non-zero."""
+    respx.delete("https://api.sigfox.com/v2/api-users/usr001/profiles/prof001").mock(
+        return_value=httpx.Response(204)
+    )
+    respx.delete("https://api.sigfox.com/v2/api-users/usr001/profiles/prof002").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+    result = runner.invoke(
+        cli,
+        ["api-users", "remove-profile", "usr001", "-p", "prof001", "-p", "prof002", "-f"],
+    )
+    assert result.exit_code != 0
+    assert "1 profile(s) removed" in result.output
+    assert "prof002" in result.output
+
+
+def test_remove_profile_from_stdin_requires_force(runner):
+    """Test --from-stdin without --force is rejected before reading stdin."""
+    result = runner.invoke(
+        cli,
+        ["api-users", "remove-profile", "usr001", "--from-stdin"],
+        input="prof001\nprof002\n",
+    )
+    assert result.exit_code == 2
+    assert "--from-stdin requires --force" in result.output
+
+
+def test_remove_profile_requires_ids(runner):
+    """Test remove-profile fails without any profile ID."""
+    result = runner.invoke(cli, ["api-users", "remove-profile", "usr001", "-f"])
+    assert result.exit_code == 2
+
+
 # --- Renew Credential ---
 
 
@@ -398,3 +529,35 @@ def test_renew_credential_json(runner):
     )
     assert result.exit_code == 0
     assert "accessToken" in result.output
+
+
+@respx.mock
+def test_list_api_users_json_streamed(runner):
+    """Test streamed JSON list output is a valid JSON array."""
+    respx.get("https://api.sigfox.com/v2/api-users/").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [{"id": "usr001", "name": "User A"}, {"id": "usr002"}]},
+        )
+    )
+    result = runner.invoke(cli, ["api-users", "list", "--output", "json"])
+    assert result.exit_code == 0
+    assert [u["id"] for u in json.loads(result.output)] == ["usr001", "usr002"]
+
+
+@respx.mock
+def test_list_api_users_pages_large_limit(runner):
+    """Test a limit above the page size is fetched in pages of 100."""
+    route = respx.get("https://api.sigfox.com/v2/api-users/").mock(
+        side_effect=[
+            httpx.Response(200, json={"data": [{"id": f"usr{i}"} for i in range(100)]}),
+            httpx.Response(200, json={"data": [{"id": "usr100"}]}),
+        ]
+    )
+    result = runner.invoke(cli, ["api-users", "list", "--limit", "150", "--output", "json"])
+    assert result.exit_code == 0
+    assert len(json.loads(result.output)) == 101
+    assert [dict(c.request.url.params) for c in route.calls] == [
+        {"limit": "100", "offset": "0"},
+        {"limit": "50", "offset": "100"},
+    ]
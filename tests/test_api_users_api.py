@@ -5,6 +5,7 @@ import pytest
 import respx
 
 from sigfox import Sigfox
+from sigfox.exceptions import NotFoundError
 from sigfox.models import ApiUserCreate, ApiUserUpdate
 
 
@@ -127,3 +128,61 @@ def test_api_users_renew_credential(sigfox_client):
     with sigfox_client as client:
         result = client.api_users.renew_credential("usr001")
         assert result["accessToken"] == "new_token_abc123"
+
+
+@respx.mock
+def test_api_users_remove_profiles_bulk(sigfox_client):
+    """Test ApiUsersAPI.remove_profiles_bulk() issues one DELETE per pair."""
+    routes = [
+        respx.delete(f"https://api.sigfox.com/v2/api-users/{u}/profiles/{p}").mock(
+            return_value=httpx.Response(204)
+        )
+        for u, p in [("user001", "prof1"), ("user002", "prof2")]
+    ]
+
+    with sigfox_client as client:
+        failures = client.api_users.remove_profiles_bulk(
+            [("user001", "prof1"), ("user002", "prof2")]
+        )
+        assert failures == {}
+        assert all(route.called for route in routes)
+
+
+@respx.mock
+def test_api_users_remove_profiles_bulk_failures(sigfox_client):
+    """Test remove_profiles_bulk() attempts every pair and returns the failures."""
+    ok = respx.delete("https://api.sigfox.com/v2/api-users/user001/profiles/prof1").mock(
+        return_value=httpx.Response(204)
+    )
+    respx.delete("https://api.sigfox.com/v2/api-users/user001/profiles/prof2").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    with sigfox_client as client:
+        failures = client.api_users.remove_profiles_bulk(
+            [("user001", "prof1"), ("user001", "prof2")]
+        )
+    assert ok.called
+    assert list(failures) == [("user001", "prof2")]
+    assert isinstance(failures[("user001", "prof2")], NotFoundError)
+
+
+@respx.mock
+def test_api_users_iter_all(sigfox_client):
+    """Test ApiUsersAPI.iter_all() yields ApiUser objects across pages."""
+    respx.get("https://api.sigfox.com/v2/api-users/", params={"offset": "1"}).mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "user002"}]})
+    )
+    respx.get("https://api.sigfox.com/v2/api-users/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [{"id": "user001"}],
+                "paging": {"next": "https://api.sigfox.com/v2/api-users/?limit=1&offset=1"},
+            },
+        )
+    )
+
+    with sigfox_client as client:
+        users = list(client.api_users.iter_all(limit=1))
+        assert [u.id for u in users] == ["user001", "user002"]
@@ -0,0 +1,83 @@
+"""Tests for the top-level CLI group."""
+
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+from sigfox_cli.app import cli
+from sigfox_cli.commands import handle_cli_errors
+from sigfox_cli.exceptions import ConfigError
+
+
+def test_help_lists_all_commands():
+    """Test --help lists every lazily registered command group."""
+    result = CliRunner().invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for name in ("api-users", "base-stations", "config", "devices", "groups", "users"):
+        assert name in result.output
+
+
+def test_help_does_not_import_command_modules():
+    """Test top-level --help lists commands without importing their modules."""
+    code = (
+        "import sys; from sigfox_cli.app import cli; "
+        "cli.main(['--help'], standalone_mode=False); "
+        "print([m for m in sys.modules if m.startswith('sigfox_cli.commands')])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.splitlines()[-1] == "[]"
+    assert "Manage Sigfox device types." in result.stdout
+
+
+def test_lazy_help_matches_commands():
+    """Test the static short help of each command matches its docstring."""
+    for name, text in cli.lazy_help.items():
+        assert cli.get_command(None, name).get_short_help_str(limit=80) == text
+
+
+def test_command_modules_imported_on_demand():
+    """Test importing the app does not import command modules or the SDK."""
+    code = (
+        "import sys; from sigfox_cli.app import cli; "
+        "print('sigfox_cli.commands.groups' in sys.modules, 'sigfox.client' in sys.modules); "
+        "cli.get_command(None, 'groups'); "
+        "print('sigfox_cli.commands.groups' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False", "True"]
+
+
+def test_command_module_defers_sdk_imports():
+    """Test loading a command module imports neither httpx nor its models."""
+    code = (
+        "import sys; from sigfox_cli.app import cli; cli.get_command(None, 'api-users'); "
+        "print('httpx' in sys.modules, 'sigfox.models.api_user' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_handle_cli_errors():
+    """Test handle_cli_errors reports errors and aborts the command."""
+
+    @click.command()
+    @click.argument("kind")
+    @handle_cli_errors
+    def fail(kind):
+        raise ConfigError("not configured") if kind == "cli" else ValueError("boom")
+
+    runner = CliRunner()
+    result = runner.invoke(fail, ["cli"])
+    assert result.exit_code == 1
+    assert "not configured" in result.output
+    result = runner.invoke(fail, ["other"])
+    assert result.exit_code == 1
+    assert "Unexpected error: boom" in result.output
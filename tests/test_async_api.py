@@ -0,0 +1,169 @@
+"""Tests for the asynchronous API layer."""
+
+import asyncio
+
+import pytest
+import respx
+import httpx
+
+from sigfox import AsyncSigfox
+from sigfox.exceptions import NotFoundError
+
+
+@pytest.fixture
+def sigfox_client():
+    """Create an async Sigfox client for testing."""
+    return AsyncSigfox(login="test_login", password="test_password")
+
+
+@respx.mock
+def test_async_devices_list(sigfox_client):
+    """Test AsyncDevicesAPI.list() returns Device objects."""
+    respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [{"id": "dev001", "name": "D1"}]},
+        )
+    )
+
+    async def run():
+        async with sigfox_client as client:
+            return await client.devices.list()
+
+    devices = asyncio.run(run())
+    assert len(devices) == 1
+    assert devices[0].id == "dev001"
+
+
+@respx.mock
+def test_async_devices_messages_gather(sigfox_client):
+    """Test fanning out AsyncDevicesAPI.messages() with asyncio.gather."""
+    for device_id in ("dev001", "dev002"):
+        respx.get(f"https://api.sigfox.com/v2/devices/{device_id}/messages").mock(
+            return_value=httpx.Response(
+                200,
+                json={"data": [{"device": {"id": device_id}, "data": "ab"}]},
+            )
+        )
+
+    async def run():
+        async with sigfox_client as client:
+            return await asyncio.gather(
+                client.devices.messages("dev001"),
+                client.devices.messages("dev002"),
+            )
+
+    results = asyncio.run(run())
+    assert [r[0].device.id for r in results] == ["dev001", "dev002"]
+
+
+@respx.mock
+def test_async_groups_get(sigfox_client):
+    """Test AsyncGroupsAPI.get() passes query params."""
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        return_value=httpx.Response(200, json={"id": "grp001", "name": "G1"})
+    )
+
+    async def run():
+        async with sigfox_client as client:
+            return await client.groups.get("grp001", authorizations=True)
+
+    group = asyncio.run(run())
+    assert group.id == "grp001"
+    assert route.calls.last.request.url.params["authorizations"] == "true"
+
+
+@respx.mock
+def test_async_not_found(sigfox_client):
+    """Test async client maps 404 to NotFoundError."""
+    respx.get("https://api.sigfox.com/v2/device-types/missing").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    async def run():
+        async with sigfox_client as client:
+            return await client.device_types.get("missing")
+
+    with pytest.raises(NotFoundError):
+        asyncio.run(run())
+
+
+@respx.mock
+def test_async_api_users_add_profiles_bulk(sigfox_client):
+    """Test AsyncApiUsersAPI.add_profiles_bulk() fans out one PUT per user."""
+    routes = [
+        respx.put(f"https://api.sigfox.com/v2/api-users/{u}/profiles").mock(
+            return_value=httpx.Response(204)
+        )
+        for u in ("user001", "user002")
+    ]
+
+    async def run():
+        async with sigfox_client as client:
+            await client.api_users.add_profiles_bulk(
+                {"user001": ["prof1"], "user002": ["prof2", "prof3"]},
+                concurrency=1,
+            )
+
+    asyncio.run(run())
+    assert all(route.call_count == 1 for route in routes)
+    assert routes[1].calls.last.request.content == b'{"profileIds":["prof2","prof3"]}'
+
+
+@respx.mock
+def test_async_api_users_remove_profiles_bulk_failures(sigfox_client):
+    """Test AsyncApiUsersAPI.remove_profiles_bulk() returns the failed pairs."""
+    respx.delete("https://api.sigfox.com/v2/api-users/user001/profiles/prof1").mock(
+        return_value=httpx.Response(204)
+    )
+    respx.delete("https://api.sigfox.com/v2/api-users/user001/profiles/prof2").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    async def run():
+        async with sigfox_client as client:
+            return await client.api_users.remove_profiles_bulk(
+                [("user001", "prof1"), ("user001", "prof2")]
+            )
+
+    failures = asyncio.run(run())
+    assert list(failures) == [("user001", "prof2")]
+    assert isinstance(failures[("user001", "prof2")], NotFoundError)
+
+
+@respx.mock
+def test_async_devices_iter_all(sigfox_client):
+    """Test AsyncDevicesAPI.iter_all() yields devices across pages."""
+    respx.get("https://api.sigfox.com/v2/devices/", params={"offset": "1"}).mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "dev002"}]})
+    )
+    respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [{"id": "dev001"}],
+                "paging": {"next": "https://api.sigfox.com/v2/devices/?offset=1"},
+            },
+        )
+    )
+
+    async def run():
+        async with sigfox_client as client:
+            return [d.id async for d in client.devices.iter_all(limit=1)]
+
+    assert asyncio.run(run()) == ["dev001", "dev002"]
+
+
+@respx.mock
+def test_async_users_get_many(sigfox_client):
+    """Test AsyncUsersAPI.get_many() fetches every user concurrently."""
+    for user_id in ("usr001", "usr002"):
+        respx.get(f"https://api.sigfox.com/v2/users/{user_id}").mock(
+            return_value=httpx.Response(200, json={"id": user_id})
+        )
+
+    async def run():
+        async with sigfox_client as client:
+            return await client.users.get_many(["usr002", "usr001"])
+
+    assert [u.id for u in asyncio.run(run())] == ["usr002", "usr001"]
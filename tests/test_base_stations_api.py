@@ -5,6 +5,7 @@ import httpx
 import respx
 
 from sigfox import Sigfox
+from sigfox.models import BaseStation, BaseStationSummary
 
 
 @pytest.fixture
@@ -102,3 +103,64 @@ def test_base_stations_list_messages_empty(sigfox_client):
     with sigfox_client as client:
         messages = client.base_stations.list_messages(station_id="1A2B3C")
         assert messages == []
+
+
+@respx.mock
+def test_base_stations_iter_messages(sigfox_client):
+    """Test BaseStationsAPI.iter_messages() yields Message objects lazily."""
+    respx.get("https://api.sigfox.com/v2/base-stations/1A2B3C/messages").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [{"seqNumber": 1}, {"seqNumber": 2}, {"seqNumber": 3}]},
+        )
+    )
+
+    with sigfox_client as client:
+        messages = client.base_stations.iter_messages(station_id="1A2B3C", limit=3)
+        assert next(messages).seq_number == 1
+        assert [m.seq_number for m in messages] == [2, 3]
+
+
+@respx.mock
+def test_base_stations_list_summaries(sigfox_client):
+    """Test BaseStationsAPI.list() validates only the summary fields by default."""
+    respx.get("https://api.sigfox.com/v2/base-stations/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [
+                    {
+                        "id": "1A2B3C",
+                        "name": "BS1",
+                        "state": 0,
+                        "lat": 48.8,
+                        "lng": 2.3,
+                        "hwVersion": "v2",
+                    }
+                ]
+            },
+        )
+    )
+
+    with sigfox_client as client:
+        summaries = client.base_stations.list(limit=10)
+        full = client.base_stations.list(limit=10, full=True)
+
+    assert isinstance(summaries[0], BaseStationSummary)
+    assert summaries[0].name == "BS1"
+    assert "hwVersion" not in summaries[0].model_dump(by_alias=True)
+    assert isinstance(full[0], BaseStation)
+    assert full[0].hw_version == "v2"
+
+
+@respx.mock
+def test_base_stations_get(sigfox_client):
+    """Test BaseStationsAPI.get() returns a full BaseStation."""
+    respx.get("https://api.sigfox.com/v2/base-stations/1A2B3C").mock(
+        return_value=httpx.Response(200, json={"id": "1A2B3C", "antennaGain": 2.5})
+    )
+
+    with sigfox_client as client:
+        station = client.base_stations.get("1A2B3C")
+
+    assert station.antenna_gain == 2.5
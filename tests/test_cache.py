@@ -0,0 +1,81 @@
+"""Tests for the on-disk response cache."""
+
+import httpx
+import pytest
+import respx
+from click.testing import CliRunner
+
+from sigfox_cli.app import cli
+from sigfox_cli.cache import DiskCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a disk cache in a temporary directory."""
+    return DiskCache(tmp_path / "cache", ttl=60)
+
+
+def test_disk_cache_set_get(cache):
+    """Test a stored body is returned for the same key."""
+    key = ("/devices/abc", (("fields", "x"),))
+    assert cache.get(key) is None
+    cache.set(key, b'{"id": "abc"}')
+    assert cache.get(key) == b'{"id": "abc"}'
+    assert cache.get(("/devices/abc", ())) is None
+
+
+def test_disk_cache_expiry(cache, monkeypatch):
+    """Test entries expire after the TTL."""
+    key = ("/devices/abc", ())
+    cache.set(key, b"{}")
+    monkeypatch.setattr("sigfox_cli.cache.time.time", lambda: 2**40)
+    assert cache.get(key) is None
+
+
+def test_disk_cache_invalidate(cache):
+    """Test invalidate() drops only the entries matching the predicate."""
+    cache.set(("/devices/abc", ()), b"{}")
+    cache.set(("/groups/g1", (("deep", "true"),)), b"{}")
+    cache.invalidate(lambda key: key[0].startswith("/devices/abc"))
+    assert cache.get(("/devices/abc", ())) is None
+    assert cache.get(("/groups/g1", (("deep", "true"),))) == b"{}"
+    cache.clear()
+    assert cache.get(("/groups/g1", (("deep", "true"),))) is None
+
+
+@respx.mock
+def test_get_served_from_disk_cache(tmp_path, monkeypatch):
+    """Test a repeated get command is served from the disk cache."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SIGFOX_API_LOGIN", "test_login")
+    monkeypatch.setenv("SIGFOX_API_PASSWORD", "test_password")
+    monkeypatch.setenv("SIGFOX_CACHE_TTL", "30")
+    route = respx.get("https://api.sigfox.com/v2/devices/1A2B3C").mock(
+        return_value=httpx.Response(200, json={"id": "1A2B3C", "name": "Device A"})
+    )
+
+    runner = CliRunner()
+    for _ in range(2):
+        result = runner.invoke(cli, ["devices", "get", "1A2B3C"])
+        assert result.exit_code == 0
+        assert "Device A" in result.output
+    assert route.call_count == 1
+    assert (tmp_path / ".cache" / "sigfox-cli").is_dir()
+
+
+@respx.mock
+def test_disk_cache_disabled_by_default(tmp_path, monkeypatch):
+    """Test get commands hit the API every time unless cache_ttl is set."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SIGFOX_API_LOGIN", "test_login")
+    monkeypatch.setenv("SIGFOX_API_PASSWORD", "test_password")
+    monkeypatch.delenv("SIGFOX_CACHE_TTL", raising=False)
+    route = respx.get("https://api.sigfox.com/v2/devices/1A2B3C").mock(
+        return_value=httpx.Response(200, json={"id": "1A2B3C"})
+    )
+
+    runner = CliRunner()
+    for _ in range(2):
+        assert runner.invoke(cli, ["devices", "get", "1A2B3C"]).exit_code == 0
+    assert route.call_count == 2
+    assert not (tmp_path / ".cache").exists()
@@ -1,5 +1,12 @@
 """Tests for Sigfox API client."""
 
+import gzip
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
 import respx
 import httpx
@@ -10,6 +17,7 @@ from sigfox_cli.exceptions import (
     NotFoundError,
     APIError,
 )
+from sigfox.models import Device
 
 
 @pytest.fixture
@@ -37,6 +45,17 @@ def test_get_success(client):
     assert response["data"][0]["name"] == "Test Device"
 
 
+@respx.mock
+def test_basic_auth_header(client):
+    """Test credentials are sent as a precomputed Basic Authorization header."""
+    route = respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(200, json={"data": []})
+    )
+
+    client.get("/devices/")
+    assert route.calls.last.request.headers["Authorization"] == "Basic dGVzdF9sb2dpbjp0ZXN0X3Bhc3N3b3Jk"
+
+
 @respx.mock
 def test_get_authentication_error(client):
     """Test GET request with authentication error."""
@@ -93,6 +112,52 @@ def test_get_api_error(client):
         client.get("/devices/")
 
 
+@respx.mock
+def test_post_empty_response(client):
+    """Test POST returns an empty dict when the response has no body."""
+    respx.post("https://api.sigfox.com/v2/devices/bulk/unsubscribe").mock(
+        return_value=httpx.Response(201)
+    )
+
+    assert client.post("/devices/bulk/unsubscribe", data=b"[]") == {}
+
+
+@respx.mock
+def test_post_api_error_message(client):
+    """Test POST errors carry the decoded message and the raw body."""
+    respx.post("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(400, json={"message": "Bad Request"})
+    )
+
+    with pytest.raises(APIError, match="Bad Request") as excinfo:
+        client.post("/devices/", data={})
+    assert excinfo.value.response_body == '{"message":"Bad Request"}'
+
+
+@respx.mock
+def test_error_without_json_message(client):
+    """Test error bodies without a JSON message fall back to the raw text."""
+    respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(502, text="<html>Bad Gateway</html>")
+    )
+
+    with pytest.raises(APIError, match="<html>Bad Gateway</html>") as excinfo:
+        client.get("/devices/")
+    assert excinfo.value.response_body == "<html>Bad Gateway</html>"
+
+
+@respx.mock
+def test_non_json_error_body_truncated(client):
+    """Test non-JSON error bodies are not parsed and are truncated in the message."""
+    respx.get("https://api.sigfox.com/v2/devices/missing").mock(
+        return_value=httpx.Response(404, text="x" * 1000)
+    )
+
+    with pytest.raises(NotFoundError) as excinfo:
+        client.get("/devices/missing")
+    assert str(excinfo.value) == f"Resource not found: {'x' * 256}"
+
+
 @respx.mock
 def test_context_manager(client):
     """Test client as context manager."""
@@ -106,3 +171,438 @@ def test_context_manager(client):
     with client as c:
         response = c.get("/devices/")
         assert "data" in response
+
+
+@respx.mock
+def test_get_cache_hit(client):
+    """Test cached GET requests are served without a second round-trip."""
+    route = respx.get("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(200, json={"id": "123"})
+    )
+
+    first = client.get("/devices/123", cache=True)
+    second = client.get("/devices/123", cache=True)
+    assert first == second == {"id": "123"}
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_get_cache_invalidated_by_mutation(client):
+    """Test PUT on a resource drops its cached GET responses."""
+    route = respx.get("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(200, json={"id": "123"})
+    )
+    respx.put("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(204)
+    )
+
+    client.get("/devices/123", cache=True)
+    client.put("/devices/123", data={"name": "New"})
+    client.get("/devices/123", cache=True)
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_get_uncached_by_default(client):
+    """Test GET requests bypass the cache unless requested."""
+    route = respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(200, json={"data": []})
+    )
+
+    client.get("/devices/")
+    client.get("/devices/")
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_clear_cache(client):
+    """Test clear_cache() forces the next GET to hit the network."""
+    route = respx.get("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(200, json={"id": "123"})
+    )
+
+    client.get("/devices/123", cache=True)
+    client.clear_cache()
+    client.get("/devices/123", cache=True)
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_get_model(client):
+    """Test get_model() validates the response body into a model."""
+    respx.get("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(200, json={"id": "123", "name": "D1"})
+    )
+
+    device = client.get_model("/devices/123", Device)
+    assert isinstance(device, Device)
+    assert device.name == "D1"
+
+
+@respx.mock
+def test_get_model_cached(client):
+    """Test cached get_model() calls return fresh instances without a round-trip."""
+    route = respx.get("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(200, json={"id": "123"})
+    )
+
+    first = client.get_model("/devices/123", Device, cache=True)
+    second = client.get_model("/devices/123", Device, cache=True)
+    assert first == second
+    assert first is not second
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_custom_response_cache():
+    """Test a response_cache passed to the client replaces the in-process cache."""
+    from sigfox._cache import TTLCache
+
+    store = TTLCache(ttl=60)
+    route = respx.get("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(200, json={"id": "123"})
+    )
+
+    for _ in range(2):
+        with SigfoxClient("test_login", "test_password", response_cache=store) as c:
+            assert c.get_model("/devices/123", Device, cache=True).id == "123"
+    assert route.call_count == 1
+    assert store.get(("/devices/123", ())) == b'{"id":"123"}'
+
+@respx.mock
+def test_get_list(client):
+    """Test get_list() validates the data array and ignores paging."""
+    respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [{"id": "1"}, {"id": "2"}],
+                "paging": {"next": "https://api.sigfox.com/v2/devices/?offset=2"},
+            },
+        )
+    )
+
+    devices = client.get_list("/devices/", Device)
+    assert [d.id for d in devices] == ["1", "2"]
+
+
+@respx.mock
+def test_get_revalidates_etag():
+    """Test GET sends If-None-Match and reuses the stored body on 304."""
+    client = SigfoxClient(
+        api_login="test_login", api_password="test_password", etag_cache=True
+    )
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        side_effect=[
+            httpx.Response(200, json={"id": "grp001"}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+
+    first = client.get("/groups/grp001")
+    second = client.get("/groups/grp001")
+    assert first == second == {"id": "grp001"}
+    assert "If-None-Match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@respx.mock
+def test_get_etag_dropped_by_mutation():
+    """Test mutations forget the stored ETag of the resource."""
+    client = SigfoxClient(
+        api_login="test_login", api_password="test_password", etag_cache=True
+    )
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        return_value=httpx.Response(200, json={"id": "grp001"}, headers={"ETag": '"v1"'})
+    )
+    respx.put("https://api.sigfox.com/v2/groups/grp001").mock(
+        return_value=httpx.Response(204)
+    )
+
+    client.get("/groups/grp001")
+    client.put("/groups/grp001", data={"name": "G"})
+    client.get("/groups/grp001")
+    assert "If-None-Match" not in route.calls.last.request.headers
+
+
+@respx.mock
+def test_mutation_spares_ids_sharing_a_prefix():
+    """Test a mutation only drops cached responses of its own resource."""
+    client = SigfoxClient(api_login="test_login", api_password="test_password")
+    short = respx.get("https://api.sigfox.com/v2/devices/abc").mock(
+        return_value=httpx.Response(200, json={"id": "abc"})
+    )
+    long = respx.get("https://api.sigfox.com/v2/devices/abcdef").mock(
+        return_value=httpx.Response(200, json={"id": "abcdef"})
+    )
+    respx.put("https://api.sigfox.com/v2/devices/abc").mock(
+        return_value=httpx.Response(204)
+    )
+
+    for path in ("/devices/abc", "/devices/abcdef"):
+        client.get(path, cache=True)
+    client.put("/devices/abc", data={"name": "D"})
+    for path in ("/devices/abc", "/devices/abcdef"):
+        client.get(path, cache=True)
+    assert short.call_count == 2
+    assert long.call_count == 1
+
+
+@respx.mock
+def test_get_etag_cache_off_by_default(client):
+    """Test ETags are not stored unless the client opts in."""
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        return_value=httpx.Response(200, json={"id": "grp001"}, headers={"ETag": '"v1"'})
+    )
+
+    client.get("/groups/grp001")
+    client.get("/groups/grp001")
+    assert "If-None-Match" not in route.calls.last.request.headers
+
+
+@respx.mock
+def test_get_coalesces_concurrent_requests(client):
+    """Test concurrent identical GETs share a single round-trip."""
+
+    def slow_response(request):
+        time.sleep(0.2)
+        return httpx.Response(200, json={"id": "grp001"})
+
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        side_effect=slow_response
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: client.get("/groups/grp001"), range(4)))
+
+    assert results == [{"id": "grp001"}] * 4
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_get_model_decompresses_gzip(client):
+    """Test compressed responses are negotiated and decoded before validation."""
+    route = respx.get("https://api.sigfox.com/v2/devices/123").mock(
+        return_value=httpx.Response(
+            200,
+            content=gzip.compress(b'{"id": "123", "name": "D1"}'),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+        )
+    )
+
+    device = client.get_model("/devices/123", Device)
+    assert device.name == "D1"
+    assert "gzip" in route.calls.last.request.headers["Accept-Encoding"]
+
+
+@respx.mock
+def test_get_not_found_is_remembered(client):
+    """Test a repeated GET of a missing resource raises without a round-trip."""
+    route = respx.get("https://api.sigfox.com/v2/groups/missing").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    for _ in range(2):
+        with pytest.raises(NotFoundError, match="Not Found"):
+            client.get("/groups/missing", cache=True)
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_get_not_found_uncached_not_remembered(client):
+    """Test 404s of GETs made without cache=True always reach the API."""
+    route = respx.get("https://api.sigfox.com/v2/groups/missing").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            client.get("/groups/missing")
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_get_not_found_expires(client, monkeypatch):
+    """Test a resource that appears after a 404 is seen once the window ends."""
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        side_effect=[
+            httpx.Response(404, json={"message": "Not Found"}),
+            httpx.Response(200, json={"id": "grp001"}),
+        ]
+    )
+    now = time.monotonic()
+    monkeypatch.setattr("sigfox._cache.time.monotonic", lambda: now)
+
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            client.get("/groups/grp001", cache=True)
+    monkeypatch.setattr("sigfox._cache.time.monotonic", lambda: now + 61)
+    assert client.get("/groups/grp001", cache=True) == {"id": "grp001"}
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_get_not_found_forgotten_after_create(client):
+    """Test creating in a collection forgets remembered 404s under it."""
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        side_effect=[
+            httpx.Response(404, json={"message": "Not Found"}),
+            httpx.Response(200, json={"id": "grp001"}),
+        ]
+    )
+    respx.post("https://api.sigfox.com/v2/groups/").mock(
+        return_value=httpx.Response(201, json={"id": "grp001"})
+    )
+
+    with pytest.raises(NotFoundError):
+        client.get("/groups/grp001", cache=True)
+    client.post("/groups/", data={"name": "G"})
+    assert client.get("/groups/grp001", cache=True) == {"id": "grp001"}
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_iter_paginated_follows_next(client):
+    """Test iter_paginated() follows paging.next links lazily."""
+    respx.get("https://api.sigfox.com/v2/devices/", params={"offset": "2"}).mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "3"}]})
+    )
+    first_page = respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [{"id": "1"}, {"id": "2"}],
+                "paging": {"next": "https://api.sigfox.com/v2/devices/?offset=2"},
+            },
+        )
+    )
+
+    items = client.iter_paginated("/devices/")
+    assert next(items)["id"] == "1"
+    assert first_page.call_count == 1
+    assert [item["id"] for item in items] == ["2", "3"]
+
+
+@respx.mock
+def test_iter_paginated_without_prefetch(client):
+    """Test iter_paginated() with prefetch disabled returns the same items."""
+    respx.get("https://api.sigfox.com/v2/devices/", params={"offset": "1"}).mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "2"}]})
+    )
+    respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [{"id": "1"}],
+                "paging": {"next": "https://api.sigfox.com/v2/devices/?offset=1"},
+            },
+        )
+    )
+
+    items = client.iter_paginated("/devices/", prefetch=False)
+    assert [item["id"] for item in items] == ["1", "2"]
+
+
+@respx.mock
+def test_get_paginated_collects_pages(client):
+    """Test get_paginated() gathers every page and honors the item limit."""
+    respx.get("https://api.sigfox.com/v2/devices/", params={"offset": "2"}).mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "3"}]})
+    )
+    first_page = respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [{"id": "1"}, {"id": "2"}],
+                "paging": {"next": "https://api.sigfox.com/v2/devices/?offset=2"},
+            },
+        )
+    )
+
+    assert [item["id"] for item in client.get_paginated("/devices/")] == ["1", "2", "3"]
+    assert first_page.calls.last.request.url.params["limit"] == "100"
+    assert [item["id"] for item in client.get_paginated("/devices/", limit=1)] == ["1"]
+
+
+@respx.mock
+def test_get_paginated_leaves_params_untouched(client):
+    """Test get_paginated() does not write pagination keys into caller params."""
+    route = respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "1"}]})
+    )
+    params = {"deviceTypeId": "dt001", "limit": 10}
+
+    client.get_paginated("/devices/", params=params)
+    assert params == {"deviceTypeId": "dt001", "limit": 10}
+    assert dict(route.calls.last.request.url.params) == {
+        "offset": "0",
+        "limit": "10",
+        "deviceTypeId": "dt001",
+    }
+
+
+def test_api_error_pickle_round_trip():
+    """Test APIError keeps its status and body when pickled."""
+    error = pickle.loads(pickle.dumps(APIError("boom", status_code=500, response_body="{}")))
+    assert str(error) == "boom"
+    assert error.status_code == 500
+    assert error.response_body == "{}"
+
+
+def test_clients_use_slots(client):
+    """Test the client and facade instances carry no per-instance __dict__."""
+    from sigfox import Sigfox
+
+    facade = Sigfox(login="test_login", password="test_password")
+    assert not hasattr(client, "__dict__")
+    assert not hasattr(facade, "__dict__")
+    facade.close()
+
+
+def test_env_proxy_is_used(monkeypatch):
+    """Test requests go through the proxy configured in the environment."""
+    seen = []
+
+    class Proxy(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.path)
+            body = b'{"id": "grp001"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Proxy)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_port}")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+        with SigfoxClient(
+            api_login="test_login",
+            api_password="test_password",
+            base_url="http://api.sigfox.invalid/v2",
+        ) as client:
+            assert client.get("/groups/grp001") == {"id": "grp001"}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # A proxied request carries the absolute target URL
+    assert seen == ["http://api.sigfox.invalid/v2/groups/grp001"]
+
+
+def test_no_proxy_bypasses_env_proxy(monkeypatch):
+    """Test NO_PROXY hosts use the direct transport."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.invalid:3128")
+    monkeypatch.setenv("NO_PROXY", "api.sigfox.com")
+    client = SigfoxClient(api_login="test_login", api_password="test_password")
+
+    http = client._client
+    assert http._transport_for_url(httpx.URL("https://api.sigfox.com/v2/")) is http._transport
+    assert http._transport_for_url(httpx.URL("https://other.invalid/")) is not http._transport
@@ -40,6 +40,32 @@ def test_put_success_with_json_response(client):
     assert result["name"] == "Updated"
 
 
+@respx.mock
+def test_put_pre_encoded_body(client):
+    """Test PUT request sends pre-encoded JSON bytes unchanged."""
+    route = respx.put("https://api.sigfox.com/v2/device-types/abc123").mock(
+        return_value=httpx.Response(204)
+    )
+
+    client.put("/device-types/abc123", data=b'{"name":"Updated"}')
+    request = route.calls.last.request
+    assert request.content == b'{"name":"Updated"}'
+    assert request.headers["Content-Type"] == "application/json"
+
+
+@respx.mock
+def test_put_dict_body_encoded_to_json(client):
+    """Test PUT request encodes dict bodies to compact JSON bytes."""
+    route = respx.put("https://api.sigfox.com/v2/api-users/u1/profiles").mock(
+        return_value=httpx.Response(204)
+    )
+
+    client.put("/api-users/u1/profiles", data={"profileIds": ["p1", "p2"], "note": "é"})
+    request = route.calls.last.request
+    assert request.content == '{"profileIds":["p1","p2"],"note":"é"}'.encode()
+    assert request.headers["Content-Type"] == "application/json"
+
+
 @respx.mock
 def test_put_not_found(client):
     """Test PUT request with not found error."""
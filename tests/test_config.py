@@ -2,7 +2,9 @@
 
 import pytest
 from pathlib import Path
-from sigfox_cli.config import SigfoxConfig, load_config, save_config
+from click.testing import CliRunner
+from sigfox_cli.app import cli
+from sigfox_cli.config import SigfoxConfig, get_config_file, load_config, save_config
 from pydantic import SecretStr
 
 
@@ -29,3 +31,82 @@ def test_sigfox_config_defaults():
     assert config.api_base_url == "https://api.sigfox.com/v2"
     assert config.output_format == "table"
     assert config.timeout == 30
+
+
+def test_load_config_memoized(tmp_path, monkeypatch):
+    """Test load_config() is reused until the config file or environment changes."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    for name in ("SIGFOX_API_LOGIN", "SIGFOX_API_PASSWORD"):
+        monkeypatch.delenv(name, raising=False)
+
+    first = load_config()
+    assert load_config() is first
+    assert first.api_login is None
+
+    save_config(api_login="saved_login", api_password="saved_password")
+    assert load_config().api_login == "saved_login"
+
+    monkeypatch.setenv("SIGFOX_API_LOGIN", "env_login")
+    assert load_config().api_login == "env_login"
+
+
+def test_config_init_from_file(tmp_path, monkeypatch):
+    """Test config init --from-file saves settings without prompting."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    for name in ("SIGFOX_API_LOGIN", "SIGFOX_API_PASSWORD"):
+        monkeypatch.delenv(name, raising=False)
+
+    result = CliRunner().invoke(
+        cli,
+        ["config", "init", "--from-file", "-"],
+        input=(
+            '{"api_login": "file_login", "api_password": "file_password", '
+            '"timeout": 60, "cache_ttl": 120}'
+        ),
+    )
+    assert result.exit_code == 0
+    cfg = load_config()
+    assert cfg.api_login == "file_login"
+    assert cfg.get_password() == "file_password"
+    assert cfg.timeout == 60
+    assert cfg.cache_ttl == 120
+    assert cfg.output_format == "table"
+
+
+def test_config_init_from_file_invalid(tmp_path, monkeypatch):
+    """Test config init --from-file rejects unknown keys without saving."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    result = CliRunner().invoke(
+        cli,
+        ["config", "init", "--from-file", "-"],
+        input='{"api_login": "x", "api_password": "y", "timeoutt": 60}',
+    )
+    assert result.exit_code != 0
+    assert "timeoutt" in result.output
+    assert not (tmp_path / ".config" / "sigfox-cli" / "config.toml").exists()
+
+
+def test_config_show(tmp_path, monkeypatch):
+    """Test config show prints every setting."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SIGFOX_API_LOGIN", "env_login")
+    monkeypatch.setenv("SIGFOX_API_PASSWORD", "env_password")
+
+    result = CliRunner().invoke(cli, ["config", "show"])
+    assert result.exit_code == 0
+    assert "API Login: env_login" in result.output
+    assert "Timeout: 30s" in result.output
+    assert "env_password" not in result.output
+
+
+def test_get_config_file_follows_home(tmp_path, monkeypatch):
+    """Test the memoized config path is re-resolved when HOME changes."""
+    for home in ("a", "b"):
+        monkeypatch.setenv("HOME", str(tmp_path / home))
+        config_file = get_config_file()
+        assert config_file == tmp_path / home / ".config" / "sigfox-cli" / "config.toml"
+        assert config_file.parent.is_dir()
+        assert get_config_file() is config_file
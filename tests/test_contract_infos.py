@@ -105,6 +105,32 @@ def test_list_contract_infos_with_filters(runner):
     assert result.exit_code == 0
 
 
+@respx.mock
+def test_list_contract_infos_group_type(runner):
+    """Test --group-type is sent to the API as an integer filter."""
+    route = respx.get("https://api.sigfox.com/v2/contract-infos/").mock(
+        return_value=httpx.Response(200, json={"data": []})
+    )
+    result = runner.invoke(cli, ["contract-infos", "list", "--group-type", "9"])
+    assert result.exit_code == 0
+    assert route.calls.last.request.url.params["groupType"] == "9"
+
+
+@pytest.mark.parametrize(
+    "option",
+    [
+        ["--subscription-plan", "7"],
+        ["--pricing-model", "0"],
+        ["--group-type", "3"],
+        ["--limit", "0"],
+    ],
+)
+def test_list_contract_infos_rejects_out_of_range(runner, option):
+    """Test out-of-range filters fail at parse time without a request."""
+    result = runner.invoke(cli, ["contract-infos", "list", *option])
+    assert result.exit_code == 2
+
+
 # --- Get Contract Info ---
 
 
@@ -1,5 +1,7 @@
 """Tests for coverages commands."""
 
+import json
+
 import pytest
 import respx
 import httpx
@@ -67,16 +69,24 @@ def test_global_prediction_missing_lat(runner):
 @respx.mock
 def test_bulk_start(runner):
     """Test starting a bulk coverage prediction job."""
-    respx.post("https://api.sigfox.com/v2/coverages/global/predictions/bulk").mock(
+    route = respx.post("https://api.sigfox.com/v2/coverages/global/predictions/bulk").mock(
         return_value=httpx.Response(202, json={"jobId": "job123"})
     )
 
     result = runner.invoke(
         cli,
-        ["coverages", "bulk-start", "--locations", '[{"lat": 48.86, "lng": 2.35}]'],
+        [
+            "coverages", "bulk-start",
+            "--locations", '[{"lat": 48.86, "lng": 2.35}]',
+            "--group-id", "g1",
+        ],
     )
     assert result.exit_code == 0
     assert "job123" in result.output
+    assert json.loads(route.calls.last.request.content) == {
+        "locations": [{"lat": 48.86, "lng": 2.35}],
+        "groupId": "g1",
+    }
 
 
 def test_bulk_start_invalid_json(runner):
@@ -85,6 +95,24 @@ def test_bulk_start_invalid_json(runner):
     assert result.exit_code != 0
 
 
+def test_bulk_start_missing_coordinate(runner):
+    """Test bulk-start rejects a location without lng before any request."""
+    result = runner.invoke(
+        cli, ["coverages", "bulk-start", "--locations", '[{"lat": 48.86}]']
+    )
+    assert result.exit_code != 0
+    assert "Invalid --locations JSON" in result.output
+
+
+def test_bulk_start_not_an_array(runner):
+    """Test bulk-start rejects a JSON object where an array is expected."""
+    result = runner.invoke(
+        cli, ["coverages", "bulk-start", "--locations", '{"lat": 48.86, "lng": 2.35}']
+    )
+    assert result.exit_code != 0
+    assert "valid array" in result.output
+
+
 # --- Bulk Get ---
 
 @respx.mock
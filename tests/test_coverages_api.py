@@ -5,6 +5,7 @@ import respx
 import httpx
 
 from sigfox import Sigfox
+from sigfox.exceptions import SigfoxError
 from sigfox.models import CoverageBulkRequest, CoverageLocation
 
 
@@ -108,6 +109,57 @@ def test_get_bulk_prediction_pending(sigfox_client):
         assert result.results is None
 
 
+@respx.mock
+def test_predict_many_polls_until_done(sigfox_client):
+    """Test CoveragesAPI.predict_many() submits one job and polls until done."""
+    submit = respx.post("https://api.sigfox.com/v2/coverages/global/predictions/bulk").mock(
+        return_value=httpx.Response(202, json={"jobId": "job123"})
+    )
+    poll = respx.get("https://api.sigfox.com/v2/coverages/global/predictions/bulk/job123").mock(
+        side_effect=[
+            httpx.Response(200, json={"jobDone": False}),
+            httpx.Response(
+                200,
+                json={
+                    "jobDone": True,
+                    "results": [
+                        {"lat": 48.8566, "lng": 2.3522, "locationCovered": True},
+                        {"lat": 51.5074, "lng": -0.1278, "locationCovered": False},
+                    ],
+                },
+            ),
+        ]
+    )
+
+    with sigfox_client as client:
+        results = client.coverages.predict_many(
+            [(48.8566, 2.3522), (51.5074, -0.1278)], radius=300, poll=0
+        )
+
+    assert submit.call_count == 1
+    assert poll.call_count == 2
+    assert submit.calls.last.request.content == (
+        b'{"locations":[{"lat":48.8566,"lng":2.3522},{"lat":51.5074,"lng":-0.1278}],'
+        b'"radius":300}'
+    )
+    assert [r.location_covered for r in results] == [True, False]
+
+
+@respx.mock
+def test_predict_many_timeout(sigfox_client):
+    """Test CoveragesAPI.predict_many() raises when the job does not finish."""
+    respx.post("https://api.sigfox.com/v2/coverages/global/predictions/bulk").mock(
+        return_value=httpx.Response(202, json={"jobId": "job123"})
+    )
+    respx.get("https://api.sigfox.com/v2/coverages/global/predictions/bulk/job123").mock(
+        return_value=httpx.Response(200, json={"jobDone": False})
+    )
+
+    with sigfox_client as client:
+        with pytest.raises(SigfoxError, match="job123"):
+            client.coverages.predict_many([(48.8566, 2.3522)], poll=0, timeout=0)
+
+
 @respx.mock
 def test_get_operator_redundancy(sigfox_client):
     """Test CoveragesAPI.get_operator_redundancy() returns a CoverageRedundancy."""
@@ -1,5 +1,7 @@
 """Tests for device-types commands."""
 
+import json
+
 import pytest
 import respx
 import httpx
@@ -71,7 +73,7 @@ def test_list_device_types_json(runner):
 @respx.mock
 def test_list_device_types_with_filters(runner):
     """Test listing device types with filters."""
-    respx.get("https://api.sigfox.com/v2/device-types/").mock(
+    route = respx.get("https://api.sigfox.com/v2/device-types/").mock(
         return_value=httpx.Response(
             200,
             json={"data": [{"id": "abc123", "name": "Type A"}]},
@@ -80,9 +82,17 @@ def test_list_device_types_with_filters(runner):
 
     result = runner.invoke(
         cli,
-        ["device-types", "list", "--name", "Type", "--group-ids", "grp123", "--deep"],
+        [
+            "device-types", "list", "--name", "Type", "--group-ids", "grp123", "--deep",
+            "--contract-id", "ctr001",
+        ],
     )
     assert result.exit_code == 0
+    params = route.calls.last.request.url.params
+    assert params["name"] == "Type"
+    assert params["groupIds"] == "grp123"
+    assert params["deep"] == "true"
+    assert params["contractId"] == "ctr001"
 
 
 @respx.mock
@@ -178,6 +188,29 @@ def test_create_device_type_with_options(runner):
     assert "created successfully" in result.output
 
 
+@respx.mock
+def test_create_device_type_body(runner):
+    """Test create sends only the given options, with camelCase keys."""
+    route = respx.post("https://api.sigfox.com/v2/device-types/").mock(
+        return_value=httpx.Response(200, json={"id": "new123"})
+    )
+
+    result = runner.invoke(
+        cli,
+        [
+            "device-types", "create", "--name", "New Type", "--group-id", "grp123",
+            "--keep-alive", "3600", "--contract-id", "ctr001",
+        ],
+    )
+    assert result.exit_code == 0
+    assert json.loads(route.calls.last.request.content) == {
+        "name": "New Type",
+        "groupId": "grp123",
+        "keepAlive": 3600,
+        "contractId": "ctr001",
+    }
+
+
 @respx.mock
 def test_create_device_type_missing_name(runner):
     """Test creating a device type without required name."""
@@ -1,5 +1,7 @@
 """Tests for devices commands."""
 
+import json
+
 import pytest
 import respx
 import httpx
@@ -68,6 +70,38 @@ def test_get_device(runner):
     assert "Device A" in result.output
 
 
+@respx.mock
+def test_get_device_json(runner):
+    """Test device JSON output is serialized straight from the model."""
+    respx.get("https://api.sigfox.com/v2/devices/1A2B3C").mock(
+        return_value=httpx.Response(
+            200,
+            json={"id": "1A2B3C", "name": "Device A", "deviceType": {"id": "abc123"}},
+        )
+    )
+
+    result = runner.invoke(cli, ["devices", "get", "1A2B3C", "--output", "json"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["id"] == "1A2B3C"
+    assert data["deviceType"]["id"] == "abc123"
+    assert '  "name": "Device A"' in result.output
+
+
+@respx.mock
+def test_list_devices_json(runner):
+    """Test device list JSON output is a streamed array of camelCase objects."""
+    respx.get("https://api.sigfox.com/v2/devices/").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [{"id": "1A2B3C", "deviceType": {"id": "abc123"}}]},
+        )
+    )
+
+    result = runner.invoke(cli, ["devices", "list", "--output", "json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output)[0]["deviceType"]["id"] == "abc123"
+
 @respx.mock
 def test_get_device_not_found(runner):
     """Test getting non-existent device."""
@@ -3,8 +3,10 @@
 import pytest
 import respx
 import httpx
+from pydantic import ValidationError
 
 from sigfox import Sigfox
+from sigfox.exceptions import NotFoundError
 from sigfox.models import GroupCreate, GroupUpdate
 
 
@@ -48,6 +50,54 @@ def test_groups_get(sigfox_client):
         assert group.timezone == "Europe/Paris"
 
 
+@respx.mock
+def test_groups_get_not_found_remembered(sigfox_client):
+    """Test a repeated GroupsAPI.get() of a missing group makes one round-trip."""
+    route = respx.get("https://api.sigfox.com/v2/groups/grp404").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    with sigfox_client as client:
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                client.groups.get("grp404")
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_groups_get_revalidates_etag():
+    """Test Sigfox(etag_cache=True) revalidates a repeated groups.get()."""
+    route = respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        side_effect=[
+            httpx.Response(200, json={"id": "grp001", "name": "G1"}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+
+    with Sigfox(
+        login="test_login", password="test_password", cache_ttl=0, etag_cache=True
+    ) as client:
+        first = client.groups.get("grp001")
+        second = client.groups.get("grp001")
+    assert first == second
+    assert second.name == "G1"
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@respx.mock
+def test_groups_get_returns_frozen_model(sigfox_client):
+    """Test Group responses are immutable."""
+    respx.get("https://api.sigfox.com/v2/groups/grp001").mock(
+        return_value=httpx.Response(200, json={"id": "grp001", "name": "G1"})
+    )
+
+    with sigfox_client as client:
+        group = client.groups.get("grp001")
+
+    with pytest.raises(ValidationError):
+        group.name = "G2"
+
+
 @respx.mock
 def test_groups_create(sigfox_client):
     """Test GroupsAPI.create() returns id dict."""
@@ -128,3 +178,40 @@ def test_groups_geoloc_payloads(sigfox_client):
         payloads = client.groups.geoloc_payloads("grp001")
         assert len(payloads) == 1
         assert payloads[0].id == "geo001"
+
+
+@respx.mock
+def test_groups_iter_all(sigfox_client):
+    """Test GroupsAPI.iter_all() yields groups across pages."""
+    respx.get("https://api.sigfox.com/v2/groups/", params={"offset": "1"}).mock(
+        return_value=httpx.Response(200, json={"data": [{"id": "grp002"}]})
+    )
+    first_page = respx.get("https://api.sigfox.com/v2/groups/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "data": [{"id": "grp001"}],
+                "paging": {"next": "https://api.sigfox.com/v2/groups/?offset=1"},
+            },
+        )
+    )
+
+    with sigfox_client as client:
+        ids = [g.id for g in client.groups.iter_all(limit=1, deep=True)]
+
+    assert ids == ["grp001", "grp002"]
+    assert first_page.calls[0].request.url.params["deep"] == "true"
+
+
+@respx.mock
+def test_groups_get_many(sigfox_client):
+    """Test GroupsAPI.get_many() fetches every group in input order."""
+    for group_id in ("grp001", "grp002", "grp003"):
+        respx.get(f"https://api.sigfox.com/v2/groups/{group_id}").mock(
+            return_value=httpx.Response(200, json={"id": group_id})
+        )
+
+    with sigfox_client as client:
+        groups = client.groups.get_many(["grp003", "grp001", "grp002"], max_workers=2)
+
+    assert [g.id for g in groups] == ["grp003", "grp001", "grp002"]
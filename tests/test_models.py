@@ -0,0 +1,40 @@
+"""Tests for the lazily loaded models package."""
+
+import pytest
+
+import sigfox.models as models
+
+
+def test_all_exports_resolve():
+    """Test every name in __all__ resolves to a model class."""
+    for name in models.__all__:
+        assert isinstance(getattr(models, name), type)
+
+
+def test_renamed_export():
+    """Test aliased exports resolve to the right submodule class."""
+    from sigfox.models.device_type import DeviceType
+
+    assert models.DeviceTypeModel is DeviceType
+
+
+def test_unknown_attribute():
+    """Test unknown names raise AttributeError."""
+    with pytest.raises(AttributeError):
+        models.NotAModel
+
+
+def test_min_group_shared():
+    """Test the per-resource MinGroup exports are one shared model."""
+    assert models.UserMinGroup is models.MinGroup
+    assert models.ApiUserMinGroup is models.MinGroup
+    assert models.OperatorMinGroup is models.ProfileMinGroup is models.MinGroup
+
+
+def test_sdk_exports_resolve():
+    """Test the lazily imported top-level sigfox exports resolve."""
+    import sigfox
+    from sigfox.client import SigfoxClient
+
+    assert sigfox.SigfoxClient is SigfoxClient
+    assert set(sigfox.__all__) <= set(dir(sigfox))
@@ -0,0 +1,63 @@
+"""Tests for query parameter building."""
+
+from sigfox.api._params import _join_csv, build_params, dump_body, flag, join_csv
+from sigfox.models import GroupUpdate
+
+
+SPEC = (
+    ("limit", "limit", None),
+    ("name", "name", None),
+    ("group_ids", "groupIds", join_csv),
+    ("types", "types", join_csv),
+    ("deep", "deep", flag),
+)
+
+
+def test_build_params_maps_and_transforms():
+    """Test set arguments are renamed and transformed."""
+    params = build_params(
+        {"limit": 0, "name": "n", "group_ids": ["a", "b"], "types": [2, 5], "deep": True},
+        SPEC,
+    )
+    assert params == {
+        "limit": 0,
+        "name": "n",
+        "groupIds": "a,b",
+        "types": "2,5",
+        "deep": "true",
+    }
+
+
+def test_build_params_omits_unset():
+    """Test None, False, and empty values are omitted."""
+    params = build_params(
+        {"limit": None, "name": "", "group_ids": [], "types": (), "deep": False},
+        SPEC,
+    )
+    assert params == {}
+
+
+def test_build_params_accepts_tuples():
+    """Test tuple filter values are joined like lists."""
+    params = build_params({"group_ids": ("a", "b")}, SPEC)
+    assert params == {"groupIds": "a,b"}
+
+
+def test_join_csv_drops_duplicates():
+    """Test repeated filter values are sent once, in first-seen order."""
+    assert join_csv(["b", "a", "b", "a"]) == "b,a"
+    assert join_csv([2, 5, 2]) == "2,5"
+
+
+def test_join_csv_is_memoized():
+    """Test repeated joins of the same filter set hit the cache."""
+    _join_csv.cache_clear()
+    assert join_csv(["a", "b"]) == "a,b"
+    assert join_csv(["a", "b"]) == "a,b"
+    assert _join_csv.cache_info().hits == 1
+
+
+def test_dump_body_uses_aliases_and_skips_none():
+    """Test request bodies are aliased JSON bytes without unset fields."""
+    body = dump_body(GroupUpdate(name="G", timezone=None, technical_email="ops@example.com"))
+    assert body == b'{"name":"G","technicalEmail":"ops@example.com"}'
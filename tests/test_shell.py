@@ -0,0 +1,65 @@
+"""Tests for the interactive shell and shared client session."""
+
+import httpx
+import pytest
+import respx
+from click.testing import CliRunner
+
+from sigfox_cli.app import cli
+from sigfox_cli.session import SharedSigfox, get_sigfox, session
+
+
+@pytest.fixture(autouse=True)
+def mock_config(monkeypatch):
+    """Mock configuration to avoid reading real config files."""
+    monkeypatch.setenv("SIGFOX_API_LOGIN", "test_login")
+    monkeypatch.setenv("SIGFOX_API_PASSWORD", "test_password")
+
+
+def test_session_shares_client():
+    """Test clients are shared inside a session and closed when it ends."""
+    args = ("login", "password", "https://api.sigfox.com/v2", 30)
+    first, second = get_sigfox(*args), get_sigfox(*args)
+    assert first is not second
+    first.close()
+    second.close()
+
+    with session():
+        client = get_sigfox(*args)
+        with client:
+            pass
+        assert isinstance(client, SharedSigfox)
+        assert get_sigfox(*args) is client
+        assert not client._client._client.is_closed
+    assert client._client._client.is_closed
+
+
+def test_session_clients_revalidate_etags():
+    """Test ETag revalidation is on for session clients only by default."""
+    args = ("login", "password", "https://api.sigfox.com/v2", 30)
+    with get_sigfox(*args) as client:
+        assert client._client._etags is None
+    with session():
+        assert get_sigfox(*args)._client._etags is not None
+
+
+@respx.mock
+def test_shell_runs_commands():
+    """Test the shell runs each input line as a command until exit."""
+    route = respx.get("https://api.sigfox.com/v2/device-types/dt001").mock(
+        return_value=httpx.Response(200, json={"id": "dt001", "name": "Type A"})
+    )
+    respx.get("https://api.sigfox.com/v2/device-types/missing").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    result = CliRunner().invoke(
+        cli,
+        ["shell"],
+        input="device-types get dt001 -o json\n\ndevice-types get missing\nbogus\nexit\n",
+    )
+    assert result.exit_code == 0
+    assert route.call_count == 1
+    assert '"dt001"' in result.output
+    assert "Not Found" in result.output
+    assert "No such command 'bogus'" in result.output
@@ -5,6 +5,7 @@ import pytest
 import respx
 
 from sigfox import Sigfox
+from sigfox.exceptions import NotFoundError
 from sigfox.models import UserCreate, UserUpdate
 
 
@@ -65,6 +66,20 @@ def test_users_get(sigfox_client):
         assert user.timezone == "Europe/Paris"
 
 
+@respx.mock
+def test_users_get_not_found_remembered(sigfox_client):
+    """Test a repeated UsersAPI.get() of a missing user makes one round-trip."""
+    route = respx.get("https://api.sigfox.com/v2/users/usr404").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+
+    with sigfox_client as client:
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                client.users.get("usr404")
+    assert route.call_count == 1
+
+
 @respx.mock
 def test_users_create(sigfox_client):
     """Test UsersAPI.create() returns id dict."""